@@ -0,0 +1,349 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import io
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from jsdompl.cache import CompileCache, MemoryCache
+from jsdompl.cli import compile_files
+from jsdompl.htmllexer import Lexer
+from jsdompl.jslexer import Lexer as JSLexer
+from jsdompl.parser import Parser
+from jsdompl.server import Client, CompileServer
+from jsdompl.template import minify_savings
+from jsdompl.visitors.nodevisitor import WalkingVisitor, preorder
+from jsdompl.visitors.scopevisitor import free_names, mangle
+from jsdompl.visitors.jsdomplvisitor import JSDomplVisitor
+
+def timed(fn, repeat = 3):
+	best = None
+	for _ in range(repeat):
+		start = time.time()
+		fn()
+		elapsed = time.time() - start
+		if best is None or elapsed < best:
+			best = elapsed
+	return best
+
+def lex_all(lexer, source):
+	lexer.input(source)
+	for _ in lexer:
+		pass
+
+def bench_islands():
+	""" Per-island lexing cost, for a growing number of islands and a growing
+	island length. The cost of building a JS lexer is shown for comparison,
+	it used to be paid once per island.
+	"""
+	p = Parser()
+	lexer = p.lexer
+
+	build = timed(lambda: JSLexer(**lexer.js_lexer_options), repeat = 5)
+	print("JS lexer construction: {:.1f}us".format(build * 1e6))
+	print("{:>8} {:>8} {:>12} {:>14}".format('islands', 'length', 'total (ms)', 'island (us)'))
+
+	for length in (1, 10, 100):
+		expr = ' + '.join(['a'] * length)
+		for count in (10, 100, 1000):
+			source = '<p>{}</p>'.format(' '.join(['{{ ' + expr + ' }}'] * count))
+			t = timed(lambda: lex_all(lexer, source))
+			print("{:>8} {:>8} {:>12.2f} {:>14.1f}".format(count, length, t * 1e3, t / count * 1e6))
+
+ROW = """\
+	{% _.each(rows, function(idx, row) { %}
+	<tr class="row-{{ idx }}">
+		<td class="name"><a href="{{ url('row', row.id) }}">{{ row.name }}</a></td>
+		<td class="value">{{{ row.html }}}</td>
+		<td><img src="/static/icon.png" alt=""> Static text &amp; more static text</td>
+	</tr>
+	{% }); %}
+"""
+
+STATIC_PAGE = """\
+	<div class="header"><h1 class="title">Title</h1><ul class="nav">
+		<li><a href="/">Home</a></li><li><a href="/about">About</a></li>
+	</ul></div>
+"""
+
+CARD = """\
+	<div class="card"><h2 class="title">{{ title }}</h2><ul class="meta">
+		<li>Author: <a href="{{ author_url }}">{{ author }}</a></li><li>Static entry</li><li>Another static entry</li>
+	</ul><p class="footer">Static footer text <a href="/more">more</a></p></div>
+"""
+
+def make_template(size):
+	""" Returns a template of roughly `size` bytes
+	"""
+	rows = [ROW] * (size // len(ROW) + 1)
+	return '<!-- Template(\'rows\', \'url\') -->\n<table>\n{}</table>\n'.format(''.join(rows))
+
+def bench_lexer():
+	""" Single pass tokenizer against the html5lib based one on a 200KB
+	template
+	"""
+	source = make_template(200 * 1024)
+	results = {}
+	for use_html5lib in (False, True):
+		lexer = Lexer(use_html5lib = use_html5lib)
+		lexer.build()
+		results[use_html5lib] = timed(lambda: lex_all(lexer, source))
+		print("{:>8}: {:.1f}ms".format('html5lib' if use_html5lib else 'native', results[use_html5lib] * 1e3))
+	print("speedup: {:.1f}x".format(results[True] / results[False]))
+
+def make_nested_template(depth):
+	""" Returns a template with `depth` levels of tags and JS blocks nested in
+	each other
+	"""
+	head = '<div>{% if (a) { %}<p>{{ a }}</p>' * depth
+	tail = '{% } %}</div>' * depth
+	return head + tail
+
+def bench_nesting():
+	""" Code generation time against nesting depth, per KB of generated code
+	the time should stay flat
+	"""
+	p = Parser()
+	print("{:>8} {:>12} {:>12} {:>12}".format('depth', 'output (KB)', 'total (ms)', 'ms / KB'))
+	for depth in (10, 50, 100, 200, 400, 1000):
+		tree = p.parse(make_nested_template(depth))
+		size = len(JSDomplVisitor(js_parser = p).render(tree)) / 1024
+		t = timed(lambda: JSDomplVisitor(js_parser = p).render(tree))
+		print("{:>8} {:>12.1f} {:>12.2f} {:>12.3f}".format(depth, size, t * 1e3, t * 1e3 / size))
+
+DOM_CALL_RX = re.compile(r'\bC\(|\bT\(|\.appendChild\(|\.replaceChild\(|\.setAttribute\(|\.cloneNode\(|\.childNodes\[')
+
+def bench_statics():
+	""" DOM calls made by one pass over the template function, without
+	hoisting of static subtrees and with each build strategy
+	"""
+	p = Parser()
+	source = '<div class="page">{}</div>'.format(STATIC_PAGE * 10 + CARD * 10 + ROW)
+	for hoist_statics, strategy in ((False, 'dom'), (True, 'dom'), (True, 'auto'), (True, 'template')):
+		visitor = JSDomplVisitor(js_parser = p, hoist_statics = hoist_statics, strategy = strategy)
+		visitor.visit(p.parse(source))
+		calls = len(DOM_CALL_RX.findall(visitor.out.getvalue()))
+		print("{:>12} {:>8}: {} DOM calls".format('hoisted' if hoist_statics else 'not hoisted', strategy, calls))
+
+def bench_minify():
+	""" Size of the generated module with and without minify, for growing
+	templates
+	"""
+	p = Parser()
+	print("{:>8} {:>8} {:>12} {:>12} {:>8}".format('rows', 'update', 'size (KB)', 'minified', 'saved'))
+	for count in (1, 10, 100):
+		source = make_template(len(ROW) * (count - 1))
+		for update in (False, True):
+			size, minified = minify_savings(source, js_parser = p, update = update)
+			print("{:>8} {:>8} {:>12.1f} {:>12.1f} {:>7.0%}".format(
+				count, 'yes' if update else 'no', size / 1024, minified / 1024, 1 - minified / size))
+
+def make_callbacks_template(depth, refs):
+	""" Returns a {% %} block with `depth` callbacks nested in each other and
+	`refs` references to outer names in the innermost one
+	"""
+	head = ''.join('f(function(a{0}) {{ var v{0} = a{0} + x;'.format(i) for i in range(depth))
+	return '{% ' + head + ' g(a0, v0, x);' * refs + ' });' * depth + ' %}'
+
+def bench_scopes():
+	""" Scope analysis time against the depth of nested callbacks, per
+	reference the time should stay flat
+	"""
+	p = Parser()
+	print("{:>8} {:>16} {:>16}".format('depth', 'free (us/ref)', 'mangle (us/ref)'))
+	for depth in (10, 50, 100, 200):
+		refs = 4 * depth
+		source = make_callbacks_template(depth, refs)
+		results = []
+		for fn in (free_names, mangle):
+			# mangle() renames the tree, so each run gets a fresh one
+			trees = [p.parse(source) for _ in range(3)]
+			results.append(timed(lambda: fn(trees.pop())))
+		print("{:>8} {:>16.2f} {:>16.2f}".format(depth, results[0] / refs * 1e6, results[1] / refs * 1e6))
+
+def node_size(node):
+	""" Returns the bytes `node` takes, not counting the lists and strings it
+	holds
+	"""
+	size = sys.getsizeof(node)
+	if hasattr(node, '__dict__'):
+		size += sys.getsizeof(node.__dict__)
+	return size
+
+_unslotted = {}
+
+def unslotted(node):
+	""" Returns a copy of `node` keeping its attributes in a __dict__, as the
+	nodes did before they declared __slots__
+	"""
+	cls = type(node)
+	if cls not in _unslotted:
+		_unslotted[cls] = type(str(cls.__name__), (object,), {})
+	copy = _unslotted[cls]()
+	for base in reversed(cls.__mro__):
+		for name in base.__dict__.get('__slots__', ()):
+			if hasattr(node, name):
+				setattr(copy, name, getattr(node, name))
+	return copy
+
+def tree_size(tree, copy = None):
+	""" Returns the number of nodes of `tree` and the bytes they take, or
+	their copies made by `copy` take
+	"""
+	count = size = 0
+	for node in preorder(tree):
+		count += 1
+		size += node_size(node if copy is None else copy(node))
+	return count, size
+
+def bench_memory():
+	""" Memory taken by the AST nodes of large templates, with __slots__ and
+	with the attributes in a __dict__ as before
+	"""
+	p = Parser()
+	sources = [
+		('rows', make_template(1024 * 1024)),
+		('cards', STATIC_PAGE * 500 + CARD * 2000),
+		('callbacks', make_callbacks_template(100, 5000)),
+	]
+	print("{:>10} {:>10} {:>12} {:>12} {:>12} {:>12}".format(
+		'template', 'nodes', 'dict (KB)', 'slots (KB)', 'dict B/node', 'slots B/node'))
+	for name, source in sources:
+		tree = p.parse(source)
+		# the flags and scopes the later passes add count too
+		free_names(tree)
+		count, size = tree_size(tree)
+		_, dict_size = tree_size(tree, unslotted)
+		print("{:>10} {:>10} {:>12.1f} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+			name, count, dict_size / 1024, size / 1024, dict_size / count, size / count))
+
+def bench_visit():
+	""" Per node cost of a walk that does nothing but dispatch, of scope
+	analysis and of code generation, on a 200KB template
+	"""
+	p = Parser()
+	tree = p.parse(make_template(200 * 1024))
+	count = sum(1 for _ in preorder(tree))
+	for name, fn in (
+		('walk', lambda: WalkingVisitor().visit(tree)),
+		('scopes', lambda: free_names(tree)),
+		('codegen', lambda: JSDomplVisitor(js_parser = p).render(tree)),
+	):
+		print("{:>8}: {:.2f}us / node".format(name, timed(fn, repeat = 5) / count * 1e6))
+
+def bench_deep():
+	""" Compile time of templates that used to run into the recursion
+	limit: many {% %} blocks in a row, and a long chain of + in an island
+	"""
+	p = Parser()
+	for name, source in (
+		('blocks', '<div>{}</div>'.format('{% if (a) { %}<p>{{ a }}</p>{% } %}' * 3000)),
+		('concat', '<p>{{{{ {} }}}}</p>'.format(' + '.join(['a'] * 5000))),
+	):
+		tree = p.parse(source)
+		t = timed(lambda: JSDomplVisitor(js_parser = p).render(tree))
+		print("{:>8}: {:.1f}ms".format(name, t * 1e3))
+
+def bench_batch():
+	""" Time to compile a directory of 200 templates to modules, in this
+	process and with a pool of worker processes, then from a cold and a warm
+	cache
+	"""
+	directory = tempfile.mkdtemp()
+	try:
+		jobs = []
+		for i in range(200):
+			source = os.path.join(directory, 'tpl{}.html'.format(i))
+			with io.open(source, 'w', encoding = 'utf-8') as f:
+				# every template is different, so a cold cache misses on all of them
+				f.write('<p>{}</p>'.format(i) + (make_template(4 * 1024) if i % 2 else STATIC_PAGE + CARD * 5))
+			jobs.append((source, source[:-len('.html')] + '.js'))
+		print("{:>10} {:>8} {:>12} {:>14}".format('processes', 'cache', 'total (ms)', 'template (ms)'))
+		cache = CompileCache(os.path.join(directory, 'cache'))
+		for processes in sorted(set((1, multiprocessing.cpu_count()))):
+			for name, kwargs in (('none', {}), ('cold', {'cache' : cache}), ('warm', {'cache' : cache})):
+				t = timed(lambda: list(compile_files(jobs, processes, **kwargs)), repeat = 1)
+				print("{:>10} {:>8} {:>12.1f} {:>14.2f}".format(processes, name, t * 1e3, t / len(jobs) * 1e3))
+			shutil.rmtree(cache.directory)
+	finally:
+		shutil.rmtree(directory)
+
+def bench_requests():
+	""" Per request compile latency of 8 threads asking for 20 templates
+	through a MemoryCache, while it warms up and once it is warm
+	"""
+	sources = ['<p>{}</p>'.format(i) + STATIC_PAGE + CARD * 5 for i in range(20)]
+	cache = MemoryCache()
+
+	def serve(latencies):
+		for source in sources * 5:
+			start = time.time()
+			cache.compile(source)
+			latencies.append(time.time() - start)
+
+	for name in ('cold', 'warm'):
+		latencies = []
+		threads = [threading.Thread(target = serve, args = (latencies,)) for _ in range(8)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		latencies.sort()
+		print("{:>6}: mean {:.2f}ms, max {:.2f}ms".format(
+			name, sum(latencies) / len(latencies) * 1e3, latencies[-1] * 1e3))
+	print(cache.stats)
+
+def bench_serve():
+	""" Round trip time of compile requests to a CompileServer, for a
+	template it has to compile and one it has cached
+	"""
+	path = os.path.join(tempfile.mkdtemp(), 'jsdompl.sock')
+	server = CompileServer(path)
+	thread = threading.Thread(target = server.serve_forever)
+	thread.start()
+	try:
+		client = Client(path)
+		sources = ['<p>{}</p>'.format(i) + STATIC_PAGE + CARD * 5 for i in range(50)]
+		for name in ('compiled', 'cached'):
+			start = time.time()
+			for source in sources:
+				client.compile(source)
+			print("{:>9}: {:.2f}ms / request".format(name, (time.time() - start) / len(sources) * 1e3))
+		client.close()
+	finally:
+		server.shutdown()
+		server.server_close()
+		thread.join()
+		os.rmdir(os.path.dirname(path))
+
+BENCHMARKS = {
+	'batch' : bench_batch,
+	'deep' : bench_deep,
+	'islands' : bench_islands,
+	'lexer' : bench_lexer,
+	'memory' : bench_memory,
+	'minify' : bench_minify,
+	'nesting' : bench_nesting,
+	'requests' : bench_requests,
+	'scopes' : bench_scopes,
+	'serve' : bench_serve,
+	'statics' : bench_statics,
+	'visit' : bench_visit,
+}
+
+def main(argv):
+	names = argv or sorted(BENCHMARKS)
+	for name in names:
+		print("== {} ==".format(name))
+		BENCHMARKS[name]()
+
+if __name__ == '__main__':
+	main(sys.argv[1:])
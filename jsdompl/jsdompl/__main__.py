@@ -0,0 +1,10 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -26,7 +26,43 @@ from chardet.constants import False
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
 
+# Bits of Node._flags
+PARENS = 1 << 0
+IS_STMT = 1 << 1
+SAFE = 1 << 2
+IN_EXPRESSION = 1 << 3
+MANGLE_CANDIDATE = 1 << 4
+
+def flag(bit, doc):
+	"""A boolean property stored as `bit` of Node._flags."""
+	def get(self):
+		return bool(self._flags & bit)
+
+	def set(self, value):
+		if value:
+			self._flags |= bit
+		else:
+			self._flags &= ~bit
+
+	return property(get, set, doc = doc)
+
+
 class Node(object):
+	# Nodes declare their attributes as slots, a large template makes tens
+	# of thousands of them. Every subclass has to declare __slots__ too.
+	__slots__ = ('_flags', '_children_list')
+
+	def __new__(cls, *args, **kwargs):
+		node = super(Node, cls).__new__(cls)
+		node._flags = 0
+		return node
+
+	_parens = flag(PARENS, "The expression is in parentheses")
+	is_stmt = flag(IS_STMT, "The node is a statement of the template")
+	safe = flag(SAFE, "An identifier of the generated code, emitted as is")
+	_in_expression = flag(IN_EXPRESSION, "The identifier is part of an expression")
+	_mangle_candidate = flag(MANGLE_CANDIDATE, "The identifier can be renamed when mangling")
+
 	def __init__(self, children = None):
 		self._children_list = [] if children is None else children
 
@@ -46,12 +82,14 @@ class Node(object):
 		return visitor.visit(self)
 
 class Program(Node):
-	pass
+	__slots__ = ()
 
 class Block(Node):
-	pass
+	__slots__ = ()
 
 class Boolean(Node):
+	__slots__ = ('value',)
+
 	def __init__(self, value):
 		self.value = value
 
@@ -59,6 +97,8 @@ class Boolean(Node):
 		return []
 
 class Null(Node):
+	__slots__ = ('value',)
+
 	def __init__(self, value):
 		self.value = value
 
@@ -66,6 +106,8 @@ class Null(Node):
 		return []
 
 class Number(Node):
+	__slots__ = ('value',)
+
 	def __init__(self, value):
 		self.value = value
 
@@ -73,6 +115,8 @@ class Number(Node):
 		return []
 
 class Identifier(Node):
+	__slots__ = ('value', 'scope')
+
 	def __init__(self, value):
 		self.value = value
 
@@ -80,6 +124,8 @@ class Identifier(Node):
 		return []
 
 class String(Node):
+	__slots__ = ('value',)
+
 	def __init__(self, value):
 		self.value = value
 
@@ -87,6 +133,8 @@ class String(Node):
 		return []
 
 class Regex(Node):
+	__slots__ = ('value',)
+
 	def __init__(self, value):
 		self.value = value
 
@@ -94,6 +142,8 @@ class Regex(Node):
 		return []
 
 class Array(Node):
+	__slots__ = ('items',)
+
 	def __init__(self, items):
 		self.items = items
 
@@ -101,6 +151,8 @@ class Array(Node):
 		return self.items
 
 class Object(Node):
+	__slots__ = ('properties',)
+
 	def __init__(self, properties = None):
 		self.properties = [] if properties is None else properties
 
@@ -108,6 +160,8 @@ class Object(Node):
 		return self.properties
 
 class NewExpr(Node):
+	__slots__ = ('identifier', 'args')
+
 	def __init__(self, identifier, args = None):
 		self.identifier = identifier
 		self.args = [] if args is None else args
@@ -116,6 +170,8 @@ class NewExpr(Node):
 		return [self.identifier, self.args]
 
 class FunctionCall(Node):
+	__slots__ = ('identifier', 'args')
+
 	def __init__(self, identifier, args = None):
 		self.identifier = identifier
 		self.args = [] if args is None else args
@@ -124,6 +180,8 @@ class FunctionCall(Node):
 		return [self.identifier] + self.args
 
 class BracketAccessor(Node):
+	__slots__ = ('node', 'expr')
+
 	def __init__(self, node, expr):
 		self.node = node
 		self.expr = expr
@@ -132,6 +190,8 @@ class BracketAccessor(Node):
 		return [self.node, self.expr]
 
 class DotAccessor(Node):
+	__slots__ = ('node', 'identifier')
+
 	def __init__(self, node, identifier):
 		self.node = node
 		self.identifier = identifier
@@ -140,6 +200,8 @@ class DotAccessor(Node):
 		return [self.node, self.identifier]
 
 class Assign(Node):
+	__slots__ = ('op', 'left', 'right')
+
 	def __init__(self, op, left, right):
 		self.op = op
 		self.left = left
@@ -149,6 +211,8 @@ class Assign(Node):
 		return [self.left, self.right]
 
 class GetPropAssign(Node):
+	__slots__ = ('prop_name', 'elements')
+
 	def __init__(self, prop_name, elements):
 		"""elements - function body"""
 		self.prop_name = prop_name
@@ -158,6 +222,8 @@ class GetPropAssign(Node):
 		return [self.prop_name] + self.elements
 
 class SetPropAssign(Node):
+	__slots__ = ('prop_name', 'parameters', 'elements')
+
 	def __init__(self, prop_name, parameters, elements):
 		"""elements - function body"""
 		self.prop_name = prop_name
@@ -168,9 +234,11 @@ class SetPropAssign(Node):
 		return [self.prop_name] + self.parameters + self.elements
 
 class VarStatement(Node):
-	pass
+	__slots__ = ()
 
 class VarDecl(Node):
+	__slots__ = ('identifier', 'initializer')
+
 	def __init__(self, identifier, initializer = None):
 		self.identifier = identifier
 		self.identifier._mangle_candidate = True
@@ -180,6 +248,8 @@ class VarDecl(Node):
 		return [self.identifier, self.initializer]
 
 class UnaryOp(Node):
+	__slots__ = ('op', 'value', 'postfix')
+
 	def __init__(self, op, value, postfix = False):
 		self.op = op
 		self.value = value
@@ -189,6 +259,8 @@ class UnaryOp(Node):
 		return [self.value]
 
 class BinOp(Node):
+	__slots__ = ('op', 'left', 'right')
+
 	def __init__(self, op, left, right):
 		self.op = op
 		self.left = left
@@ -199,6 +271,8 @@ class BinOp(Node):
 
 class Conditional(Node):
 	"""Conditional Operator ( ? : )"""
+	__slots__ = ('predicate', 'consequent', 'alternative')
+
 	def __init__(self, predicate, consequent, alternative):
 		self.predicate = predicate
 		self.consequent = consequent
@@ -208,6 +282,8 @@ class Conditional(Node):
 		return [self.predicate, self.consequent, self.alternative]
 
 class If(Node):
+	__slots__ = ('predicate', 'consequent', 'alternative')
+
 	def __init__(self, predicate, consequent, alternative = None):
 		self.predicate = predicate
 		self.consequent = consequent
@@ -217,6 +293,8 @@ class If(Node):
 		return [self.predicate, self.consequent, self.alternative]
 
 class DoWhile(Node):
+	__slots__ = ('predicate', 'statement')
+
 	def __init__(self, predicate, statement):
 		self.predicate = predicate
 		self.statement = statement
@@ -225,6 +303,8 @@ class DoWhile(Node):
 		return [self.predicate, self.statement]
 
 class While(Node):
+	__slots__ = ('predicate', 'statement')
+
 	def __init__(self, predicate, statement):
 		self.predicate = predicate
 		self.statement = statement
@@ -233,6 +313,8 @@ class While(Node):
 		return [self.predicate, self.statement]
 
 class For(Node):
+	__slots__ = ('init', 'cond', 'count', 'statement')
+
 	def __init__(self, init, cond, count, statement):
 		self.init = init
 		self.cond = cond
@@ -243,6 +325,8 @@ class For(Node):
 		return [self.init, self.cond, self.count, self.statement]
 
 class ForIn(Node):
+	__slots__ = ('item', 'iterable', 'statement')
+
 	def __init__(self, item, iterable, statement):
 		self.item = item
 		self.iterable = iterable
@@ -252,6 +336,8 @@ class ForIn(Node):
 		return [self.item, self.iterable, self.statement]
 
 class Continue(Node):
+	__slots__ = ('identifier',)
+
 	def __init__(self, identifier = None):
 		self.identifier = identifier
 
@@ -259,6 +345,8 @@ class Continue(Node):
 		return [self.identifier]
 
 class Break(Node):
+	__slots__ = ('identifier',)
+
 	def __init__(self, identifier = None):
 		self.identifier = identifier
 
@@ -266,6 +354,8 @@ class Break(Node):
 		return [self.identifier]
 
 class Return(Node):
+	__slots__ = ('expr',)
+
 	def __init__(self, expr = None):
 		self.expr = expr
 
@@ -273,6 +363,8 @@ class Return(Node):
 		return [self.expr]
 
 class With(Node):
+	__slots__ = ('expr', 'statement')
+
 	def __init__(self, expr, statement):
 		self.expr = expr
 		self.statement = statement
@@ -281,6 +373,8 @@ class With(Node):
 		return [self.expr, self.statement]
 
 class Switch(Node):
+	__slots__ = ('expr', 'cases', 'default')
+
 	def __init__(self, expr, cases, default = None):
 		self.expr = expr
 		self.cases = cases
@@ -290,6 +384,8 @@ class Switch(Node):
 		return [self.expr] + self.cases + [self.default]
 
 class Case(Node):
+	__slots__ = ('expr', 'elements')
+
 	def __init__(self, expr, elements):
 		self.expr = expr
 		self.elements = elements if elements is not None else []
@@ -298,6 +394,8 @@ class Case(Node):
 		return [self.expr] + self.elements
 
 class Default(Node):
+	__slots__ = ('elements',)
+
 	def __init__(self, elements):
 		self.elements = elements if elements is not None else []
 
@@ -305,6 +403,8 @@ class Default(Node):
 		return self.elements
 
 class Label(Node):
+	__slots__ = ('identifier', 'statement')
+
 	def __init__(self, identifier, statement):
 		self.identifier = identifier
 		self.statement = statement
@@ -313,6 +413,8 @@ class Label(Node):
 		return [self.identifier, self.statement]
 
 class Throw(Node):
+	__slots__ = ('expr',)
+
 	def __init__(self, expr):
 		self.expr = expr
 
@@ -320,6 +422,8 @@ class Throw(Node):
 		return [self.expr]
 
 class Try(Node):
+	__slots__ = ('statements', 'catch', 'fin')
+
 	def __init__(self, statements, catch = None, fin = None):
 		self.statements = statements
 		self.catch = catch
@@ -329,6 +433,8 @@ class Try(Node):
 		return [self.statements] + [self.catch, self.fin]
 
 class Catch(Node):
+	__slots__ = ('identifier', 'elements')
+
 	def __init__(self, identifier, elements):
 		self.identifier = identifier
 		# CATCH identifiers are subject to name mangling. we need to mark them.
@@ -339,13 +445,17 @@ class Catch(Node):
 		return [self.identifier, self.elements]
 
 class Finally(Node):
+	__slots__ = ('elements',)
+
 	def __init__(self, elements):
 		self.elements = elements
 
 	def children(self):
-		return self.elements
+		return [self.elements]
 
 class Debugger(Node):
+	__slots__ = ('value',)
+
 	def __init__(self, value):
 		self.value = value
 
@@ -354,6 +464,8 @@ class Debugger(Node):
 
 
 class FuncBase(Node):
+	__slots__ = ('identifier', 'parameters', 'elements', 'scope')
+
 	def __init__(self, identifier, parameters, elements):
 		self.identifier = identifier
 		self.parameters = parameters if parameters is not None else []
@@ -372,14 +484,16 @@ class FuncBase(Node):
 		return [self.identifier] + self.parameters + self.elements
 
 class FuncDecl(FuncBase):
-	pass
+	__slots__ = ()
 
 # The only difference is that function expression might not have an identifier
 class FuncExpr(FuncBase):
-	pass
+	__slots__ = ()
 
 
 class Comma(Node):
+	__slots__ = ('left', 'right')
+
 	def __init__(self, left, right):
 		self.left = left
 		self.right = right
@@ -388,6 +502,8 @@ class Comma(Node):
 		return [self.left, self.right]
 
 class EmptyStatement(Node):
+	__slots__ = ('value',)
+
 	def __init__(self, value):
 		self.value = value
 
@@ -395,6 +511,8 @@ class EmptyStatement(Node):
 		return []
 
 class ExprStatement(Node):
+	__slots__ = ('expr',)
+
 	def __init__(self, expr):
 		self.expr = expr
 
@@ -402,6 +520,8 @@ class ExprStatement(Node):
 		return [self.expr]
 
 class Elision(Node):
+	__slots__ = ('value',)
+
 	def __init__(self, value):
 		self.value = value
 
@@ -409,6 +529,8 @@ class Elision(Node):
 		return []
 
 class This(Node):
+	__slots__ = ()
+
 	def __init__(self):
 		pass
 
@@ -416,17 +538,68 @@ class This(Node):
 		return []
 
 class HTMLTag(Node):
+	__slots__ = ('name', 'self_closing', 'attrs', 'inner', 'void', '_static')
+	
 	def __init__(self, name, attrs = [], self_closing = False, inner = None, void = False):
 		self.name = name
 		self.self_closing = self_closing
 		self.attrs = list(attrs)
 		self.inner = inner
 		self.void = void
+		self._static = None
+	
+	def is_static(self):
+		""" True when neither the tag nor anything inside it depends on
+		template data, ie the whole subtree can be built once and cloned
+		"""
+		if self._static is None:
+			# the tags below are settled first, deepest first, so this
+			# doesn't recurse however deep the tree is
+			tags, stack = [], [self]
+			while stack:
+				tag = stack.pop()
+				tags.append(tag)
+				stack.extend(
+					child for child in tag.inner or []
+					if isinstance(child, HTMLTag) and child._static is None
+				)
+			for tag in reversed(tags):
+				tag._static = (
+					all(attr.is_static() for attr in tag.attrs) and
+					all(
+						isinstance(child, (HTMLTag, HTMLDataList)) and child.is_static()
+						for child in (tag.inner or [])
+					)
+				)
+		return self._static
+	
+	def children(self):
+		# in document order, the attributes come first
+		return self.attrs + [self.inner]
+
+class HTMLAttr(Node):
+	""" An attribute of an HTMLTag, its value is a list of HTMLData and
+	expression nodes to be concatenated.
+	"""
+	__slots__ = ('name', 'parts')
+	
+	def __init__(self, name, parts = None):
+		self.name = name
+		self.parts = [] if parts is None else parts
+	
+	def is_static(self):
+		return all(isinstance(part, HTMLData) for part in self.parts)
 	
 	def children(self):
-		return [self.name, self.inner] + self.attrs 
+		return self.parts
+	
+	def __str__(self):
+		return 'HTMLAttr({}, {})'.format(self.name, self.parts)
+	__repr__ = __str__
 
 class HTMLData(Node):
+	__slots__ = ('data',)
+	
 	def __init__(self, data):
 		self.data = data.replace('\n', '\\n').replace('\"', '\\"')
 	
@@ -437,15 +610,21 @@ class HTMLData(Node):
 		return 'HTMLData({})'.format(self.data)
 	__repr__ = __str__
 
-class HTMLJSContainer(Node): pass
+class HTMLJSContainer(Node):
+	__slots__ = ()
 
 class HTMLDataList(Node):
+	__slots__ = ('data_list',)
+	
 	def __init__(self, data_list = []):
 		self.data_list = list(data_list)
 	
 	def __len__(self):
 		return len(self.data_list)
 	
+	def is_static(self):
+		return all(isinstance(data, (HTMLData, HTMLComment)) for data in self.data_list)
+	
 	def append(self, data):
 		if isinstance(data, HTMLDataList):
 			self.data_list += data.data_list
@@ -462,6 +641,8 @@ class HTMLDataList(Node):
 		return self.data_list
 
 class HTMLComment(Node):
+	__slots__ = ('data',)
+	
 	def __init__(self, data):
 		self.data = data
 	
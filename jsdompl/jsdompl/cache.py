@@ -0,0 +1,402 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import errno
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+try:
+	import cPickle as pickle
+except ImportError:
+	import pickle
+
+from .parser import Parser, grammar_hash
+from .pool import get_pool
+from .template import compile_to
+
+try:
+	from io import StringIO
+except ImportError:
+	from StringIO import StringIO
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_replace = getattr(os, 'replace', os.rename)
+
+# The options of compile_to() that are part of the key of a module, with
+# their defaults
+COMPILE_OPTIONS = {
+	'strategy' : 'auto',
+	'update' : False,
+	'minify' : False,
+}
+
+_compiler_hash = None
+
+def compiler_hash():
+	""" Returns a hex digest of the sources of the compiler, so that cached
+	modules are dropped by any change to the code that generates them. The
+	generated lexer and parser tables are left out, grammar_hash() stands for
+	them.
+	"""
+	global _compiler_hash
+	if _compiler_hash is not None:
+		return _compiler_hash
+
+	sig = hashlib.sha1()
+	for root, dirs, files in os.walk(PACKAGE_DIR):
+		dirs.sort()
+		for filename in sorted(files):
+			if not filename.endswith('.py') or filename.startswith(('lextab_', 'yacctab_')):
+				continue
+			path = os.path.join(root, filename)
+			sig.update(os.path.relpath(path, PACKAGE_DIR).encode('utf-8'))
+			with open(path, 'rb') as f:
+				sig.update(f.read())
+
+	_compiler_hash = sig.hexdigest()[:16]
+	return _compiler_hash
+
+def _digest(source, extra):
+	sig = hashlib.sha1()
+	for part in (compiler_hash(), grammar_hash(), extra):
+		sig.update(part.encode('utf-8'))
+		sig.update(b'\0')
+	sig.update(source.encode('utf-8'))
+	return sig.hexdigest()
+
+def module_key(source, **options):
+	""" Returns the key of the module compiled from `source` with `options`
+	"""
+	key_options = dict(COMPILE_OPTIONS)
+	key_options.update(options)
+	return _digest(source, json.dumps(key_options, sort_keys = True))
+
+class CacheStats(object):
+	""" Lookup counters of a CompileCache or MemoryCache. `waits` counts the
+	lookups that waited for another thread compiling the same module.
+	"""
+	def __init__(self):
+		self.hits = 0
+		self.tree_hits = 0
+		self.misses = 0
+		self.waits = 0
+		self.evictions = 0
+
+	def as_dict(self):
+		return {
+			'hits' : self.hits,
+			'tree_hits' : self.tree_hits,
+			'misses' : self.misses,
+			'waits' : self.waits,
+			'evictions' : self.evictions,
+		}
+
+	def __repr__(self):
+		return 'CacheStats({})'.format(self.as_dict())
+
+class CompileCache(object):
+	""" A content-addressed cache of compiled modules in `directory`, that
+	any number of processes can share.
+
+	Modules are keyed by a hash of the template source, compiler_hash(),
+	grammar_hash() and the compile options. With `store_trees`, the parse of
+	each template is kept too (keyed without the options), so compiling a
+	template again with other options skips the parser.
+
+	Entries are written to a temporary file and renamed into place, so a
+	reader sees a whole entry or none. Reading an entry marks it as used;
+	once the entries take more than `max_size` bytes, the least recently used
+	are removed. A CompileCache can be used from several threads.
+
+	>>> cache = CompileCache('.jsdompl-cache')
+	>>> code = cache.compile(source, minify = True)
+	"""
+
+	def __init__(self, directory, max_size = 256 * 1024 * 1024, store_trees = False):
+		if max_size < 0:
+			raise ValueError("CompileCache max_size can't be negative")
+		self.directory = directory
+		self.max_size = max_size
+		self.store_trees = store_trees
+		self.stats = CacheStats()
+
+		# bytes taken by the entries when the directory was last scanned,
+		# plus what this process wrote since
+		self._size = None
+		# guards `stats` and `_size`
+		self._lock = threading.Lock()
+
+	def key(self, source, **options):
+		return module_key(source, **options)
+
+	def tree_key(self, source):
+		""" Returns the key of the parse of `source`
+		"""
+		return _digest(source, 'tree')
+
+	def _path(self, key, suffix):
+		return os.path.join(self.directory, key[:2], key[2:] + suffix)
+
+	def _read(self, key, suffix):
+		path = self._path(key, suffix)
+		try:
+			with open(path, 'rb') as f:
+				data = f.read()
+			os.utime(path, None)
+		except (IOError, OSError) as e:
+			# evicted by another process in the meantime counts as a miss
+			if e.errno != errno.ENOENT:
+				raise
+			return None
+		return data
+
+	def _write(self, key, suffix, data):
+		path = self._path(key, suffix)
+		directory = os.path.dirname(path)
+		if not os.path.isdir(directory):
+			try:
+				os.makedirs(directory)
+			except OSError:
+				if not os.path.isdir(directory):
+					raise
+
+		fd, tmp = tempfile.mkstemp(prefix = '.', suffix = '.tmp', dir = directory)
+		try:
+			with os.fdopen(fd, 'wb') as f:
+				f.write(data)
+			_replace(tmp, path)
+		except BaseException:
+			os.remove(tmp)
+			raise
+
+		with self._lock:
+			if self._size is None:
+				self._size = self.size()
+			else:
+				self._size += len(data)
+			full = self._size > self.max_size
+		if full:
+			self.evict()
+
+	def get(self, key):
+		""" Returns the module cached at `key`, None if there is none
+		"""
+		data = self._read(key, '.js')
+		return None if data is None else data.decode('utf-8')
+
+	def put(self, key, code):
+		self._write(key, '.js', code.encode('utf-8'))
+
+	def get_tree(self, key):
+		""" Returns the parse cached at `key`, None if there is none
+		"""
+		data = self._read(key, '.ast')
+		return None if data is None else pickle.loads(data)
+
+	def put_tree(self, key, tree):
+		try:
+			data = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+		except RuntimeError:
+			# pickle recurses once per level of the tree, very deep templates
+			# are only cached compiled
+			return
+		self._write(key, '.ast', data)
+
+	def _entries(self):
+		""" Yields the (last use, size, path) of every entry
+		"""
+		if not os.path.isdir(self.directory):
+			return
+		for name in os.listdir(self.directory):
+			directory = os.path.join(self.directory, name)
+			if len(name) != 2 or not os.path.isdir(directory):
+				continue
+			for filename in os.listdir(directory):
+				if filename.startswith('.'):
+					continue
+				path = os.path.join(directory, filename)
+				try:
+					st = os.stat(path)
+				except OSError:
+					continue
+				yield st.st_mtime, st.st_size, path
+
+	def size(self):
+		""" Returns the bytes taken by the entries of the cache
+		"""
+		return sum(size for _, size, _ in self._entries())
+
+	def evict(self, target = None):
+		""" Removes the least recently used entries until they take at most
+		`target` bytes, by default 90% of max_size so that the next few writes
+		don't evict again
+		"""
+		if target is None:
+			target = self.max_size * 9 // 10
+		# one thread evicts at a time, the others would remove more than needed
+		with self._lock:
+			entries = sorted(self._entries())
+			size = sum(entry[1] for entry in entries)
+			for _, entry_size, path in entries:
+				if size <= target:
+					break
+				try:
+					os.remove(path)
+				except OSError:
+					# removed by another process
+					pass
+				else:
+					self.stats.evictions += 1
+				size -= entry_size
+			self._size = size
+
+	def compile(self, source, js_parser = None, **options):
+		""" Returns the AMD module compiled from `source`, from the cache when
+		it is there. `options` are passed on to compile_to().
+		"""
+		key = self.key(source, **options)
+		code = self.get(key)
+		if code is not None:
+			with self._lock:
+				self.stats.hits += 1
+			return code
+
+		if js_parser is None:
+			js_parser = Parser()
+		tree = None
+		if self.store_trees:
+			tree_key = self.tree_key(source)
+			tree = self.get_tree(tree_key)
+			if tree is not None:
+				with self._lock:
+					self.stats.tree_hits += 1
+			else:
+				# stored before code generation, which modifies the tree
+				tree = js_parser.parse(source)
+				self.put_tree(tree_key, tree)
+		with self._lock:
+			self.stats.misses += 1
+
+		out = StringIO()
+		compile_to(out, source, js_parser = js_parser, tree = tree, **options)
+		code = out.getvalue()
+		self.put(key, code)
+		return code
+
+class _Flight(object):
+	""" A module being compiled by one thread, that the others wait for
+	"""
+	def __init__(self):
+		self.done = threading.Event()
+		self.code = None
+		self.error = None
+
+class MemoryCache(object):
+	""" A thread-safe, in-process cache of the `size` most recently used
+	compiled modules.
+
+	When several threads ask for a module that isn't cached, only the first
+	compiles it; the others wait for it and get the same module, or the same
+	exception. Modules are compiled with parsers from the process-wide
+	ParserPool, and through `cache`, a CompileCache, when one is given.
+
+	>>> templates = MemoryCache(size = 512)
+	>>> code = templates.compile(source, update = True)
+	"""
+
+	def __init__(self, size = 512, cache = None):
+		if size < 1:
+			raise ValueError("MemoryCache size must be at least 1")
+		self.size = size
+		self.cache = cache
+		self.stats = CacheStats()
+
+		# {key: module}, least recently used first
+		self._entries = OrderedDict()
+		# {key: _Flight} of the modules being compiled
+		self._flights = {}
+		self._lock = threading.Lock()
+
+	def __len__(self):
+		return len(self._entries)
+
+	def clear(self):
+		with self._lock:
+			self._entries.clear()
+
+	def compile(self, source, **options):
+		""" Returns the AMD module compiled from `source`, compiling it only if
+		it isn't cached or being compiled already. `options` are passed on to
+		compile_to().
+		"""
+		key = module_key(source, **options)
+		with self._lock:
+			code = self._entries.pop(key, None)
+			if code is not None:
+				self._entries[key] = code
+				self.stats.hits += 1
+				return code
+
+			flight = self._flights.get(key)
+			leader = flight is None
+			if leader:
+				flight = self._flights[key] = _Flight()
+				self.stats.misses += 1
+			else:
+				self.stats.waits += 1
+
+		if not leader:
+			flight.done.wait()
+			if flight.error is not None:
+				raise flight.error
+			return flight.code
+
+		try:
+			flight.code = self._compile(source, options)
+		except BaseException as e:
+			flight.error = e
+			raise
+		finally:
+			with self._lock:
+				del self._flights[key]
+				if flight.code is not None:
+					self._entries[key] = flight.code
+					while len(self._entries) > self.size:
+						self._entries.popitem(last = False)
+						self.stats.evictions += 1
+			flight.done.set()
+		return flight.code
+
+	def _compile(self, source, options):
+		with get_pool().parser() as p:
+			if self.cache is not None:
+				return self.cache.compile(source, js_parser = p, **options)
+			out = StringIO()
+			compile_to(out, source, js_parser = p, **options)
+			return out.getvalue()
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_cache(size = 512):
+	""" Returns the process-wide MemoryCache, creating it with room for `size`
+	modules on first use.
+	"""
+	global _default_cache
+	with _default_cache_lock:
+		if _default_cache is None:
+			_default_cache = MemoryCache(size)
+		return _default_cache
+
+def compile(source, **options):
+	""" Returns the AMD module compiled from `source` with `options`, through
+	the process-wide MemoryCache
+	"""
+	return get_cache().compile(source, **options)
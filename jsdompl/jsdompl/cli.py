@@ -0,0 +1,371 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import argparse
+import fnmatch
+import glob
+import io
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import traceback
+
+from .cache import CompileCache, MemoryCache
+from .parser import Parser
+from .pool import get_pool
+from .server import CompileServer
+from .template import compile_to
+from .watch import make_watcher
+
+_replace = getattr(os, 'replace', os.rename)
+
+def find_templates(paths, ext = '.html'):
+	""" Returns the (source, name) pairs of the templates found in `paths`,
+	and the paths that did not match anything.
+
+	A path can be a file, a directory (searched recursively for files ending
+	in `ext`) or a glob. The name of a template is its path relative to the
+	directory it was found in, or its base name for files and globs.
+	"""
+	found = []
+	missing = []
+	for path in paths:
+		if os.path.isdir(path):
+			for root, dirs, files in os.walk(path):
+				dirs.sort()
+				for filename in sorted(files):
+					if filename.endswith(ext):
+						source = os.path.join(root, filename)
+						found.append((source, os.path.relpath(source, path)))
+		elif os.path.isfile(path):
+			found.append((path, os.path.basename(path)))
+		else:
+			matches = sorted(match for match in glob.glob(path) if os.path.isfile(match))
+			if not matches:
+				missing.append(path)
+			found.extend((match, os.path.basename(match)) for match in matches)
+	return found, missing
+
+def template_name(path, paths, ext = '.html'):
+	""" Returns the name find_templates() gives to the file at `path` when
+	looking for templates in `paths`, None if it isn't one of them
+	"""
+	for arg in paths:
+		if os.path.isdir(arg):
+			name = os.path.relpath(path, arg)
+			if path.endswith(ext) and name != os.pardir and not name.startswith(os.pardir + os.sep):
+				return name
+		elif glob.has_magic(arg):
+			if fnmatch.fnmatch(path, arg):
+				return os.path.basename(path)
+		elif os.path.normpath(path) == os.path.normpath(arg):
+			return os.path.basename(path)
+	return None
+
+def watch_roots(paths):
+	""" Returns the (directory, recursive) pairs to watch for changes to the
+	templates in `paths`
+	"""
+	roots = []
+	for arg in paths:
+		if os.path.isdir(arg):
+			root = arg, True
+		elif glob.has_magic(arg):
+			# from the last directory before the first wildcard
+			parts = arg.split(os.sep)
+			static = []
+			for part in parts[:-1]:
+				if glob.has_magic(part):
+					break
+				static.append(part)
+			root = os.sep.join(static) or (os.sep if arg.startswith(os.sep) else os.curdir), len(static) < len(parts) - 1
+		else:
+			root = os.path.dirname(arg) or os.curdir, False
+		if root not in roots:
+			roots.append(root)
+	return roots
+
+def output_path(source, name, output_dir = None):
+	""" Returns where the module compiled from `source` is written: next to
+	it, or under `output_dir` at `name`, with the extension replaced by .js
+	"""
+	if output_dir is None:
+		return os.path.splitext(source)[0] + '.js'
+	return os.path.join(output_dir, os.path.splitext(name)[0] + '.js')
+
+def compile_file(source, target, js_parser = None, cache = None, **options):
+	""" Compiles the template file `source` to the AMD module file `target`.
+	The module is written to a temporary file first, so `target` is either
+	left as it was or fully written. `options` are passed on to compile_to().
+
+	With a CompileCache as `cache`, the module is taken from it when the
+	template was compiled before. Returns True when it was.
+	"""
+	with io.open(source, encoding = 'utf-8') as f:
+		text = f.read()
+
+	directory = os.path.dirname(target)
+	if directory and not os.path.isdir(directory):
+		try:
+			os.makedirs(directory)
+		except OSError:
+			# another worker may have made it in the meantime
+			if not os.path.isdir(directory):
+				raise
+
+	cached = False
+	tmp = '{}.{}.tmp'.format(target, os.getpid())
+	try:
+		with io.open(tmp, 'w', encoding = 'utf-8') as out:
+			if cache is None:
+				compile_to(out, text, js_parser = js_parser, **options)
+			else:
+				hits = cache.stats.hits
+				out.write(cache.compile(text, js_parser = js_parser, **options))
+				cached = cache.stats.hits > hits
+		_replace(tmp, target)
+	except BaseException:
+		if os.path.exists(tmp):
+			os.remove(tmp)
+		raise
+	return cached
+
+# The Parser, cache and compile options of a worker process, see
+# _init_worker()
+_worker_parser = None
+_worker_cache = None
+_worker_options = None
+
+def _init_worker(cache, options):
+	global _worker_parser, _worker_cache, _worker_options
+	_worker_parser = Parser()
+	_worker_cache = cache
+	_worker_options = options
+
+def _compile_job(job):
+	""" Compiles one (source, target) pair with the parser of the current
+	worker, returns the pair, the error message (None on success) and
+	whether the module came from the cache
+	"""
+	source, target = job
+	try:
+		cached = compile_file(source, target, js_parser = _worker_parser, cache = _worker_cache, **_worker_options)
+	except Exception:
+		error = ''.join(traceback.format_exception_only(*sys.exc_info()[:2])).strip()
+		return source, target, error, False
+	return source, target, None, cached
+
+def compile_files(jobs, processes = None, cache = None, **options):
+	""" Compiles the (source, target) pairs of `jobs` and yields a (source,
+	target, error, cached) tuple for each one as it is done, error being None
+	when the template compiled and cached True when its module came from
+	`cache`, a CompileCache.
+
+	The jobs are spread over a pool of `processes` worker processes (one per
+	CPU by default), each with one Parser it reuses for all the templates it
+	compiles. With a single process, templates are compiled in this one.
+	`options` are passed on to compile_to().
+	"""
+	jobs = list(jobs)
+	if processes is None:
+		processes = multiprocessing.cpu_count()
+	processes = max(1, min(processes, len(jobs)))
+
+	if processes == 1:
+		_init_worker(cache, options)
+		for job in jobs:
+			yield _compile_job(job)
+		return
+
+	pool = multiprocessing.Pool(processes, _init_worker, (cache, options))
+	try:
+		# hand out a few jobs at a time, but enough batches that a worker
+		# that drew the large templates does not hold up the end of the run
+		chunksize = max(1, len(jobs) // (processes * 8))
+		for result in pool.imap_unordered(_compile_job, jobs, chunksize):
+			yield result
+		pool.close()
+	except BaseException:
+		pool.terminate()
+		raise
+	finally:
+		pool.join()
+
+def make_arg_parser():
+	parser = argparse.ArgumentParser(
+		prog = 'jsdompl',
+		description = "Compiles jsdompl templates to AMD modules, one module per template. "
+			"`jsdompl serve` starts a compile server instead, see `jsdompl serve -h`.")
+	parser.add_argument('paths', nargs = '+', metavar = 'PATH',
+		help = "template file, directory of templates or glob")
+	parser.add_argument('-o', '--output-dir', metavar = 'DIR',
+		help = "write the modules under DIR instead of next to their templates")
+	parser.add_argument('-j', '--jobs', type = int, default = None, metavar = 'N',
+		help = "number of worker processes (default: one per CPU)")
+	parser.add_argument('--ext', default = '.html',
+		help = "extension of the templates searched for in directories (default: %(default)s)")
+	parser.add_argument('--strategy', choices = ('auto', 'dom', 'template'), default = 'auto',
+		help = "how the template builds its DOM (default: %(default)s)")
+	parser.add_argument('--update', action = 'store_true',
+		help = "generate templates that can update the nodes they made")
+	parser.add_argument('--minify', action = 'store_true',
+		help = "shorten names and drop indentation")
+	parser.add_argument('--cache-dir', metavar = 'DIR',
+		help = "keep compiled modules in DIR and only compile the templates that changed")
+	parser.add_argument('--cache-size', type = int, default = 256, metavar = 'MB',
+		help = "size the cache is kept under (default: %(default)sMB)")
+	parser.add_argument('--cache-trees', action = 'store_true',
+		help = "cache the parse of the templates too, to skip parsing when only the options change")
+	parser.add_argument('--watch', action = 'store_true',
+		help = "after compiling, keep recompiling the templates that change until interrupted")
+	parser.add_argument('--poll', action = 'store_true',
+		help = "watch by scanning the templates instead of with inotify")
+	parser.add_argument('--debounce', type = int, default = 30, metavar = 'MS',
+		help = "wait for MS milliseconds without changes before recompiling (default: %(default)s)")
+	parser.add_argument('-q', '--quiet', action = 'store_true',
+		help = "only report errors")
+	return parser
+
+def main(argv = None):
+	""" Entry point of the `jsdompl` command, returns the exit status: 0 when
+	every template compiled, 1 otherwise
+	"""
+	if argv is None:
+		argv = sys.argv[1:]
+	if argv[:1] == ['serve']:
+		return serve(argv[1:])
+
+	args = make_arg_parser().parse_args(argv)
+	if args.jobs is not None and args.jobs < 1:
+		print("jsdompl: --jobs must be at least 1", file = sys.stderr)
+		return 2
+
+	found, missing = find_templates(args.paths, args.ext)
+	failed = 0
+	for path in missing:
+		print("{}: no such file, directory or matching templates".format(path), file = sys.stderr)
+		failed += 1
+
+	jobs = []
+	sources = {}
+	for source, name in found:
+		target = output_path(source, name, args.output_dir)
+		if target in sources:
+			if os.path.realpath(sources[target]) == os.path.realpath(source):
+				continue
+			print("{}: would overwrite the module of {} ({})".format(source, sources[target], target), file = sys.stderr)
+			failed += 1
+			continue
+		sources[target] = source
+		jobs.append((source, target))
+
+	cache = None
+	if args.cache_dir is not None:
+		cache = CompileCache(args.cache_dir, max_size = args.cache_size * 1024 * 1024, store_trees = args.cache_trees)
+
+	options = dict(strategy = args.strategy, update = args.update, minify = args.minify)
+	compiled = cached = 0
+	for source, target, error, from_cache in compile_files(jobs, args.jobs, cache, **options):
+		if error is None:
+			compiled += 1
+			cached += from_cache
+			if not args.quiet:
+				print("{} -> {}{}".format(source, target, " (cached)" if from_cache else ''))
+		else:
+			failed += 1
+			print("{}: {}".format(source, error), file = sys.stderr)
+
+	if not args.quiet or failed:
+		print("{} compiled ({} from the cache), {} failed".format(compiled, cached, failed), file = sys.stderr)
+	if args.watch:
+		return watch(args, cache, options)
+	return 1 if failed else 0
+
+# changes to more templates than this are compiled on a pool of processes
+WATCH_POOL_THRESHOLD = 32
+
+def watch(args, cache, options):
+	""" Recompiles the templates that change under the paths of `args` until
+	interrupted. Small batches of changes are compiled in this process with
+	one Parser kept warm, the modules of removed templates are removed.
+	"""
+	def is_template(path):
+		return template_name(path, args.paths, args.ext) is not None
+
+	watcher = make_watcher(watch_roots(args.paths), is_template, args.debounce / 1000, args.poll)
+	_init_worker(cache, options)
+	print("watching for changes ({})".format(type(watcher).__name__), file = sys.stderr)
+	try:
+		while True:
+			changed = watcher.wait()
+			start = time.time()
+			jobs = []
+			for source in sorted(changed):
+				target = output_path(source, template_name(source, args.paths, args.ext), args.output_dir)
+				if os.path.isfile(source):
+					jobs.append((source, target))
+				elif os.path.isfile(target):
+					os.remove(target)
+					if not args.quiet:
+						print("{} removed, removed {}".format(source, target))
+
+			if len(jobs) > WATCH_POOL_THRESHOLD and args.jobs != 1:
+				results = compile_files(jobs, args.jobs, cache, **options)
+			else:
+				results = (_compile_job(job) for job in jobs)
+			for source, target, error, from_cache in results:
+				if error is not None:
+					print("{}: {}".format(source, error), file = sys.stderr)
+				elif not args.quiet:
+					print("{} -> {}{}".format(source, target, " (cached)" if from_cache else ''))
+			if jobs and not args.quiet:
+				print("recompiled {} in {:.0f}ms".format(len(jobs), (time.time() - start) * 1e3), file = sys.stderr)
+	except KeyboardInterrupt:
+		return 0
+	finally:
+		watcher.close()
+
+def make_serve_arg_parser():
+	parser = argparse.ArgumentParser(
+		prog = 'jsdompl serve',
+		description = "Compiles templates for the clients of a Unix socket, see server.CompileHandler for the protocol.")
+	parser.add_argument('--socket', default = 'jsdompl.sock', metavar = 'PATH',
+		help = "path of the socket to listen on (default: %(default)s)")
+	parser.add_argument('--parsers', type = int, default = 4, metavar = 'N',
+		help = "number of parsers kept warm (default: %(default)s)")
+	parser.add_argument('--cache-size', type = int, default = 512, metavar = 'N',
+		help = "number of compiled modules kept in memory (default: %(default)s)")
+	parser.add_argument('--cache-dir', metavar = 'DIR',
+		help = "also keep compiled modules in DIR, see --cache-dir of jsdompl")
+	return parser
+
+def serve(argv):
+	""" Entry point of `jsdompl serve`, serves until interrupted or terminated
+	"""
+	args = make_serve_arg_parser().parse_args(argv)
+	if args.parsers < 1 or args.cache_size < 1:
+		print("jsdompl serve: --parsers and --cache-size must be at least 1", file = sys.stderr)
+		return 2
+
+	get_pool(args.parsers)
+	disk_cache = None if args.cache_dir is None else CompileCache(args.cache_dir)
+	try:
+		server = CompileServer(args.socket, MemoryCache(args.cache_size, disk_cache))
+	except (IOError, OSError) as e:
+		print("jsdompl serve: {}".format(e), file = sys.stderr)
+		return 1
+
+	# so that the socket is removed when the server is terminated
+	signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+	print("listening on {}".format(args.socket), file = sys.stderr)
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+	return 0
@@ -4,14 +4,56 @@ __author__ = "Richard Eames <reames@asymmetricventures.com>"
 __date__ = "Jul 4, 2013"
 
 import re
+from collections import deque
 
-from html5lib.constants import tokenTypes, voidElements
-from html5lib.tokenizer import HTMLTokenizer
 from ply.lex import LexToken
 
+try:
+	from html import unescape
+except ImportError:
+	from HTMLParser import HTMLParser
+	unescape = HTMLParser().unescape
+
+try:
+	from html5lib.constants import tokenTypes
+	from html5lib.tokenizer import HTMLTokenizer
+except ImportError:
+	HTMLTokenizer = None
+
 from .jslexer import Lexer as JSLexer
 
-js_start_rx = re.compile(r'^(.*?)(\{(?:%|\{(?:\{)?))', re.DOTALL)
+# same as html5lib.constants.voidElements
+VOID_ELEMENTS = frozenset([
+	'area', 'base', 'br', 'col', 'command', 'embed', 'event-source', 'hr',
+	'img', 'input', 'link', 'meta', 'param', 'source', 'track',
+])
+
+# elements whose content is text up to their end tag, as in html5lib
+RAWTEXT_ELEMENTS = frozenset(['script', 'style'])
+
+js_start_rx = re.compile(r'(\{(?:%|\{(?:\{)?))')
+
+# anything that can start a token in character data
+markup_start_rx = re.compile(r'<|\{(?:%|\{(?:\{)?)')
+# anything that can start a token in the content of a RAWTEXT_ELEMENTS tag
+rawtext_start_rx = dict(
+	(name, re.compile(r'</{}(?=[\s/>])|\{{(?:%|\{{(?:\{{)?)'.format(name), re.IGNORECASE))
+	for name in RAWTEXT_ELEMENTS
+)
+ws_rx = re.compile(r'^[ \t\n\r\f]+$')
+
+start_tag_rx = re.compile(r'<([a-zA-Z][^\s/>]*)')
+end_tag_rx = re.compile(r'</([a-zA-Z][^\s/>]*)[^>]*>')
+attr_rx = re.compile(r"""[\s/]*([^\s"'>/=]+)(\s*=\s*)?""")
+# where an attribute value or the text in it ends
+attr_value_end_rx = {
+	'"' : re.compile(r'"|\{(?:%|\{(?:\{)?)'),
+	"'" : re.compile(r"'|\{(?:%|\{(?:\{)?)"),
+	None : re.compile(r'[\s>]|\{(?:%|\{(?:\{)?)'),
+}
+simple_island_rx = re.compile(r'[ \t]*([a-zA-Z_$][\w$]*(?:\.[a-zA-Z_$][\w$]*)*)[ \t]*(\}\}\}?|%\})')
+tag_end_rx = re.compile(r'[\s/]*?(/?)>')
+doctype_rx = re.compile(r'<!doctype\s+([^\s>]*)[^>]*>', re.IGNORECASE)
 
 def lex_token__str__(self):
 	name = ''
@@ -30,6 +72,7 @@ class Lexer(JSLexer):
 	tokens = tuple(list(JSLexer.tokens) + [
 		'HTML_CHARS', 'HTML_WS', 'HTML_COMMENT',
 		'HTML_DOCTYPE', 'HTML_STARTTAG', 'HTML_ENDTAG', 'HTML_EMPTYTAG', 'HTML_VOID_TAG',
+		'HTML_ATTR', 'HTML_ATTR_TEXT', 'HTML_TAG_END',
 		'JS_OPEN', 'ESCAPED_OPEN', 'EXPRESSION_OPEN'
 	])
 	
@@ -39,47 +82,381 @@ class Lexer(JSLexer):
 		'{{{' : 'EXPRESSION_TERMINATOR'
 	}
 	
+	terminator_type = {
+		'%}'  : 'JS_TERMINATOR',
+		'}}'  : 'ESCAPED_TERMINATOR',
+		'}}}' : 'EXPRESSION_TERMINATOR'
+	}
+	
 	tbtype = {
 		'{%'  : 'JS_OPEN',
 		'{{'  : 'ESCAPED_OPEN',
 		'{{{' : 'EXPRESSION_OPEN'
 	}
 	
+	def __init__(self, use_html5lib = False, **kwargs):
+		""" By default templates are tokenised in a single pass by the
+		lexer itself. With `use_html5lib` the markup is tokenised by html5lib
+		instead, which is slower but raises a SyntaxError on any HTML parse
+		error, so it can be used to validate templates.
+		"""
+		if use_html5lib and HTMLTokenizer is None:
+			raise ImportError("html5lib is needed for use_html5lib")
+		self.use_html5lib = use_html5lib
+		JSLexer.__init__(self, **kwargs)
+	
 	def input(self, text):
-		self.lexer = HTMLTokenizer(text)
+		self.source = text
 		self.lexpos = 0
-		self.lineno = 0
+		self.lineno = 1
+		self._line_pos = 0
+		# drop anything left over from a previous (possibly failed) input
+		self.next_tokens = deque()
+		self.prev_token = None
+		self.cur_token = None
+		
+		if self.use_html5lib:
+			self.lexer = HTMLTokenizer(text)
+			self._tokens = self._html5lib_token_stream()
+		else:
+			self.lexer = None
+			self._tokens = self._token_stream()
 	
 	def build(self, **kwargs):
-		pass
+		# The markup itself is tokenised by hand (or by html5lib), the ply
+		# options are kept for the JS lexer that handles the {{ }} and
+		# {% %} islands.
+		self.js_lexer_options = kwargs
+		self._js_lexer = None
+	
+	@property
+	def js_lexer(self):
+		""" The JS lexer used for every island, built once and then
+		re-pointed at each island with input()
+		"""
+		if self._js_lexer is None:
+			self._js_lexer = JSLexer(**self.js_lexer_options)
+		return self._js_lexer
 	
 	def _html_token(self):
 		for t in self.lexer:
 			yield t
 	
 	def token(self):
-		if len(self.next_tokens):
-			return self.next_tokens.pop(0)
+		# tokens pushed back by auto_semi come first
+		if self.next_tokens:
+			return self.next_tokens.pop()
 		
-		try:
-			html_tok = next(self._html_token())
-			self.lexpos += len(html_tok['data'])
-			self.lineno = self.lexer.stream.position()[0]
-		except StopIteration:
-			return None
+		return next(self._tokens, None)
+	
+	def _line_at(self, pos):
+		""" Returns the line number of `pos`, counting from the last position
+		asked for, so it is cheap when positions are mostly increasing.
+		"""
+		if pos >= self._line_pos:
+			self.lineno += self.source.count('\n', self._line_pos, pos)
+		else:
+			self.lineno -= self.source.count('\n', pos, self._line_pos)
+		self._line_pos = pos
+		return self.lineno
+	
+	def _make_token(self, type, value, pos, lineno = None):
+		tok = LexToken()
+		tok.type = type
+		tok.value = value
+		tok.lineno = self._line_at(pos) if lineno is None else lineno
+		tok.lexpos = pos
+		self.lexpos = pos
+		return tok
+	
+	def _token_stream(self):
+		""" Generates the LexTokens for the current input in a single pass.
 		
-		tok = self._lextoken_from_html(html_tok)
+		Tags, comments and the {{ }}, {{{ }}} and {% %} islands are found as
+		they come, everything else is character data. Islands are handed
+		to the JS lexer in place, so they may contain `<` and `>`. In <script>
+		and <style> only the end tag and islands are markup.
+		"""
+		source = self.source
+		text_start = pos = 0
+		# name of the RAWTEXT_ELEMENTS tag we are in
+		rawtext = None
 		
-		if tok.type == 'HTML_CHARS':
-			# possibly js
-			endtext = self._parse_chars(tok.value['data'])
+		while True:
+			start_rx = markup_start_rx if rawtext is None else rawtext_start_rx[rawtext]
+			m = start_rx.search(source, pos)
+			if m is None:
+				break
 			
-			while endtext is not None:
-				endtext = self._parse_chars(endtext)
+			start = m.start()
+			if m.group().startswith('<'):
+				tokens, end = self._markup_tokens(start)
+				if tokens is None:
+					# a lone `<` is just text
+					pos = start + 1
+					continue
+			else:
+				tokens, end = None, None
 			
-			return self.token()
+			if start > text_start:
+				yield self._text_token(text_start, start, rawtext is None)
 			
-		return tok
+			if tokens is None:
+				tokens, end = self._island_tokens(m.group(), start)
+			elif tokens:
+				tag = tokens[0]
+				if tag.type == 'HTML_STARTTAG' and tag.value['name'] in RAWTEXT_ELEMENTS and not tag.value['self_closing']:
+					rawtext = tag.value['name']
+				else:
+					rawtext = None
+			
+			for tok in tokens:
+				yield tok
+			
+			text_start = pos = end
+		
+		if len(source) > text_start:
+			yield self._text_token(text_start, len(source), rawtext is None)
+	
+	def _text_token(self, start, end, unescape_refs = True):
+		data = self.source[start:end]
+		if unescape_refs and '&' in data:
+			data = unescape(data)
+		
+		type = 'HTML_WS' if ws_rx.match(data) else 'HTML_CHARS'
+		return self._make_token(type, {'data' : data, 'name' : None, 'self_closing' : False}, start)
+	
+	def _markup_tokens(self, pos):
+		""" Returns the tokens for the markup starting with the `<` at `pos`
+		and the position after it, or (None, None) if it is not markup.
+		"""
+		source = self.source
+		
+		if source.startswith('<!--', pos):
+			end = source.find('-->', pos + 4)
+			if end == -1:
+				raise SyntaxError("Unterminated comment at line {}".format(self._line_at(pos)))
+			value = {'data' : source[pos + 4:end], 'name' : None, 'self_closing' : False}
+			return [self._make_token('HTML_COMMENT', value, pos)], end + 3
+		
+		if source.startswith('<!', pos) or source.startswith('<?', pos):
+			end = source.find('>', pos)
+			if end == -1:
+				raise SyntaxError("Unterminated markup at line {}".format(self._line_at(pos)))
+			m = doctype_rx.match(source, pos)
+			if m is not None:
+				# a template renders to a fragment, which has no doctype
+				return [], m.end()
+			# bogus comment
+			value = {'data' : source[pos + 2:end], 'name' : None, 'self_closing' : False}
+			return [self._make_token('HTML_COMMENT', value, pos)], end + 1
+		
+		if source.startswith('</', pos):
+			m = end_tag_rx.match(source, pos)
+			if m is None:
+				return None, None
+			value = {'data' : '', 'name' : m.group(1).lower(), 'self_closing' : False}
+			return [self._make_token('HTML_ENDTAG', value, pos)], m.end()
+		
+		m = start_tag_rx.match(source, pos)
+		if m is None:
+			return None, None
+		
+		name = m.group(1).lower()
+		tag_tok = self._make_token('HTML_STARTTAG', {'data' : '', 'name' : name, 'self_closing' : False}, pos)
+		tokens = [tag_tok]
+		seen = set()
+		end = m.end()
+		
+		while True:
+			close = tag_end_rx.match(source, end)
+			if close is not None:
+				break
+			am = attr_rx.match(source, end)
+			if am is None or am.end() == end:
+				raise SyntaxError("Unterminated <{}> tag at line {}".format(name, self._line_at(pos)))
+			attr_name = am.group(1).lower()
+			attr_tokens = [self._make_token('HTML_ATTR', attr_name, am.start(1))]
+			end = am.end()
+			if am.group(2):
+				value_tokens, end = self._attr_value_tokens(end)
+				attr_tokens.extend(value_tokens)
+			if attr_name not in seen:
+				seen.add(attr_name)
+				tokens.extend(attr_tokens)
+		
+		self_closing = bool(close.group(1))
+		tag_tok.value['self_closing'] = self_closing
+		tokens.append(self._make_token('HTML_TAG_END', self_closing, close.start()))
+		
+		if name in VOID_ELEMENTS:
+			tag_tok.type = 'HTML_VOID_TAG'
+		elif self_closing:
+			# <div/> is the same as <div></div>
+			end_value = {'data' : '', 'name' : name, 'self_closing' : False}
+			tokens.append(self._make_token('HTML_ENDTAG', end_value, close.start()))
+		return tokens, close.end()
+	
+	def _attr_value_tokens(self, pos):
+		""" Returns the HTML_ATTR_TEXT and island tokens of the attribute value
+		starting at `pos`, and the position after the value.
+		"""
+		source = self.source
+		quote = source[pos:pos + 1]
+		if quote in ('"', "'"):
+			pos += 1
+		else:
+			quote = None
+		end_rx = attr_value_end_rx[quote]
+		
+		tokens = []
+		text_start = pos
+		while True:
+			m = end_rx.search(source, pos)
+			if m is None:
+				if quote is not None:
+					raise SyntaxError("Unterminated attribute value at line {}".format(self._line_at(text_start)))
+				end = len(source)
+			else:
+				end = m.start()
+			
+			if end > text_start:
+				text = source[text_start:end]
+				if '&' in text:
+					text = unescape(text)
+				tokens.append(self._make_token('HTML_ATTR_TEXT', text, text_start))
+			
+			if m is None or m.group() not in self.tbtype:
+				return tokens, (m.end() if quote is not None else end)
+			
+			if m.group() == '{%':
+				raise SyntaxError("{{% %}} blocks are not allowed in attribute values (line {})".format(self._line_at(end)))
+			
+			island_tokens, pos = self._island_tokens(m.group(), end)
+			tokens.extend(island_tokens)
+			text_start = pos
+	
+	def _island_tokens(self, start_type, pos, source = None):
+		""" Returns the tokens of the {{ }}, {{{ }}} or {% %} island starting at
+		`pos` and the position after its terminator.
+		
+		`source` defaults to the current input. Islands in other strings
+		(html5lib attribute values) get the current line number.
+		"""
+		lineno = None
+		if source is None:
+			source = self.source
+		else:
+			lineno = self.lineno
+		
+		tokens = [self._make_token(self.tbtype[start_type], start_type, pos, lineno)]
+		pos += len(start_type)
+		
+		# {{ name.attr }} is common enough to skip the JS lexer for
+		m = simple_island_rx.match(source, pos)
+		if m is not None and self.terminator_type[m.group(2)] == self.ttype[start_type]:
+			names = m.group(1).split('.')
+			if not any(name in JSLexer.keywords_dict for name in names):
+				ident_pos = m.start(1)
+				for i, name in enumerate(names):
+					if i:
+						tokens.append(self._make_token('PERIOD', '.', ident_pos, lineno))
+						ident_pos += 1
+					tokens.append(self._make_token('ID', name, ident_pos, lineno))
+					ident_pos += len(name)
+				tokens.append(self._make_token(self.terminator_type[m.group(2)], m.group(2), m.start(2), lineno))
+				return tokens, m.end()
+		
+		js_lexer = self.js_lexer
+		js_lexer.input(source)
+		js_lexer.lexer.lexpos = pos
+		
+		for t in js_lexer:
+			t.lineno = self._line_at(t.lexpos) if lineno is None else lineno
+			tokens.append(t)
+			
+			if t.type in ('EXPRESSION_TERMINATOR', 'ESCAPED_TERMINATOR', 'JS_TERMINATOR'):
+				if t.type != self.ttype[start_type]:
+					raise SyntaxError("Expected {} but got {} at line {}".format(self.ttype[start_type], t.type, t.lineno))
+				return tokens, js_lexer.lexer.lexpos
+		
+		raise SyntaxError("Unterminated {} at line {}".format(start_type, tokens[0].lineno))
+	
+	def _html5lib_token_stream(self):
+		""" Generates the LexTokens for the current input using html5lib.
+		
+		Character data is split into HTML_CHARS and the tokens of the
+		embedded JS islands, which are queued and served in order before the
+		next html5lib token is read.
+		"""
+		queue = deque()
+		
+		for html_tok in self._html_token():
+			self.lexpos += len(html_tok.get('data', ''))
+			self.lineno = self.lexer.stream.position()[0]
+			
+			tok = self._lextoken_from_html(html_tok)
+			
+			if tok.type == 'HTML_DOCTYPE':
+				# a template renders to a fragment, which has no doctype
+				continue
+			
+			if tok.type in ('HTML_STARTTAG', 'HTML_VOID_TAG'):
+				attrs = tok.value.pop('attrs')
+				if tok.value['name'] == 'script' and not tok.value['self_closing']:
+					# the html5lib parser does this when it sees the tag
+					self.lexer.state = self.lexer.scriptDataState
+				elif tok.value['name'] in RAWTEXT_ELEMENTS and not tok.value['self_closing']:
+					self.lexer.state = self.lexer.rawtextState
+				yield tok
+				for attr_tok in self._html5lib_attr_tokens(attrs):
+					yield attr_tok
+				yield self._make_token('HTML_TAG_END', tok.value['self_closing'], self.lexpos, self.lineno)
+				continue
+			
+			if tok.type != 'HTML_CHARS':
+				tok.value.pop('attrs', None)
+				yield tok
+				continue
+			
+			# possibly js
+			data = tok.value['data']
+			pos = 0
+			while pos is not None:
+				next_pos = self._parse_chars(data, pos, queue)
+				while queue:
+					yield queue.popleft()
+				if next_pos is None and pos < len(data):
+					# text after the last island
+					tok.value['data'] = data[pos:]
+					tok.lexpos = self.lexpos - len(data) + pos
+					yield tok
+				pos = next_pos
+	
+	def _html5lib_attr_tokens(self, attrs):
+		""" Generates the tokens for the attributes of an html5lib tag, the
+		same way the single pass tokenizer does.
+		"""
+		seen = set()
+		for name, value in attrs:
+			if name in seen:
+				continue
+			seen.add(name)
+			yield self._make_token('HTML_ATTR', name, self.lexpos, self.lineno)
+			
+			pos = 0
+			while True:
+				m = js_start_rx.search(value, pos)
+				end = len(value) if m is None else m.start()
+				if end > pos:
+					yield self._make_token('HTML_ATTR_TEXT', value[pos:end], self.lexpos, self.lineno)
+				if m is None:
+					break
+				if m.group() == '{%':
+					raise SyntaxError("{{% %}} blocks are not allowed in attribute values (line {})".format(self.lineno))
+				tokens, pos = self._island_tokens(m.group(), end, value)
+				for tok in tokens:
+					yield tok
 	
 	def _lextoken_from_html(self, html_token):
 		token = LexToken()
@@ -93,6 +470,9 @@ class Lexer(JSLexer):
 			6 : 'HTML_COMMENT',
 			7 : 'HTML_PARSEERROR',
 		}[html_token['type']]
+		if html_token['type'] == tokenTypes['ParseError']:
+			raise SyntaxError("Got HTML Parse Error for token {}".format(html_token))
+		
 		# TODO: fix lineno/lexpos
 		token.lineno = self.lineno
 		token.lexpos = self.lexpos
@@ -102,16 +482,17 @@ class Lexer(JSLexer):
 			'name' : html_token.get('name', None),
 		}
 		
-		if isinstance(html_token['data'], (list, tuple)):
-			token.value['attrs'] = html_token['data']
+		data = html_token.get('data')
+		if html_token['type'] == tokenTypes['Doctype']:
+			token.value['name'] = (token.value['name'] or '').lower()
+			token.value['data'] = ''
+		elif isinstance(data, (list, tuple)):
+			token.value['attrs'] = data
 			token.value['data'] = ''
-			if token.value['name'].lower() in voidElements:
+			if token.value['name'].lower() in VOID_ELEMENTS:
 				token.type = 'HTML_VOID_TAG'
 		else:
-			token.value['data'] = html_token['data']
-		
-		if token.type == tokenTypes['ParseError']:
-			raise SyntaxError("Got HTML Parse Error for token {}".format(html_token))
+			token.value['data'] = data or ''
 		
 		return token
 	
@@ -124,48 +505,50 @@ class Lexer(JSLexer):
 			raise StopIteration()
 		return token
 	
-	def _parse_chars(self, data):
-		m = js_start_rx.match(data)
+	def _parse_chars(self, data, pos, queue):
+		""" Queues the tokens of the first island in `data` after `pos`,
+		along with any text before it. Returns the position to continue from,
+		or None if there are no more islands.
+		"""
+		m = js_start_rx.search(data, pos)
 		
 		if m is None:
 			return None
 		
-		pretext = m.group(1)
-		start_type = m.group(2)
+		# lexpos of the start of `data`
+		data_pos = self.lexpos - len(data)
 		
-		self.lexpos -= len(data)
-		
-		if len(pretext):
+		pretext_len = m.start() - pos
+		if pretext_len:
 			pretext_tok = LexToken()
 			pretext_tok.type = 'HTML_CHARS'
-			pretext_tok.value = pretext
-			pretext_tok.lineno = self.lineno - pretext.count("\n")
-			pretext_tok.lexpos = self.lexpos
-			self.next_tokens.append(pretext_tok)
-			self.lexpos += len(pretext)
+			pretext_tok.value = {'data' : data[pos:m.start()], 'name' : None, 'self_closing' : False}
+			pretext_tok.lineno = self.lineno - data.count("\n", m.start())
+			pretext_tok.lexpos = data_pos + pos
+			queue.append(pretext_tok)
 		
+		start_type = m.group(1)
 		start_tok = LexToken()
 		start_tok.type = self.tbtype[start_type]
 		start_tok.value = start_type
 		start_tok.lineno = self.lineno
-		start_tok.lexpos = self.lexpos
-		self.next_tokens.append(start_tok)
-		self.lexpos += len(start_type)
+		start_tok.lexpos = data_pos + m.start()
+		queue.append(start_tok)
 		
-		js_lexer = JSLexer()
-		js_lexer.input(data[m.end(2):])
+		# point the JS lexer at the island without copying the rest of `data`
+		js_lexer = self.js_lexer
+		js_lexer.input(data)
+		js_lexer.lexer.lexpos = m.end()
 		for t in js_lexer:
 			t.lineno += self.lineno - 1
-			t.lexpos = self.lexpos
-			self.lexpos += js_lexer.lexer.lexpos
+			t.lexpos += data_pos
 			
 			if t.type in ('EXPRESSION_TERMINATOR', 'ESCAPED_TERMINATOR', 'JS_TERMINATOR'):
 				if t.type != self.ttype[start_type]:
 					raise SyntaxError("Expected {} but got {} in char data `{}`".format(self.ttype[start_type], t.type, data))
-				self.next_tokens.append(t)
+				queue.append(t)
 				break
 			
-			self.next_tokens.append(t)
-		remaining_text = data[m.end(2) + js_lexer.lexer.lexpos:]
-		self.lexpos += len(remaining_text)
-		return remaining_text
+			queue.append(t)
+		
+		return js_lexer.lexer.lexpos
@@ -91,17 +91,24 @@ class Lexer(object):
 	For more information see:
 	http://www.ecma-international.org/publications/files/ECMA-ST/ECMA-262.pdf
 	"""
-	def __init__(self):
+	def __init__(self, **kwargs):
 		self.prev_token = None
 		self.cur_token = None
 		self.next_tokens = []
-		self.build()
+		self.build(**kwargs)
 
 	def build(self, **kwargs):
 		"""Build the lexer."""
 		self.lexer = ply.lex.lex(object = self, **kwargs)
 
 	def input(self, text):
+		"""Start lexing `text`, the lexer can be re-pointed at new input
+		at any time without being rebuilt."""
+		self.prev_token = None
+		self.cur_token = None
+		self.next_tokens = []
+		self.lexer.begin('INITIAL')
+		self.lexer.lineno = 1
 		self.lexer.input(text)
 
 	def token(self):
@@ -24,15 +24,83 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
+import hashlib
+import os
+import threading
+
+import ply.lex
 import ply.yacc
 
 from . import ast
 from .htmllexer import Lexer
 
-try:
-	from . import lextab, yacctab
-except ImportError:
-	lextab, yacctab = 'lextab', 'yacctab'
+TABLES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Parse tables shared by every Parser instance in the process.
+# {yacctab module name: (lr_method, lr_action, lr_goto, productions)}
+_parse_tables = {}
+_parse_tables_lock = threading.Lock()
+
+_grammar_hash = None
+
+
+def grammar_hash():
+	"""Return a hex digest of the grammar and the lexer rules.
+
+	The digest covers the docstrings of every ``p_*`` rule in :class:`Parser`
+	as well as the lexer tokens and ``t_*`` rules, so the generated
+	``lextab``/``yacctab`` modules (which are named after it) are regenerated
+	only when the grammar actually changes.
+	"""
+	global _grammar_hash
+	if _grammar_hash is not None:
+		return _grammar_hash
+
+	sig = hashlib.sha1()
+	sig.update(ply.yacc.__tabversion__.encode('utf-8'))
+	sig.update(ply.lex.__version__.encode('utf-8'))
+	sig.update(' '.join(Lexer.tokens).encode('utf-8'))
+	for name in sorted(dir(Lexer)):
+		if not name.startswith('t_'):
+			continue
+		rule = getattr(Lexer, name)
+		if callable(rule):
+			rule = rule.__doc__ or ''
+		sig.update(('%s:%s' % (name, rule)).encode('utf-8'))
+	for name in sorted(dir(Parser)):
+		if name.startswith('p_'):
+			doc = getattr(Parser, name).__doc__ or ''
+			sig.update(('%s:%s' % (name, doc)).encode('utf-8'))
+
+	_grammar_hash = sig.hexdigest()[:16]
+	return _grammar_hash
+
+
+def table_names():
+	"""Return the ``(lextab, yacctab)`` module names for the current grammar."""
+	h = grammar_hash()
+	return 'jsdompl.lextab_%s' % h, 'jsdompl.yacctab_%s' % h
+
+
+class ParseContext(object):
+	"""State that only lives for a single :meth:`Parser.parse` call."""
+
+	def __init__(self):
+		# number of semicolons inserted by p_error
+		self.semi_count = 0
+
+		# https://github.com/rspivak/slimit/issues/29
+		# lexer.auto_semi can cause a loop in a parser
+		# when a parser error happens on a token right after
+		# a newline.
+		# We keep record of the tokens that caused p_error
+		# and if the token has already been seen - we raise
+		# a SyntaxError exception to avoid looping over and
+		# over again.
+		self.error_tokens = {}
+
+		# set while inside a {% %} block, they cannot be nested
+		self.in_js_stmt = False
 
 
 class Parser(object):
@@ -42,37 +110,79 @@ class Parser(object):
 	a relational expression with the `in` operator in a `for` statement.
 
 	'*nobf' stands for 'no brace or function'
+
+	Lexer and parser tables are loaded from the ``lextab_<hash>`` and
+	``yacctab_<hash>`` modules shipped with the package (see
+	:func:`grammar_hash`). They are generated into :data:`TABLES_DIR` on first
+	use if they are missing, and the parse tables are then shared
+	by every Parser created in the process.
+
+	A Parser can be reused for any number of templates: the lexer, the
+	tables and the ply parser object are kept, and every :meth:`parse` call
+	starts from a fresh :class:`ParseContext`. A Parser must not be used by
+	more than one thread at a time.
+
+	With `use_html5lib` the markup is tokenised by html5lib, which also
+	rejects templates that are not valid HTML (see :class:`Lexer`).
 	"""
 
-	def __init__(self, lex_optimize = True, lextab = lextab,
-				 yacc_optimize = True, yacctab = yacctab, yacc_debug = False):
+	def __init__(self, lex_optimize = True, lextab = None,
+				 yacc_optimize = True, yacctab = None, yacc_debug = False,
+				 use_html5lib = False):
+		default_lextab, default_yacctab = table_names()
+		if lextab is None:
+			lextab = default_lextab
+		if yacctab is None:
+			yacctab = default_yacctab
+
 		self.lex_optimize = lex_optimize
 		self.lextab = lextab
 		self.yacc_optimize = yacc_optimize
 		self.yacctab = yacctab
 		self.yacc_debug = yacc_debug
+		self.use_html5lib = use_html5lib
 
-		self.lexer = Lexer()
-		self.lexer.build(optimize = lex_optimize, lextab = lextab)
+		self.lexer = Lexer(use_html5lib = use_html5lib)
+		self.lexer.build(optimize = lex_optimize, lextab = lextab, outputdir = TABLES_DIR)
 		self.tokens = self.lexer.tokens
 
-		self.parser = ply.yacc.yacc(
-			module = self, optimize = yacc_optimize,
-			debug = yacc_debug, tabmodule = yacctab, start = 'program')
+		self.parser = self._build_parser()
 		
-		self.semi_count = 0
+		self.ctx = ParseContext()
 
-		# https://github.com/rspivak/slimit/issues/29
-		# lexer.auto_semi can cause a loop in a parser
-		# when a parser error happens on a token right after
-		# a newline.
-		# We keep record of the tokens that caused p_error
-		# and if the token has already been seen - we raise
-		# a SyntaxError exception to avoid looping over and
-		# over again.
-		self._error_tokens = {}
+	def _build_parser(self):
+		"""Return a ply LRParser bound to this instance.
+
+		The LALR tables are only computed (or read from the table module)
+		the first time; afterwards every Parser reuses the shared action
+		and goto tables and only binds its own rule methods.
+		"""
+		with _parse_tables_lock:
+			tables = _parse_tables.get(self.yacctab) if self.yacctab else None
+			
+			if tables is None or self.yacc_debug:
+				parser = ply.yacc.yacc(
+					module = self, optimize = self.yacc_optimize,
+					debug = self.yacc_debug, tabmodule = self.yacctab or 'yacctab',
+					outputdir = TABLES_DIR, write_tables = bool(self.yacctab),
+					start = 'program')
+				if self.yacctab:
+					_parse_tables[self.yacctab] = (
+						'LALR', parser.action, parser.goto, [
+							(prod.str, prod.name, prod.len, prod.func, prod.file, prod.line)
+							for prod in parser.productions
+						]
+					)
+				return parser
 		
-		self.in_js_stmt = False
+		lr_method, lr_action, lr_goto, productions = tables
+		lr = ply.yacc.LRTable()
+		lr.lr_method = lr_method
+		lr.lr_action = lr_action
+		lr.lr_goto = lr_goto
+		lr.lr_productions = [ply.yacc.MiniProduction(*prod) for prod in productions]
+		lr.bind_callables(dict((name, getattr(self, name)) for name in dir(self) if name.startswith('p_')))
+		return ply.yacc.LRParser(lr, self.p_error)
 
 	def _has_been_seen_before(self, token):
 		if token is None:
@@ -82,7 +192,7 @@ class Parser(object):
 			hash(key)
 		except TypeError:
 			key = str(key)
-		return key in self._error_tokens
+		return key in self.ctx.error_tokens
 
 	def _mark_as_seen(self, token):
 		if token is None:
@@ -93,7 +203,7 @@ class Parser(object):
 		except TypeError:
 			key = str(key)
 		
-		self._error_tokens[key] = True
+		self.ctx.error_tokens[key] = True
 
 	def _raise_syntax_error(self, token):
 		raise SyntaxError(
@@ -103,7 +213,7 @@ class Parser(object):
 			)
 	
 	def _has_stmt(self, node):
-		if hasattr(node, 'is_stmt'):
+		if getattr(node, 'is_stmt', False):
 			return True
 		if hasattr(node, '__iter__'):
 			ret = True
@@ -113,6 +223,12 @@ class Parser(object):
 		return False
 	
 	def parse(self, text, debug = False):
+		"""Parse a template and return its ast.Program.
+
+		Per-parse state is reset first, so the same Parser can be used
+		to parse one template after another.
+		"""
+		self.ctx = ParseContext()
 		return self.parser.parse(text, lexer = self.lexer, debug = debug)
 
 	def p_empty(self, p):
@@ -128,14 +244,14 @@ class Parser(object):
 		if self._has_been_seen_before(token):
 			self._raise_syntax_error(token)
 		
-		if self.semi_count:
+		if self.ctx.semi_count:
 			return None
 		
 		if token is None or token.type != 'SEMI':
 			next_token = self.lexer.auto_semi(token)
 			if next_token is not None:
 				# https://github.com/rspivak/slimit/issues/29
-				self.semi_count += 1
+				self.ctx.semi_count += 1
 				self._mark_as_seen(token)
 				self.parser.errok()
 				return next_token
@@ -166,7 +282,7 @@ class Parser(object):
 			dl = ast.HTMLDataList()
 			
 			for child in p[1]:
-				if hasattr(child, 'is_stmt'):
+				if getattr(child, 'is_stmt', False):
 					if len(dl):
 						result.append(dl)
 						dl = ast.HTMLDataList()
@@ -202,7 +318,7 @@ class Parser(object):
 	
 	def p_end_js(self, p):
 		""" end_js : JS_TERMINATOR """
-		self.in_js_stmt = False
+		self.ctx.in_js_stmt = False
 		
 
 	def p_statement(self, p):
@@ -1285,9 +1401,9 @@ class Parser(object):
 	
 	def p_js_check_in_stmt(self, p):
 		""" js_check_in_stmt : """
-		if self.in_js_stmt:
+		if self.ctx.in_js_stmt:
 			raise SyntaxError("Cannot nest {%%} blocks")
-		self.in_js_stmt = True
+		self.ctx.in_js_stmt = True
 	
 #	def p_html_source(self, p):
 #		""" html_source : html_source html_source_item
@@ -1315,7 +1431,7 @@ class Parser(object):
 		if isinstance(p[1], dict):
 			p[0] = ast.HTMLData(data = p[1]['data'])
 		else:
-			p[1] = ast.HTMLData(data = p[1])
+			p[0] = ast.HTMLData(data = p[1])
 	
 	def p_html_comment(self, p):
 		""" html_comment : HTML_COMMENT
@@ -1341,17 +1457,52 @@ class Parser(object):
 		p[0] = p[2] 
 	
 	def p_html_tag(self, p):
-		""" html_tag : HTML_STARTTAG source_elements HTML_ENDTAG
-		             | HTML_VOID_TAG
+		""" html_tag : HTML_STARTTAG html_attrs HTML_TAG_END source_elements HTML_ENDTAG
+		             | HTML_VOID_TAG html_attrs HTML_TAG_END
 		"""
 		
 		if isinstance(p[1], dict):
-			inner = None if len(p) < 3 else p[2]
+			inner = None if len(p) < 5 else p[4]
 			p[0] = ast.HTMLTag(
 					name = p[1]['name'],
 					self_closing = p[1]['self_closing'],
-					attrs = p[1]['attrs'],
+					attrs = p[2],
 					inner = inner,
-					void = len(p) == 2
+					void = len(p) == 4
 			)
 			p[0].is_stmt = True
+	
+	def p_html_attrs(self, p):
+		""" html_attrs : empty
+		               | html_attrs html_attr
+		"""
+		if len(p) == 2:
+			p[0] = []
+		else:
+			p[1].append(p[2])
+			p[0] = p[1]
+	
+	def p_html_attr(self, p):
+		""" html_attr : HTML_ATTR html_attr_value
+		"""
+		p[0] = ast.HTMLAttr(name = p[1], parts = p[2])
+	
+	def p_html_attr_value(self, p):
+		""" html_attr_value : empty
+		                    | html_attr_value html_attr_part
+		"""
+		if len(p) == 2:
+			p[0] = []
+		else:
+			p[1].append(p[2])
+			p[0] = p[1]
+	
+	def p_html_attr_part(self, p):
+		""" html_attr_part : HTML_ATTR_TEXT
+		                   | html_escaped_js
+		                   | html_embedded_js
+		"""
+		if isinstance(p[1], ast.Node):
+			p[0] = p[1]
+		else:
+			p[0] = ast.HTMLData(data = p[1])
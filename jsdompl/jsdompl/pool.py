@@ -0,0 +1,130 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import threading
+import time
+from contextlib import contextmanager
+
+from .parser import Parser
+
+class PoolTimeout(Exception):
+	pass
+
+class PoolStats(object):
+	""" Checkout counters of a ParserPool, times are in seconds
+	"""
+	def __init__(self):
+		self.created = 0
+		self.checkouts = 0
+		self.waits = 0
+		self.total_wait = 0.0
+		self.max_wait = 0.0
+
+	@property
+	def mean_wait(self):
+		if not self.checkouts:
+			return 0.0
+		return self.total_wait / self.checkouts
+
+	def as_dict(self):
+		return {
+			'created' : self.created,
+			'checkouts' : self.checkouts,
+			'waits' : self.waits,
+			'total_wait' : self.total_wait,
+			'max_wait' : self.max_wait,
+			'mean_wait' : self.mean_wait,
+		}
+
+	def __repr__(self):
+		return 'PoolStats({})'.format(self.as_dict())
+
+class ParserPool(object):
+	""" A bounded pool of warm Parsers (each with its own Lexer) that can be
+	shared between threads.
+
+	Parsers are created lazily, up to `size` of them. When they are all
+	checked out, `acquire` blocks until one is released, or until `timeout`
+	seconds have passed, in which case PoolTimeout is raised.
+
+	>>> pool = ParserPool(size = 4)
+	>>> with pool.parser() as p:
+	...     tree = p.parse(source)
+	"""
+
+	def __init__(self, size = 4, factory = Parser):
+		if size < 1:
+			raise ValueError("ParserPool size must be at least 1")
+		self.size = size
+		self.factory = factory
+		self.stats = PoolStats()
+
+		# released parsers, the most recently used last
+		self._idle = []
+		self._cond = threading.Condition(threading.Lock())
+
+	def acquire(self, timeout = None):
+		waited = None
+		with self._cond:
+			if not self._idle and self.stats.created >= self.size:
+				start = time.time()
+				end = None if timeout is None else start + timeout
+				while not self._idle and self.stats.created >= self.size:
+					remaining = None if end is None else end - time.time()
+					if remaining is not None and remaining <= 0:
+						raise PoolTimeout("No parser available after {}s".format(timeout))
+					self._cond.wait(remaining)
+				waited = time.time() - start
+
+			self.stats.checkouts += 1
+			if waited is not None:
+				self.stats.waits += 1
+				self.stats.total_wait += waited
+				self.stats.max_wait = max(self.stats.max_wait, waited)
+
+			if self._idle:
+				return self._idle.pop()
+			# reserve the slot, the parser is built outside of the lock
+			self.stats.created += 1
+
+		try:
+			return self.factory()
+		except BaseException:
+			with self._cond:
+				self.stats.created -= 1
+				self.stats.checkouts -= 1
+				# the slot is free again for a thread waiting on a full pool
+				self._cond.notify()
+			raise
+
+	def release(self, parser):
+		with self._cond:
+			self._idle.append(parser)
+			self._cond.notify()
+
+	@contextmanager
+	def parser(self, timeout = None):
+		p = self.acquire(timeout)
+		try:
+			yield p
+		finally:
+			self.release(p)
+
+	def parse(self, text, debug = False, timeout = None):
+		with self.parser(timeout) as p:
+			return p.parse(text, debug = debug)
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+def get_pool(size = 4):
+	""" Returns the process-wide ParserPool, creating it with `size` parsers
+	on first use.
+	"""
+	global _default_pool
+	with _default_pool_lock:
+		if _default_pool is None:
+			_default_pool = ParserPool(size)
+		return _default_pool
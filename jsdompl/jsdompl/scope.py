@@ -24,25 +24,38 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
-import itertools
-
 try:
 	from collections import OrderedDict
 except ImportError:
 	from odict import odict as OrderedDict
 
-from .htmllexer import Lexer
+from .jslexer import Lexer
 
 
 ID_CHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
-
-def powerset(iterable):
-	"""powerset('abc') -> a b c ab ac bc abc"""
-	s = list(iterable)
-	for chars in itertools.chain.from_iterable(
-		itertools.combinations(s, r) for r in range(1, len(s) + 1)
-		):
-		yield ''.join(chars)
+# characters that can follow the first one
+NAME_CHARS = ID_CHARS + '0123456789'
+
+# words a mangled name can't be, including the ones reserved in strict mode
+RESERVED_WORDS = frozenset(
+	[keyword.lower() for keyword in Lexer.keywords] + [
+	'implements', 'interface', 'let', 'package', 'private', 'protected',
+	'public', 'static', 'yield',
+	])
+
+def short_name(index):
+	"""Return the `index`th identifier, shortest first, in the order
+	a, b, ..., Z, aa, ba, ..., Z9, aaa, ...
+
+	`$` and `_` are left out, the generated code uses them as prefixes.
+	"""
+	name = ID_CHARS[index % len(ID_CHARS)]
+	index //= len(ID_CHARS)
+	while index:
+		index -= 1
+		name += NAME_CHARS[index % len(NAME_CHARS)]
+		index //= len(NAME_CHARS)
+	return name
 
 
 class SymbolTable(object):
@@ -72,7 +85,13 @@ class Scope(object):
 		# add ourselves as a child to the enclosing scope
 		if enclosing_scope is not None:
 			self.enclosing_scope.add_child(self)
-		self.base54 = powerset(ID_CHARS)
+		# index of the next short_name() to try, and the names mangled
+		# names can't take, see get_next_mangled_name()
+		self._next_name = 0
+		self._taken = None
+		# {name: symbol or None}, what resolve() found for a name from
+		# this scope
+		self._resolved = {}
 
 	def __contains__(self, sym):
 		return sym.name in self.symbols
@@ -84,44 +103,52 @@ class Scope(object):
 		self.symbols[sym.name] = sym
 		# track scope for every symbol
 		sym.scope = self
+		self._resolved.pop(sym.name, None)
 
 	def resolve(self, name):
-		sym = self.symbols.get(name)
-		if sym is not None:
-			return sym
-		elif self.enclosing_scope is not None:
-			return self.enclosing_scope.resolve(name)
+		"""Return the symbol `name` refers to in this scope, or None.
 
-	def get_enclosing_scope(self):
-		return self.enclosing_scope
+		Results are kept by every scope on the way to the one defining
+		the name, so each (scope, name) pair is only looked up once. The
+		scope tree is expected to be complete before names are resolved.
+		"""
+		resolved = self._resolved
+		if name in resolved:
+			return resolved[name]
 
-	def _get_scope_with_mangled(self, name):
-		"""Return a scope containing passed mangled name."""
+		path = []
 		scope = self
-		while True:
-			parent = scope.get_enclosing_scope()
-			if parent is None:
-				return
+		sym = None
+		while scope is not None:
+			if name in scope._resolved:
+				sym = scope._resolved[name]
+				break
+			path.append(scope)
+			sym = scope.symbols.get(name)
+			if sym is not None:
+				break
+			scope = scope.enclosing_scope
+
+		for scope in path:
+			scope._resolved[name] = sym
+		return sym
 
-			if name in parent.rev_mangled:
-				return parent
-
-			scope = parent
-
-	def _get_scope_with_symbol(self, name):
-		"""Return a scope containing passed name as a symbol name."""
-		scope = self
-		while True:
-			parent = scope.get_enclosing_scope()
-			if parent is None:
-				return
+	def get_enclosing_scope(self):
+		return self.enclosing_scope
 
-			if name in parent.symbols:
-				return parent
+	def _get_taken_names(self):
+		"""Return the names this scope can't mangle to without shadowing
+		a name it references from an enclosing scope.
 
-			scope = parent
+		Enclosing scopes are mangled first, so their names are known.
+		"""
+		taken = set()
+		for name, scope in self.refs.items():
+			if scope is not self:
+				taken.add(scope.mangled.get(name, name))
+		return taken
 
-	def get_next_mangled_name(self):
+	def get_next_mangled_name(self, reserved = ()):
 		"""
 		1. Do not shadow a mangled name from a parent scope
 		   if we reference the original name from that scope
@@ -131,29 +158,18 @@ class Scope(object):
 		   if it's not mangled and we reference it in this scope
 		   or any sub-scope.
 
-		"""
-		while True:
-			mangled = self.base54.next()
-
-			# case 1
-			ancestor = self._get_scope_with_mangled(mangled)
-			if (ancestor is not None
-				and self.refs.get(ancestor.rev_mangled[mangled]) is ancestor
-				):
-				continue
+		3. Do not use a name in `reserved`.
 
-			# case 2
-			ancestor = self._get_scope_with_symbol(mangled)
-			if (ancestor is not None
-				and self.refs.get(mangled) is ancestor
-				and mangled not in ancestor.mangled
-				):
-				continue
+		"""
+		if self._taken is None:
+			self._taken = self._get_taken_names()
 
-			# make sure a new mangled name is not a reserved word
-			if mangled.upper() in Lexer.keywords:
+		while True:
+			mangled = short_name(self._next_name)
+			self._next_name += 1
+			if (mangled in self._taken or mangled in RESERVED_WORDS or
+				mangled in reserved):
 				continue
-
 			return mangled
 
 
@@ -0,0 +1,184 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import errno
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import traceback
+
+try:
+	import socketserver
+except ImportError:
+	import SocketServer as socketserver
+
+from .cache import COMPILE_OPTIONS, MemoryCache
+from .pool import get_pool
+
+# A message is its length as a 4 byte big endian unsigned int, followed by
+# that many bytes of UTF-8 JSON
+_LENGTH = struct.Struct(str('>I'))
+
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+class ProtocolError(Exception):
+	pass
+
+def read_message(stream):
+	""" Reads one message from the file-like `stream`, returns the decoded
+	JSON or None at the end of the stream
+	"""
+	header = stream.read(_LENGTH.size)
+	if not header:
+		return None
+	if len(header) < _LENGTH.size:
+		raise ProtocolError("Truncated message header")
+	length, = _LENGTH.unpack(header)
+	if length > MAX_MESSAGE_SIZE:
+		raise ProtocolError("Message of {} bytes is over the limit of {}".format(length, MAX_MESSAGE_SIZE))
+	data = stream.read(length)
+	if len(data) < length:
+		raise ProtocolError("Truncated message")
+	try:
+		return json.loads(data.decode('utf-8'))
+	except ValueError as e:
+		raise ProtocolError("Invalid JSON: {}".format(e))
+
+def write_message(stream, message):
+	data = json.dumps(message, separators = (',', ':')).encode('utf-8')
+	stream.write(_LENGTH.pack(len(data)) + data)
+	stream.flush()
+
+class CompileHandler(socketserver.StreamRequestHandler):
+	""" Answers the requests of one client connection, one after the other.
+
+	Requests are JSON objects with an "op" and an optional "id" that is sent
+	back with the response:
+
+	- {"op": "compile", "source": "...", "options": {"minify": true}}
+	  answers {"ok": true, "code": "..."}
+	- {"op": "stats"} answers {"ok": true, "cache": {...}, "pool": {...}}
+	- {"op": "ping"} answers {"ok": true}
+
+	A request that fails answers {"ok": false, "error": "..."}.
+	"""
+
+	def handle(self):
+		while True:
+			try:
+				request = read_message(self.rfile)
+			except ProtocolError as e:
+				# the stream can't be trusted to be at a message boundary anymore
+				write_message(self.wfile, {'ok' : False, 'error' : "ProtocolError: {}".format(e)})
+				return
+			if request is None:
+				return
+			write_message(self.wfile, self.respond(request))
+
+	def respond(self, request):
+		if not isinstance(request, dict):
+			return {'ok' : False, 'error' : "Requests must be JSON objects"}
+		response = {'id' : request.get('id')}
+		try:
+			response.update(self.dispatch(request))
+			response['ok'] = True
+		except Exception:
+			response['ok'] = False
+			response['error'] = ''.join(traceback.format_exception_only(*sys.exc_info()[:2])).strip()
+		return response
+
+	def dispatch(self, request):
+		op = request.get('op', 'compile')
+		if op == 'compile':
+			options = request.get('options') or {}
+			unknown = set(options) - set(COMPILE_OPTIONS)
+			if unknown:
+				raise ValueError("Unknown options: {}".format(', '.join(sorted(unknown))))
+			source = request.get('source')
+			if not isinstance(source, type('')):
+				raise ValueError("'source' must be a string")
+			return {'code' : self.server.cache.compile(source, **dict((str(k), v) for k, v in options.items()))}
+		elif op == 'stats':
+			return {'cache' : self.server.cache.stats.as_dict(), 'pool' : get_pool().stats.as_dict()}
+		elif op == 'ping':
+			return {}
+		raise ValueError("Unknown op: {}".format(op))
+
+class CompileServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+	""" Compiles templates for the clients connected to the Unix socket at
+	`path`, each on its own thread, through `cache`, a MemoryCache.
+	"""
+	daemon_threads = True
+
+	def __init__(self, path, cache = None):
+		if cache is None:
+			cache = MemoryCache()
+		self.cache = cache
+		_remove_stale_socket(path)
+		socketserver.UnixStreamServer.__init__(self, path, CompileHandler)
+
+	def server_close(self):
+		socketserver.UnixStreamServer.server_close(self)
+		try:
+			os.remove(self.server_address)
+		except OSError:
+			pass
+
+def _remove_stale_socket(path):
+	""" Removes the socket at `path` if no server listens on it anymore,
+	raises an error if one does
+	"""
+	try:
+		mode = os.stat(path).st_mode
+	except OSError:
+		return
+	if not stat.S_ISSOCK(mode):
+		raise IOError(errno.EEXIST, "{} exists and is not a socket".format(path))
+	sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	try:
+		sock.connect(path)
+	except socket.error as e:
+		if e.args[0] not in (errno.ECONNREFUSED, errno.ENOENT):
+			raise
+		os.remove(path)
+	else:
+		raise IOError(errno.EADDRINUSE, "A server is already listening on {}".format(path))
+	finally:
+		sock.close()
+
+class Client(object):
+	""" A connection to a CompileServer, not thread-safe
+
+	>>> client = Client('/tmp/jsdompl.sock')
+	>>> code = client.compile(source, minify = True)
+	"""
+
+	def __init__(self, path):
+		self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		self.sock.connect(path)
+		self._file = self.sock.makefile('rwb')
+
+	def request(self, message):
+		write_message(self._file, message)
+		response = read_message(self._file)
+		if response is None:
+			raise ProtocolError("Connection closed by the server")
+		return response
+
+	def compile(self, source, **options):
+		""" Returns the module compiled from `source`, raises RuntimeError with
+		the error message of the server if it could not
+		"""
+		response = self.request({'op' : 'compile', 'source' : source, 'options' : options})
+		if not response['ok']:
+			raise RuntimeError(response['error'])
+		return response['code']
+
+	def close(self):
+		self._file.close()
+		self.sock.close()
@@ -1,14 +1,134 @@
 from __future__ import unicode_literals, division, absolute_import, print_function
 
 import re
-import parser
 from collections import OrderedDict
 
-from .utils import indent_text
+from .utils import LineIndenter
+
+try:
+	from io import StringIO
+except ImportError:
+	from StringIO import StringIO
 
 __author__ = "richard"
 __created__ = "Jun 28, 2013"
 
+# Helpers of the generated code, H() parses the HTML of a static subtree,
+# K() makes a keyed list of rows, see JSDomplVisitor.write_loop(), and R() a
+# region that can be built again, see JSDomplVisitor.write_region(). A module
+# only has those it uses, see JSDomplVisitor.helpers; they are declared
+# after the code that calls them, which declarations allow.
+RUNTIME = OrderedDict([
+	('H', """\
+	function H(html) {
+		var t = document.createElement('template');
+		t.innerHTML = html;
+		return t.content.firstChild;
+	}
+"""),
+	('K', """\
+	function K() {
+		var end = T('');
+		// the nodes of a row are those between its markers, the regions and
+		// lists at its top level change them
+		var nodes = function(row) {
+			var node = row.start, nodes = [node];
+			while (node !== row.end) {
+				node = node.nextSibling;
+				nodes.push(node);
+			}
+			return nodes;
+		};
+		var list = {
+			frag: F(),
+			rows: {},
+			seen: {},
+			order: [],
+			row: function(key, args, create) {
+				key = '$' + (key === null ? list.order.length : key);
+				if (list.seen.hasOwnProperty(key)) {
+					// a key used twice matches its rows by position
+					key = '#' + list.order.length;
+				}
+				var row = list.rows[key];
+				if (row === undefined) {
+					row = create();
+					row.start = T('');
+					row.end = T('');
+					row.fragment.insertBefore(row.start, row.fragment.firstChild);
+					row.fragment.appendChild(row.end);
+				}
+				else {
+					row.update.apply(null, args);
+				}
+				list.seen[key] = row;
+				list.order.push(row);
+			},
+			done: function() {
+				var parent = end.parentNode, next = end, key, row, rowNodes, i, j;
+				for (key in list.rows) {
+					if (list.rows.hasOwnProperty(key) && !list.seen.hasOwnProperty(key)) {
+						rowNodes = nodes(list.rows[key]);
+						for (i = 0; i < rowNodes.length; i++) {
+							parent.removeChild(rowNodes[i]);
+						}
+					}
+				}
+				// place the rows from the last one, rows already followed by
+				// the right node stay where they are
+				for (i = list.order.length - 1; i >= 0; i--) {
+					row = list.order[i];
+					if (row.end.nextSibling !== next) {
+						rowNodes = nodes(row);
+						for (j = 0; j < rowNodes.length; j++) {
+							parent.insertBefore(rowNodes[j], next);
+						}
+					}
+					next = row.start;
+				}
+				list.rows = list.seen;
+				list.seen = {};
+				list.order = [];
+			}
+		};
+		list.frag.appendChild(end);
+		return list;
+	}
+"""),
+	('R', """\
+	function R(build) {
+		var end = T('');
+		var region = {
+			frag: build(),
+			nodes: null,
+			render: function() {
+				var parent = end.parentNode, frag = build(), i;
+				for (i = 0; i < region.nodes.length; i++) {
+					parent.removeChild(region.nodes[i]);
+				}
+				region.nodes = Array.prototype.slice.call(frag.childNodes);
+				parent.insertBefore(frag, end);
+			}
+		};
+		region.nodes = Array.prototype.slice.call(region.frag.childNodes);
+		region.frag.appendChild(end);
+		return region;
+	}
+"""),
+])
+
+# whitespace that can go, around punctuation
+SQUEEZE_RE = re.compile(r'\s*([-+=<>!&|?:;,.(){}\[\]])\s*')
+
+def squeeze(code):
+	""" Returns the JS `code` of a helper on a single line, without its
+	comments and the whitespace around punctuation
+	"""
+	lines = (line.strip() for line in code.splitlines())
+	return SQUEEZE_RE.sub(r'\1', ' '.join(line for line in lines if not line.startswith('//'))) + '\n'
+
+RUNTIME_MIN = OrderedDict((name, squeeze(code)) for name, code in RUNTIME.items())
+
 class JSDomTemplate(object):
 	
 	tpl = """\
@@ -16,241 +136,77 @@ define([{requirements}], function({require_args}) {{
 	var C = document.createElement;
 	var T = document.createTextNode;
 	var F = document.createDocumentFragment;
-	
 	function $Template({tpl_args}) {{
 {tpl_body}
 	}}
-	return $Template;
+{tpl_statics}{runtime}	return $Template;
 }});"""
 	
 	def __init__(self, text):
 		self.text = text
-		self.node_counts = {}
-		
-		self.needed_args = OrderedDict()
-		self.tpl_vars = []
-		self.text_vars = {}
-		
-		self.state_stack = []
-		self.output = ''
-		self.root_stack = []
-		self.var_name = ''
 	
 	def get_template(self):
-		self._walk_doc()
-		return self.tpl.format(
-			requirements = ', '.join("'{}'".format(arg) for arg in self.needed_args.keys()),
-			require_args = ', '.join(arg for arg in self.needed_args.values()),
-			tpl_args = ', '.join(arg for arg in self.tpl_vars),
-			
-			tpl_body = indent_text(self.output, 2)
-		)
-	
-	def _get_var(self, name):
-		self.node_counts.setdefault(name.lower(), -1)
-		self.node_counts[name.lower()] += 1
-		
-		return "_{}{}".format(name.lower(), self.node_counts[name.lower()])
-	
-	def _get_text_var(self):
-		return self._get_var('$text')
-	
-	def _get_root(self):
-		return self._get_var('$root')
-	
-	@property
-	def root(self):
-		return self.root_stack[-1]
-	
-	def _push_root(self, r):
-		self.root_stack.append(r)
-	
-	def _pop_root(self):
-		self.root_stack.pop()
-	
-	def _append(self, name):
-		self.output += '{}.appendChild({});\n'.format(self.root, name)
-	
-	@property
-	def state(self):
-		return self.state_stack[-1]
-	
-	def _switch(self, state):
-		if len(self.state_stack) and self.state == 'html':
-			self.output += '");\n'
-			#self.output += "\n"
-			self.state_stack.pop()
-		
-		self.state_stack.append(state)
-		if state == 'html':
-			self.output += 'var {} = T("'.format(self._get_text_var())
-		
-		elif state == 'js expression':
-			self.output += ');\n'
-		
-		elif state == 'js escaped expression':
-			self.output += ');\n'
-	
-	def _walk_doc(self):
-		doc = self._get_root()
-		self.output += 'var {} = F();\n'.format(doc)
-		self._push_root(doc)
-		self._switch('html')
-		
-		for child in self.doc.childNodes:
-			if child.nodeType == child.COMMENT_NODE:
-				comment_data = child.nodeValue.strip()
-				
-				if re.match(r'^\s*define\([^\)]*\)\s*$', comment_data):
-					st = parser.expr(comment_data)
-					c = st.compile()
-					ret = eval(c, {'define' : lambda x:x})
-					if not isinstance(ret, dict):
-						raise Exception("Found a require() comment that does not specify a dict")
-					self.needed_args = OrderedDict(ret)
-				
-				elif re.match(r'^\s*Template\([^\)]*\)\s*$', comment_data):
-					st = parser.expr(comment_data)
-					c = st.compile()
-					ret = eval(c, {'Template' : lambda *args: list(args)})
-					if not isinstance(ret, list):
-						raise Exception("Found a Template() comment that does not specify a list of globals")
-					self.tpl_vars = ret
-					
-			else:
-				self._walk_node(child)
-		
-		self.output += 'return {};\n'.format(doc)
-	
-	def _walk_children(self, node):
-		
-		for child in node.childNodes:
-			node_name = self._walk_node(child)
-			if node_name:
-				self._append(node_name)
-	
-	def _walk_node(self, node):
-		name = node.nodeName.lower()
-		node_var = self._get_var(name)
-		if name != '#text' and name.startswith('#'):
-			# ignore
-			return '', ''
-		
-		if name == '#text':
-			self._switch('html')
-			self._parse_text_node_value(node.data)
-			return ''
-		else:
-			s = self.state
-			self._switch('js')
-			self.output += 'var ${} = C("{}");\n'.format(node_var, name)
-			self._switch(s)
-		self._push_root(node_var)
-		self._walk_children(node)
-		self._pop_root()
-		
-		self._append(node_var)
-		
-		return node_var
-	
-	def _parse_text_node_value(self, value):
-		""" Returns the javascript conversion of the textnode
-		"""
-		i = 0
-		
-		# State 1 - html
-		# State 2 - html string
-		# State 3 - js
-		# State 4 - js expression
-		# State 5 - js string
-		
-		
-		while i < len(value):
-			c = value[i]
-			
-			if self.state == 'html':
-				if c == '{':
-					c2 = value[i + 1]
-					if c2 == '{': # possibly an expression escape
-						c3 = value[i + 2]
-						if c3 == '{':
-							# Non escape expression
-							self._switch('js expression')
-							
-							self.output += ');\n';
-							self._append(self.var_name)
-							self.var_name = self._get_var('$tmp')
-							self.output += 'var {} = ('.format(self.var_name)
-							
-							i += 3
-							continue
-						else:
-							# expression escape
-							self._switch('js escape expression')
-							self.output += ');\n'
-							self._append(self.var_name)
-							self.var_name = self._get_var('$tmp')
-							self.output += 'var {} = _.escape('.format(self.var_name)
-							i += 2
-							continue
-					
-					elif c2 == '%': # js code
-						self.output += '");\n'
-						self._append(self.var_name)
-						
-						self._switch('js')
-						i += 2
-						continue
-				elif c == '"':
-					self.output += '\\"'
-				
-				elif c == '\n':
-					self.output += '\\n'
-				
-				else:
-					self.output += c
-			
-			elif self.state == 'js':
-				if c == '%':
-					c2 = value[i + 1]
-					if c == '}':
-						self.output += '");\nvar {} = T("'.format(self._get_text_var())
-						i += 2
-						self._switch('html')
-					else:
-						self.output += c
-				else:
-					self.output += c
-			
-			elif self.state == 'js expression':
-				
-				if c == '}':
-					c2 = value[i + 1]
-					if c == '}':
-						c3 = value[i + 2]
-						if c3 == '}':
-							i += 3
-							self._append(self.var_name)
-							self._switch('html')
-						else:
-							raise Exception("Unexpected '}}' in unescaped expression")
-					else:
-						raise Exception("Unexpected '}' in unescaped expression `{}`".format(value))
-				else:
-					self.output += c
-			
-			elif self.state == 'js escape expression':
-				
-				if c == '}':
-					c2 = value[i + 1]
-					if c == '}':
-						self.output += ');\nvar {} = T("'.format(self._get_text_var())
-						i += 2
-						self._switch('html')
-					else:
-						raise Exception("Unexpected '}' in escaped expression in `{}`".format(value))
-				else:
-					self.output += c
-			
-			i += 1
-		
+		# compiled once per process, see cache.MemoryCache
+		from .cache import compile
+		return compile(self.text)
+
+def compile_to(stream, source, js_parser = None, strategy = 'auto', update = False, minify = False, tree = None):
+	""" Compiles the template `source` and writes the resulting AMD module to
+	`stream`, a text file-like object (anything with a write() method that
+	takes unicode).
+	
+	The prelude is written first, then the body of the template function
+	as it is generated, then the footer; at no point is the whole module held
+	in memory. `strategy`, `update` and `minify` are passed on to
+	JSDomplVisitor. When the caller already has the parse of `source`, it
+	can be given as `tree` (which code generation modifies) to skip parsing.
+	"""
+	from .parser import Parser
+	from .visitors.jsdomplvisitor import JSDomplVisitor
+	
+	if js_parser is None:
+		js_parser = Parser()
+	if tree is None:
+		tree = js_parser.parse(source)
+	
+	body = LineIndenter(stream, '' if minify else '\t\t')
+	visitor = JSDomplVisitor(js_parser = js_parser, stream = body, strategy = strategy, update = update, minify = minify)
+	visitor.read_directives(tree)
+	
+	head, tail = JSDomTemplate.tpl.split('{tpl_body}')
+	middle, tail = tail.split('{tpl_statics}')
+	stream.write(head.format(
+		requirements = ', '.join("'{}'".format(arg) for arg in visitor.needed_args.keys()),
+		require_args = ', '.join(visitor.js_name(arg) for arg in visitor.needed_args.values()),
+		tpl_args = ', '.join(visitor.js_name(arg) for arg in visitor.tpl_vars),
+	))
+	
+	visitor.visit(tree)
+	visitor.write_update()
+	body.write('return {};'.format(visitor.result()))
+	body.flush()
+	
+	# the template function can only be called once the module is loaded,
+	# so the static subtrees can be built after it
+	stream.write(middle.format())
+	statics = LineIndenter(stream, '' if minify else '\t')
+	visitor.write_statics(statics)
+	statics.flush()
+	runtime = RUNTIME_MIN if minify else RUNTIME
+	stream.write(tail.format(runtime = ''.join(
+		code for name, code in runtime.items() if name in visitor.helpers)))
+
+def minify_savings(source, js_parser = None, **options):
+	""" Returns the size in bytes of the module compiled from `source`, and
+	its size with `minify`. Other options are passed on to compile_to().
+	"""
+	from .parser import Parser
+	
+	if js_parser is None:
+		js_parser = Parser()
+	sizes = []
+	for minify in (False, True):
+		out = StringIO()
+		compile_to(out, source, js_parser = js_parser, minify = minify, **options)
+		sizes.append(len(out.getvalue().encode('utf-8')))
+	return tuple(sizes)
@@ -1 +1,2 @@
 from .text import indent_text
+from .writer import CodeWriter, LineIndenter
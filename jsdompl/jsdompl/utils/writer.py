@@ -0,0 +1,78 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+
+class CodeWriter(object):
+	""" Collects generated code as a list of chunks, so that code can be
+	emitted in time linear to its size instead of being concatenated once
+	per level of nesting.
+
+	The writer also keeps the indentation level. Output can be diverted
+	into a temporary buffer with begin_capture()/end_capture() when a
+	caller needs to look at a (small) piece of code before emitting it.
+
+	When `stream` is given, code is written to it as it is produced
+	instead of being kept in memory.
+	"""
+
+	def __init__(self, indent_str = '\t', stream = None):
+		self.parts = []
+		self.stream = stream
+		self.indent_level = 0
+		self.indent_str = indent_str
+		self._indents = ['']
+		self._captures = []
+
+	def write(self, text):
+		if self._captures:
+			self._captures[-1].append(text)
+		elif self.stream is not None:
+			self.stream.write(text)
+		else:
+			self.parts.append(text)
+
+	def indent(self):
+		level = self.indent_level
+		while len(self._indents) <= level:
+			self._indents.append(self._indents[-1] + self.indent_str)
+		return self._indents[level]
+
+	def begin_capture(self):
+		self._captures.append([])
+
+	def end_capture(self):
+		return ''.join(self._captures.pop())
+
+	def getvalue(self):
+		return ''.join(self.parts)
+
+
+class LineIndenter(object):
+	""" A file-like wrapper that prefixes every line written to `stream`
+	with `margin`, only holding on to the line currently being written.
+	Lines with nothing but whitespace are written empty.
+	"""
+
+	def __init__(self, stream, margin):
+		self.stream = stream
+		self.margin = margin
+		self._line = []
+
+	def write(self, text):
+		lines = text.split('\n')
+		self._line.append(lines[0])
+		for line in lines[1:]:
+			self._write_line()
+			self.stream.write('\n')
+			self._line.append(line)
+
+	def _write_line(self):
+		line = ''.join(self._line)
+		self._line = []
+		if line.strip():
+			self.stream.write(self.margin + line)
+
+	def flush(self):
+		self._write_line()
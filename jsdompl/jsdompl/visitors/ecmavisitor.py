@@ -25,9 +25,10 @@
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
 from .. import ast
+from .nodevisitor import DispatchVisitor
 
 
-class ECMAVisitor(object):
+class ECMAVisitor(DispatchVisitor):
 
 	def __init__(self):
 		self.indent_level = 0
@@ -35,10 +36,6 @@ class ECMAVisitor(object):
 	def _make_indent(self):
 		return '\t' * self.indent_level
 
-	def visit(self, node):
-		method = 'visit_%s' % node.__class__.__name__
-		return getattr(self, method, self.generic_visit)(node)
-
 	def generic_visit(self, node):
 		return 'GEN: %r' % node
 
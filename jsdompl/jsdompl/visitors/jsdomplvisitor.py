@@ -8,506 +8,1500 @@ import parser
 from collections import OrderedDict
 
 from .. import ast
+from ..utils import CodeWriter
+from ..scope import short_name
+from .nodevisitor import SteppingVisitor, preorder, walk
+from .scopevisitor import free_names, mangle
 
-class Visitor(object):
-	def visit(self, node):
-		method = 'visit_%s' % node.__class__.__name__
-		return getattr(self, method, self.generic_visit)(node)
+# Elements the HTML parser builds as written, as long as the content models
+# below hold, so that a subtree of them can be parsed from its HTML. Tables,
+# lists of options, foreign content (svg, math), elements whose content is
+# text (title, textarea, script, noscript, iframe...) and elements the parser
+# renames or whose first newline it drops (image, pre) are built node by node.
+TEMPLATE_SAFE = frozenset([
+	'a', 'abbr', 'address', 'article', 'aside', 'audio', 'b', 'bdi', 'bdo',
+	'blockquote', 'br', 'button', 'canvas', 'cite', 'code', 'data', 'dd',
+	'del', 'details', 'dfn', 'dialog', 'div', 'dl', 'dt', 'em', 'fieldset',
+	'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5',
+	'h6', 'header', 'hgroup', 'hr', 'i', 'img', 'input', 'ins', 'kbd',
+	'label', 'legend', 'li', 'main', 'mark', 'meter', 'nav', 'ol', 'output',
+	'p', 'picture', 'progress', 'q', 's', 'samp', 'section', 'small',
+	'source', 'span', 'strong', 'sub', 'summary', 'sup', 'time', 'track',
+	'u', 'ul', 'var', 'video', 'wbr',
+])
 
-	def generic_visit(self, node):
-#		if node is None:
-#			return ''
-#		return 'GEN: {}'.format(node)
-		if node is None:
-			return ''
-		if isinstance(node, list):
-			return '\n'.join(
-				self.visit(child) for child in node
-			)
-		else:
-			return '\n'.join (
-				self.visit(child) for child in node.children()
-			)
-				
-
-class JSDomplVisitor(Visitor):
-	def __init__(self, js_parser = None):
-		self.indent_level = 0
+# Start tags that close an open <p>
+CLOSES_P = frozenset([
+	'address', 'article', 'aside', 'blockquote', 'center', 'details',
+	'dialog', 'dir', 'div', 'dl', 'dd', 'dt', 'fieldset', 'figcaption',
+	'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+	'hgroup', 'hr', 'li', 'listing', 'main', 'menu', 'nav', 'ol', 'p',
+	'plaintext', 'pre', 'section', 'summary', 'table', 'ul', 'xmp',
+])
+
+HEADINGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# The tags an element can't have below it without the parser closing it
+# first. Some of these only close it in certain contexts (<li> in a nested
+# list doesn't), all of them are avoided.
+CONTENT_CONFLICTS = {
+	'p' : CLOSES_P,
+	'a' : frozenset(['a']),
+	'button' : frozenset(['button']),
+	'form' : frozenset(['form']),
+	'li' : frozenset(['li']),
+	'dd' : frozenset(['dd', 'dt']),
+	'dt' : frozenset(['dd', 'dt']),
+}
+for _heading in HEADINGS:
+	CONTENT_CONFLICTS[_heading] = HEADINGS
+
+# Below this many DOM calls, building a static subtree is cheaper than
+# parsing it from a string
+TEMPLATE_MIN_CALLS = 16
+
+def html_text(data):
+	return data.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+def html_attr(data):
+	return data.replace('&', '&amp;').replace('\\"', '&quot;')
+
+def inner_tags(node, done):
+	""" The HTMLTags right inside `node` whose id isn't a key of `done`
+	"""
+	return [child for child in node.inner or [] if isinstance(child, ast.HTMLTag) and id(child) not in done]
+
+# Names that are left to the JS environment rather than taken as template
+# arguments
+JS_GLOBALS = frozenset([
+	'Array', 'Boolean', 'Date', 'Error', 'Function', 'Infinity', 'JSON',
+	'Map', 'Math', 'NaN', 'Number', 'Object', 'Promise', 'RangeError',
+	'RegExp', 'Set', 'String', 'Symbol', 'SyntaxError', 'TypeError',
+	'WeakMap', 'arguments', 'clearInterval', 'clearTimeout', 'console',
+	'decodeURI', 'decodeURIComponent', 'document', 'encodeURI',
+	'encodeURIComponent', 'isFinite', 'isNaN', 'location', 'navigator',
+	'parseFloat', 'parseInt', 'setInterval', 'setTimeout', 'undefined',
+	'window',
+])
+
+# Names the generated code uses as is, that mangled names must not take
+RUNTIME_NAMES = frozenset(['C', 'T', 'F', 'H', 'K', 'R', 'escape'])
+
+# Statements that may run their body any number of times
+LOOP_STATEMENTS = (ast.For, ast.ForIn, ast.While, ast.DoWhile)
+
+def mutated_names(tree):
+	""" Returns the names `tree` assigns to or declares more than once, and
+	the names of the objects it may change in place: those it sets a
+	property of, calls a method of or passes to a function
+	"""
+	names, declared = set(), set()
+	
+	def add(node):
+		while isinstance(node, (ast.DotAccessor, ast.BracketAccessor)):
+			node = node.node
+		if isinstance(node, ast.VarDecl):
+			node = node.identifier
+		if isinstance(node, ast.Identifier):
+			names.add(node.value)
+	
+	for node in preorder(tree):
+		if isinstance(node, ast.Assign):
+			# also the properties of object literals
+			if node.op != ':':
+				add(node.left)
+		elif isinstance(node, ast.UnaryOp):
+			if node.op in ('++', '--', 'delete'):
+				add(node.value)
+		elif isinstance(node, ast.ForIn):
+			add(node.item)
+		elif isinstance(node, (ast.FunctionCall, ast.NewExpr)):
+			if node.identifier.safe:
+				# escape() of a {{ }}, which leaves its argument alone
+				continue
+			if isinstance(node.identifier, (ast.DotAccessor, ast.BracketAccessor)):
+				add(node.identifier.node)
+			for arg in node.args:
+				if isinstance(arg, ast.Identifier):
+					add(arg)
+		elif isinstance(node, ast.VarDecl):
+			if node.identifier.value in declared:
+				add(node)
+			declared.add(node.identifier.value)
+	return frozenset(names)
+
+class UpdateFrame(object):
+	""" What an update function does, as (code, deps) in document order: the
+	{% %} statements it runs again, the texts and attributes it patches, the
+	regions it builds again and the lists it reconciles. deps are the
+	arguments the code depends on, None to run it on every update.
+	
+	`args` are the names the update function takes, None for the template
+	arguments, `names` the ones it adds to those of its parent (the loop
+	variables of a row). `locals` are the arguments each variable the
+	frame's {% %} statements declare depends on.
+	"""
+	def __init__(self, args = None, names = ()):
+		self.args = args
+		self.names = names
+		self.actions = []
+		self.locals = {}
+		self.js_depth = 0
+
+class JSDomplVisitor(SteppingVisitor):
+	""" Emits the DOM building code for a template.
+
+	Every visit_* method writes its code to `self.out`, a CodeWriter, instead
+	of returning a string, so the cost of emitting a node no longer grows
+	with the depth it is nested at. Use render() to get the code of a tree,
+	or pass a `stream` to have the code written to it as it is produced.
+	
+	With `hoist_statics`, tags whose whole subtree is static are built once
+	by write_statics(), and only cloned by the template function.
+	
+	`strategy` picks how tags are built: 'dom' always uses one call per
+	node, 'template' parses the HTML of every subtree it can into a
+	<template> once and then only fills in the dynamic holes of a clone, and
+	'auto' picks whichever makes fewer DOM calls per subtree. The <template>s
+	are parsed once, outside of the template function, so they are only used
+	with `hoist_statics`.
+	
+	With `update`, the template function returns {fragment, update} instead
+	of the fragment, update() takes new template arguments and patches the
+	texts and attributes outside of {% %} blocks that depend on the ones
+	that changed. Arguments are compared by identity. Variables declared in
+	{% %} blocks are followed back to the arguments they are computed from,
+	and their declarations run again when those change; a variable that is
+	assigned, or an object that may be changed in place, is taken to change
+	on every update. A {% %} statement that builds DOM, such as an `if`, is
+	a region that is built again when what it reads changes.
+	
+	In update mode, loops are also reconciled: a call taking a callback
+	(`_.each(list, function(idx, item) { ... })`), `for` and `for in`
+	statements that build DOM get one row per iteration, and update() runs
+	the loop again, patching the rows it keeps, moving them and removing the
+	ones it didn't see. Rows are matched by the `key` attribute of the first
+	tag of the loop body, or by position. The key can use the variables the
+	statements starting the loop body declare, before any DOM. `key`
+	attributes are never rendered, in any mode.
+	
+	With `minify`, the compiler temporaries and the variables the template
+	declares get the shortest names that are free, and the code isn't
+	indented. Template arguments and define()d names are kept, they are
+	what callers see.
+	"""
+	def __init__(self, js_parser = None, stream = None, hoist_statics = True, strategy = 'auto', update = False, minify = False):
+		if strategy not in ('auto', 'dom', 'template'):
+			raise ValueError("Unknown strategy {!r}".format(strategy))
+		self.minify = minify
+		self.out = CodeWriter(indent_str = '' if minify else '\t', stream = stream)
+		self.hoist_statics = hoist_statics
+		self.strategy = strategy
+		self._costs = {}
+		self._tags = {}
+		self.update = update
+		self.frames = [UpdateFrame()]
+		self._rows = {}
+		# {id(tag): its `key` attribute}
+		self._keys = {}
+		self.unstable = frozenset()
+		# declarations are assignments, in regions
+		self.assign_vars = False
+		self.list_count = -1
+		self.region_count = -1
+		self.statics = []
+		# the runtime helpers (H, K, R) the generated code calls
+		self.helpers = set()
 		self.root_count = -1
 		self.text_count = -1
+		self.static_count = -1
+		self.hole_count = -1
 		self.roots = []
 		self.html_count = -1
 		
 		self.children_to_add = [[]]
 		
 		self.needed_args = OrderedDict()
-		self.tpl_args = []
+		self.tpl_vars = []
+		self.program_root = None
+		self.mangled = frozenset()
+		self._temps = {}
 		
 		self.root_map = {}
 		
 		if js_parser is None:
 			from jsdompl.parser import Parser
-			js_parser = Parser(lex_optimize = False, lextab = '', yacc_optimize = False, yacctab = '', yacc_debug = False)
+			js_parser = Parser()
 		
 		self.p = js_parser
 	
+	@property
+	def indent_level(self):
+		return self.out.indent_level
+	
+	@indent_level.setter
+	def indent_level(self, value):
+		self.out.indent_level = value
+	
+	def render(self, node):
+		self.read_directives(node)
+		# the body clones the static subtrees, they are built first
+		self.out.begin_capture()
+		self.visit(node)
+		self.write_update()
+		body = self.out.end_capture()
+		self.write_statics()
+		self.write(body)
+		return self.out.getvalue()
+	
+	def js_name(self, name):
+		""" The name a template variable has in the generated code
+		"""
+		if name in self.mangled:
+			return name
+		return "$_{}".format(name)
+	
+	def temp(self, name):
+		""" The name of the compiler temporary `name` in the generated code
+		"""
+		if not self.minify:
+			return '$${}'.format(name)
+		short = self._temps.get(name)
+		if short is None:
+			short = self._temps[name] = '${}'.format(short_name(len(self._temps)))
+		return short
+	
+	def bind(self, node, var_name, attr_name = None):
+		""" Remembers the text or attribute whose code has just been captured
+		for the update function, when `node` isn't inside a {% %} block
+		"""
+		code = self.out.end_capture()
+		self.write(code)
+		frame = self.frames[-1]
+		if self.update and not frame.js_depth and not node.is_static():
+			if attr_name is None:
+				code = '{}.data = {};'.format(var_name, code)
+			else:
+				code = '{}.setAttribute("{}", {});'.format(var_name, attr_name, code)
+			self.add_action(code, self.deps(node))
+	
+	def add_action(self, code, deps):
+		""" Has the update function of the current frame run `code` when the
+		arguments in `deps` change, always if it is None
+		"""
+		if deps is None or deps:
+			self.frames[-1].actions.append((code, deps))
+	
+	def names_read(self, node):
+		""" The names `node` references without defining, leaving the scopes
+		read_directives() gave to its identifiers alone
+		"""
+		scoped = [child for child in preorder(node) if getattr(child, 'scope', None) is not None]
+		scopes = [child.scope for child in scoped]
+		try:
+			return free_names(node)
+		finally:
+			for child, scope in zip(scoped, scopes):
+				child.scope = scope
+	
+	def name_deps(self, name):
+		""" Returns the arguments of the current frame that the value of the
+		variable `name` depends on, or None if it may change without them
+		"""
+		for frame in reversed(self.frames):
+			if name in frame.locals:
+				return frame.locals[name]
+			if name in (self.tpl_vars if frame.args is None else frame.names):
+				return None if name in self.unstable else set([name])
+		if name in JS_GLOBALS or name in self.needed_args.values():
+			return set()
+		# declared where its value isn't followed
+		return None
+	
+	def deps(self, node):
+		""" Returns the arguments of the current frame that the value of
+		`node` depends on, or None if it may change without them
+		"""
+		deps = set()
+		for name in self.names_read(node):
+			name_deps = self.name_deps(name)
+			if name_deps is None:
+				return None
+			deps.update(name_deps)
+		return deps
+	
+	def define(self, name, deps):
+		""" Declares the variable `name` in the current frame
+		"""
+		self.frames[-1].locals[name] = None if name in self.unstable else deps
+	
+	def frame_args(self, frame = None):
+		frame = frame or self.frames[-1]
+		if frame.args is None:
+			return list(self.tpl_vars)
+		return frame.args
+	
+	def write_update(self):
+		""" Writes the update function of the current frame, in update mode
+		"""
+		if not self.update:
+			return
+		frame = self.frames[-1]
+		names = self.frame_args(frame)
+		args = [self.js_name(arg) for arg in names]
+		# the arguments are updated in place, for the closures of the frame,
+		# but those of a row are shared with the loop, which has already
+		# updated them; a row keeps the ones it was given
+		last = args
+		if frame.args is not None:
+			last = ['{}[{}]'.format(self.temp('args'), index) for index in range(len(args))]
+			self.write('{}var {} = [{}];\n'.format(self.indent(), self.temp('args'), ', '.join(args)))
+		self.write('{}var {} = function() {{\n'.format(self.indent(), self.temp('update')))
+		self.indent_level += 1
+		for index, arg in enumerate(last):
+			self.write('{}var {} = arguments[{}] !== {};\n'.format(self.indent(), self.temp('changed{}'.format(index)), index, arg))
+		for index, (arg, last_arg) in enumerate(zip(args, last)):
+			if arg == last_arg:
+				self.write('{}{} = arguments[{}];\n'.format(self.indent(), arg, index))
+			else:
+				self.write('{}{} = {} = arguments[{}];\n'.format(self.indent(), arg, last_arg, index))
+		
+		for code, deps in frame.actions:
+			if deps is None:
+				self.write('{}{}\n'.format(self.indent(), code))
+				continue
+			flags = [
+				self.temp('changed{}'.format(index))
+				for index, name in enumerate(names) if name in deps
+			]
+			self.write('{}if ({}) {{\n'.format(self.indent(), ' || '.join(flags)))
+			self.indent_level += 1
+			self.write('{}{}\n'.format(self.indent(), code))
+			self.indent_level -= 1
+			self.write('{}}}\n'.format(self.indent()))
+		self.indent_level -= 1
+		self.write('{}}};\n'.format(self.indent()))
+	
+	def loop_body(self, node):
+		""" Returns (body, names) for a statement that loops over DOM building
+		code, where body is the FuncExpr or statement run per iteration and
+		names are the loop variables, or None
+		"""
+		if isinstance(node, ast.ExprStatement) and isinstance(node.expr, ast.FunctionCall):
+			args = node.expr.args
+			if args and isinstance(args[-1], ast.FuncExpr):
+				body = args[-1]
+				names = [param.value for param in body.parameters]
+			else:
+				return None
+		elif isinstance(node, ast.For) and isinstance(node.statement, ast.Block):
+			body = node.statement
+			names = []
+			if isinstance(node.init, ast.VarStatement):
+				names = [decl.identifier.value for decl in node.init]
+		elif isinstance(node, ast.ForIn) and isinstance(node.statement, ast.Block):
+			body = node.statement
+			item = node.item
+			names = [(item.identifier if isinstance(item, ast.VarDecl) else item).value]
+		else:
+			return None
+		
+		if not any(isinstance(child, (ast.HTMLTag, ast.HTMLDataList)) for child in preorder(body)):
+			return None
+		if self.jumps_out(body):
+			# a row is built in its own function
+			return None
+		return body, names
+	
+	def jumps_out(self, body):
+		""" True if a loop body has a break, continue or return that isn't
+		inside a function of its own
+		"""
+		stack = list(body.elements) if isinstance(body, ast.FuncExpr) else [body]
+		while stack:
+			node = stack.pop()
+			if isinstance(node, list):
+				stack.extend(node)
+			elif isinstance(node, (ast.Break, ast.Continue, ast.Return)):
+				return True
+			elif node is not None and not isinstance(node, (ast.FuncExpr, ast.FuncDecl)):
+				stack.extend(node)
+		return False
+	
+	def row_key(self, elements):
+		""" Returns the code of the `key` attribute of the first tag of a loop
+		body, or 'null' to match rows by position, and the names it reads.
+		Rows whose key was already used are matched by position too.
+		"""
+		for element in elements:
+			if isinstance(element, ast.HTMLTag):
+				attr = self._keys.get(id(element))
+				if attr is not None:
+					self.out.begin_capture()
+					self.run(self.write_all([
+						# the key isn't text, don't escape it
+						part.args[0] if isinstance(part, ast.FunctionCall) and getattr(part.identifier, 'safe', False) else part
+						for part in attr.parts
+					], ' + '))
+					return self.out.end_capture() or 'null', set(self.names_read(attr))
+				break
+		return 'null', set()
+	
+	def body_vars(self, elements):
+		""" Returns the names the statements of a loop body declare
+		"""
+		return set(self.declared_vars(elements)).union(
+			element.identifier.value for element in elements if isinstance(element, ast.FuncDecl))
+	
+	def row_statements(self, elements, key_names):
+		""" Returns how many of the statements starting a loop body run before
+		its row is matched, so that its key can use the variables they
+		declare: none, unless it does. Raises SyntaxError for a key using a
+		variable declared after DOM is built.
+		"""
+		used = key_names & self.body_vars(elements)
+		if not used:
+			return 0
+		leading = 0
+		for element in elements:
+			if any(isinstance(child, (ast.HTMLTag, ast.HTMLDataList, ast.HTMLJSContainer)) for child in preorder(element)):
+				break
+			leading += 1
+		late = used - self.body_vars(elements[:leading])
+		if late:
+			raise SyntaxError("The key of a row can't use {}, declared after the row starts".format(', '.join(sorted(late))))
+		return leading
+	
+	def write_loop(self, node, body, names):
+		""" Writes a loop whose iterations each build a row of a reconciled
+		list. The loop is wrapped in a function taking the frame's arguments
+		so that the update function can run it again.
+		"""
+		list_var = self.make_list()
+		loop_var = self.temp('loop{}'.format(self.list_count))
+		args = [self.js_name(arg) for arg in self.frame_args()]
+		
+		self.helpers.add('K')
+		self.write('var {} = K();\n'.format(list_var))
+		self.add_child('{}.frag'.format(list_var))
+		self.write('{}var {} = function({}) {{\n'.format(self.indent(), loop_var, ', '.join(args)))
+		self.indent_level += 1
+		elements = list(body.elements if isinstance(body, ast.FuncExpr) else body)
+		key, key_names = self.row_key(elements)
+		leading = self.row_statements(elements, key_names)
+		# the row takes the variables they declare as loop variables
+		names = names + sorted(self.body_vars(elements[:leading]))
+		self._rows[id(body)] = (list_var, key, leading, self.frame_args() + names, names)
+		self.write(self.indent())
+		yield node
+		self.write('\n{}{}.done();\n'.format(self.indent(), list_var))
+		self.indent_level -= 1
+		self.write('{}}};\n'.format(self.indent()))
+		self.write('{}{}({});\n'.format(self.indent(), loop_var, ', '.join(args)))
+		# lists can change without the argument holding them changing
+		self.add_action('{}({});'.format(loop_var, ', '.join(args)), None)
+	
+	def write_row(self, elements, list_var, key, leading, args, names):
+		""" Writes the code building a row of `list_var` out of `elements`,
+		with its own update function taking `args`, of which `names` are the
+		loop variables. The `leading` first elements are statements run before
+		the row is matched, for its key.
+		"""
+		elements = list(elements)
+		if leading:
+			frame = self.frames[-1]
+			frame.js_depth += 1
+			yield self.write_all(elements[:leading], '\n', indent = True)
+			frame.js_depth -= 1
+			self.write('\n')
+			elements = elements[leading:]
+		self.write('{}{}.row({}, [{}], function() {{\n'.format(
+			self.indent(), list_var, key, ', '.join(self.js_name(arg) for arg in args)))
+		self.indent_level += 1
+		self.frames.append(UpdateFrame(args, names))
+		self.push_scope()
+		root = self.current_root()
+		yield self.write_elements(elements)
+		self.write('\n')
+		self.pop_scope(attach = False)
+		self.write_update()
+		self.frames.pop()
+		self.write('{}return {{fragment: {}, update: {}}};\n'.format(self.indent(), root, self.temp('update')))
+		self.indent_level -= 1
+		self.write('{}}});\n'.format(self.indent()))
+	
+	def loops(self, node):
+		""" True if a statement has a loop, or calls a function with a
+		callback, which may run any number of times
+		"""
+		for child in preorder(node):
+			if isinstance(child, LOOP_STATEMENTS):
+				return True
+			if isinstance(child, ast.FunctionCall) and any(isinstance(arg, ast.FuncExpr) for arg in child.args):
+				return True
+		return False
+	
+	def declared_vars(self, node):
+		""" Returns the names a statement declares with `var`, outside of the
+		functions in it
+		"""
+		names = []
+		stack = [node]
+		while stack:
+			child = stack.pop()
+			if isinstance(child, list):
+				stack.extend(reversed(child))
+			elif isinstance(child, ast.VarDecl):
+				if child.identifier.value not in names:
+					names.append(child.identifier.value)
+				stack.append(child.initializer)
+			elif child is not None and not isinstance(child, (ast.FuncBase, ast.GetPropAssign, ast.SetPropAssign)):
+				stack.extend(reversed(child.children()))
+		return names
+	
+	def write_statement(self, node):
+		""" Writes a {% %} statement. In update mode, the statements that are
+		not inside another one are run again by the update function when what
+		they read changes, see write_region() and write_loop() for the ones
+		that build DOM.
+		"""
+		frame = self.frames[-1]
+		if not self.update or frame.js_depth:
+			frame.js_depth += 1
+			yield node
+			frame.js_depth -= 1
+			return
+		
+		loop = self.loop_body(node)
+		if loop:
+			yield self.write_loop(node, *loop)
+			return
+		if any(isinstance(child, (ast.HTMLTag, ast.HTMLDataList)) for child in preorder(node)):
+			yield self.write_region(node)
+			return
+		
+		frame.js_depth += 1
+		yield node
+		if isinstance(node, ast.VarStatement):
+			deps = set()
+			for decl in node:
+				self.define(decl.identifier.value, set() if decl.initializer is None else self.deps(decl.initializer))
+				# assigned ones start over on every update
+				decl_deps = frame.locals[decl.identifier.value]
+				deps = None if deps is None or decl_deps is None else deps | decl_deps
+			self.assign_vars = True
+			self.add_action(self.capture(node), deps)
+			self.assign_vars = False
+		elif isinstance(node, ast.FuncDecl):
+			# only declares the function
+			self.define(node.identifier.value, self.deps(node))
+		elif not isinstance(node, ast.EmptyStatement):
+			self.add_action(self.capture(node), None)
+		frame.js_depth -= 1
+	
+	def write_region(self, node):
+		""" Writes a {% %} statement that builds DOM as a region, whose nodes
+		the update function builds again when what the statement reads
+		changes, or always when it loops
+		"""
+		frame = self.frames[-1]
+		region_var = self.make_region()
+		# the variables it declares stay those of the frame, the function
+		# building the region assigns them
+		declared = self.declared_vars(node)
+		if declared:
+			self.write('var {};\n{}'.format(', '.join(self.js_name(name) for name in declared), self.indent()))
+		deps = None if self.loops(node) else self.deps(node)
+		
+		self.helpers.add('R')
+		self.write('var {} = R(function() {{\n'.format(region_var))
+		self.indent_level += 1
+		self.push_scope()
+		root = self.current_root()
+		frame.js_depth += 1
+		self.assign_vars = True
+		self.write(self.indent())
+		yield node
+		self.write('\n')
+		self.assign_vars = False
+		frame.js_depth -= 1
+		self.pop_scope(attach = False)
+		self.write('{}return {};\n'.format(self.indent(), root))
+		self.indent_level -= 1
+		self.write('{}}});\n'.format(self.indent()))
+		self.add_child('{}.frag'.format(region_var))
+		
+		for name in declared:
+			self.define(name, None)
+		self.add_action('{}.render();'.format(region_var), deps)
+	
+	def result(self):
+		""" The expression the template function returns
+		"""
+		if self.update:
+			return '{{fragment: {}, update: {}}}'.format(self.program_root, self.temp('update'))
+		return self.program_root
+	
+	def write_statics(self, stream = None):
+		""" Writes the code building the hoisted static subtrees, to be run
+		once, outside of the template function
+		"""
+		out, hoist_statics = self.out, self.hoist_statics
+		if stream is not None:
+			self.out = CodeWriter(indent_str = out.indent_str, stream = stream)
+		self.hoist_statics = False
+		try:
+			for static_var, node, html in self.statics:
+				if html is not None:
+					self.helpers.add('H')
+					self.write('{}var {} = H("{}");\n'.format(self.indent(), static_var, html))
+					continue
+				self.write('{}var {} = (function() {{\n'.format(self.indent(), static_var))
+				self.indent_level += 1
+				self.children_to_add.append([])
+				self.write(self.indent())
+				var_name = self.make_html_node(node.name)
+				self.run(self.write_tag(node, var_name))
+				self.children_to_add.pop()
+				self.write('{}return {};\n'.format(self.indent(), var_name))
+				self.indent_level -= 1
+				self.write('{}}})();\n'.format(self.indent()))
+		finally:
+			self.out, self.hoist_statics = out, hoist_statics
+		self.statics = []
+	
+	def read_directives(self, node):
+		""" Picks up the define() and Template() comments of a tree and works
+		out the arguments of the template without generating any code, so a
+		module header can be written before the body.
+		
+		The arguments are the names the template references without defining
+		them, that are neither define()d nor JS globals, in the order they are
+		first used. Names listed in a Template() comment come first, in its
+		order.
+		"""
+		for child in preorder(node):
+			if isinstance(child, ast.HTMLComment):
+				self.visit_HTMLComment(child)
+		
+		# also scopes every identifier for visit_Identifier
+		for name in free_names(node):
+			if (name not in self.tpl_vars and name not in JS_GLOBALS and
+				name not in self.needed_args.values()):
+				self.tpl_vars.append(name)
+		
+		if self.minify:
+			self.mangled = mangle(node, reserved = RUNTIME_NAMES.union(
+				JS_GLOBALS, self.tpl_vars, self.needed_args.values()))
+		if self.update:
+			self.unstable = mutated_names(node)
+		
+		# `key` only matches the rows of loops, see row_key(); it is taken
+		# off once its names are scoped
+		for child in preorder(node):
+			if isinstance(child, ast.HTMLTag):
+				for attr in child.attrs:
+					if attr.name == 'key':
+						self._keys[id(child)] = attr
+				child.attrs = [attr for attr in child.attrs if attr.name != 'key']
+	
+	def write(self, text):
+		self.out.write(text)
+	
+	def write_all(self, nodes, sep, indent = False):
+		for index, node in enumerate(nodes):
+			if index:
+				self.write(sep)
+			if indent:
+				self.write(self.indent())
+			yield node
+	
+	def capture(self, node):
+		self.out.begin_capture()
+		self.visit(node)
+		return self.out.end_capture()
+	
+	def generic_visit(self, node):
+		if node is None:
+			return
+		if isinstance(node, list):
+			yield self.write_all(node, '\n')
+		else:
+			yield self.write_all(node.children(), '\n')
+	
 	def current_root(self):
 		return self.roots[-1]
 	
 	def make_html_node(self, n):
 		self.html_count += 1
-		return "$${}{}".format(n, self.html_count)
+		return self.temp('{}{}'.format(n, self.html_count))
 	
 	def make_root(self):
 		self.root_count += 1
-		return '$$root{}'.format(self.root_count)
+		return self.temp('root{}'.format(self.root_count))
 	
 	def make_text(self):
 		self.text_count += 1
-		return '$$text{}'.format(self.text_count)
+		return self.temp('text{}'.format(self.text_count))
+	
+	def make_static(self):
+		self.static_count += 1
+		return self.temp('static{}'.format(self.static_count))
+	
+	def make_list(self):
+		self.list_count += 1
+		return self.temp('list{}'.format(self.list_count))
+	
+	def make_region(self):
+		self.region_count += 1
+		return self.temp('region{}'.format(self.region_count))
+	
+	def make_hole(self):
+		self.hole_count += 1
+		return self.temp('hole{}'.format(self.hole_count))
+	
+	def tag_costs(self, node):
+		""" Returns (dom, holes, hole_cost) for an HTMLTag: the number of DOM
+		calls building it node by node takes, and the number and cost of the
+		dynamic holes to fill in a clone of it, or None for the holes when the
+		tag can't be built from a <template>.
+		"""
+		key = id(node)
+		if key not in self._costs:
+			# the tags below are costed first, on the way back up
+			walk(node, lambda tag: inner_tags(tag, self._costs), self.cost_tag, ast.HTMLTag)
+		return self._costs[key]
+	
+	def cost_tag(self, node):
+		""" Works out tag_costs() of an HTMLTag whose inner tags have been
+		"""
+		dom = 2 + len(node.attrs)
+		dynamic = sum(1 for attr in node.attrs if not attr.is_static())
+		holes, hole_cost = (1, dynamic) if dynamic else (0, 0)
+		if not self.template_safe(node):
+			holes = None
+		
+		for child in node.inner or []:
+			if isinstance(child, ast.HTMLTag):
+				child_dom, child_holes, child_cost = self._costs[id(child)]
+				dom += child_dom
+				if holes is not None and child_holes is not None:
+					# every hole is one childNodes lookup further away
+					holes += child_holes
+					hole_cost += child_cost + child_holes
+				else:
+					holes = None
+			elif isinstance(child, ast.HTMLDataList):
+				dom += 1
+				if holes is not None and not child.is_static():
+					# lookup, T() and replaceChild
+					holes += 1
+					hole_cost += 3
+			else:
+				dom += 1
+				holes = None
+		
+		self._costs[id(node)] = (dom, holes, hole_cost)
+	
+	def descendant_tags(self, node):
+		""" Returns the names of the tags below an HTMLTag
+		"""
+		key = id(node)
+		if key not in self._tags:
+			walk(node, lambda tag: inner_tags(tag, self._tags), self.name_tags, ast.HTMLTag)
+		return self._tags[key]
+	
+	def name_tags(self, node):
+		""" Works out descendant_tags() of an HTMLTag whose inner tags have been
+		"""
+		names = set()
+		for child in node.inner or []:
+			if isinstance(child, ast.HTMLTag):
+				names.add(child.name.lower())
+				names.update(self._tags[id(child)])
+		self._tags[id(node)] = frozenset(names)
+	
+	def template_safe(self, node):
+		""" True if the HTML parser builds an HTMLTag as it is written, given
+		that its children are
+		"""
+		name = node.name.lower()
+		# custom elements are parsed like a <span>
+		if name not in TEMPLATE_SAFE and '-' not in name:
+			return False
+		conflicts = CONTENT_CONFLICTS.get(name)
+		return conflicts is None or conflicts.isdisjoint(self.descendant_tags(node))
+	
+	def use_template(self, node):
+		dom, holes, hole_cost = self.tag_costs(node)
+		if holes is None or self.strategy == 'dom':
+			return False
+		if self.strategy == 'template':
+			return True
+		if not holes:
+			return dom >= TEMPLATE_MIN_CALLS
+		# cloneNode and appendChild, then the holes
+		return 2 + hole_cost < dom
+	
+	def serialize(self, node, path, html, holes):
+		""" Appends the HTML of `node` to `html`, with a comment standing in for
+		each dynamic text, and the (path, node) of its holes to `holes`, where
+		path are the child indexes leading to the node
+		"""
+		# what is left to write, last first: (tag, path) to open, closing
+		# tags, and (text, path) to leave a hole for
+		stack = [(node, path)]
+		while stack:
+			item = stack.pop()
+			if not isinstance(item, tuple):
+				html.append(item)
+				continue
+			node, path = item
+			if isinstance(node, ast.HTMLDataList):
+				html.append('<!---->')
+				holes.append((path, node))
+				continue
+			
+			html.append('<' + node.name)
+			for attr in node.attrs:
+				if attr.is_static():
+					# the HTML ends up in a double quoted JS string
+					html.append(' {}=\\"{}\\"'.format(attr.name, html_attr(''.join(part.data for part in attr.parts))))
+			if not all(attr.is_static() for attr in node.attrs):
+				holes.append((path, node))
+			html.append('>')
+			if node.void:
+				continue
+			
+			items = []
+			for child in node.inner or []:
+				if isinstance(child, ast.HTMLTag):
+					items.append((child, path + (len(items),)))
+				elif child.is_static():
+					text = ''.join(data.data for data in child.data_list if isinstance(data, ast.HTMLData))
+					if text:
+						items.append(html_text(text))
+				else:
+					items.append((child, path + (len(items),)))
+			items.append('</{}>'.format(node.name))
+			stack.extend(reversed(items))
 	
 	def add_child(self, child):
 		self.children_to_add[-1].append(child)
 	
 	def push_scope(self, root = None):
-		ret = ''
 		if root is None:
 			root = self.make_root()
-			ret = '{}var {} = F();\n'
+			self.write('{}var {} = F();\n'.format(self.indent(), root))
 		self.root_map.setdefault(root, {})
 		self.roots.append(root)
 		self.children_to_add.append([])
-		
-		return ret.format(self.indent(), self.current_root())
 	
-	def pop_scope(self):
-		ret = ''
+	def append_children(self, root, children):
+		""" Appends the `children` of `root` that aren't yet, in order
+		"""
+		appended = self.root_map[root]
+		for child in children:
+			if child not in appended:
+				self.write('{}{}.appendChild({});\n'.format(self.indent(), root, child))
+				appended[child] = 1
+	
+	def pop_scope(self, attach = True):
 		old_root = self.roots.pop()
-		children_to_add = self.children_to_add.pop()
+		self.append_children(old_root, self.children_to_add.pop())
 		
-		for child in children_to_add:
-			if child not in self.root_map[old_root]:
-				ret += '{}{}.appendChild({});\n'.format(self.indent(), old_root, child)
-				self.root_map[old_root][child] = 1
-		
-		if len(self.roots):
-			if old_root not in self.root_map[self.current_root()]:
-				ret += '{}{}.appendChild({});\n'.format(self.indent(), self.current_root(), old_root)
-				self.root_map[self.current_root()][old_root] = 1
-		return ret
+		if attach and len(self.roots):
+			# the siblings added before it go first, they may be waiting
+			# (clones of static subtrees, texts) for the end of the parent
+			self.append_children(self.current_root(), self.children_to_add[-1] + [old_root])
 	
 	def indent(self):
-		return '\t' * self.indent_level
+		return self.out.indent()
 	
 	def visit_Program(self, node):
-		ret = self.push_scope()
-		ret += '\n'.join(self.visit(child) for child in node)
-		ret += self.pop_scope()
-		return ret
+		self.push_scope()
+		self.program_root = self.current_root()
+		yield self.write_all(node, '\n')
+		self.pop_scope()
 	
 	def visit_Block(self, node):
-		ret = '{\n'
+		self.write('{\n')
 		self.indent_level += 1
-		ret += self.push_scope()
-		
-		ret += '\n'.join(
-			"{}{}".format(self.indent(), self.visit(child)) for child in node
-		)
-		
-		ret += self.pop_scope()
+		if id(node) in self._rows:
+			yield self.write_row(node, *self._rows.pop(id(node)))
+			self.indent_level -= 1
+			self.write(self.indent() + '}\n')
+			return
+		self.push_scope()
+		yield self.write_all(node, '\n', indent = True)
+		self.pop_scope()
 		self.indent_level -= 1
-		ret += '\n' + self.indent() + '}\n'
-		return ret
+		self.write('\n' + self.indent() + '}\n')
+	
+	def write_elements(self, elements):
+		""" Writes the children of a {% %} block, or of a loop body
+		"""
+		for index, element in enumerate(elements):
+			if index:
+				self.write('\n')
+			if isinstance(element, (ast.HTMLJSContainer, ast.HTMLTag, ast.HTMLDataList)):
+				# not conditional, it runs whenever the container does
+				self.write(self.indent())
+				yield element
+			else:
+				# the statement may append to the current root
+				# conditionally or repeatedly, what comes before it has to
+				# be in place first
+				self.append_children(self.current_root(), self.children_to_add[-1])
+				self.write(self.indent())
+				yield self.write_statement(element)
 	
 	def visit_HTMLJSContainer(self, node):
-		return '\n'.join(
-			'{}{}'.format(self.indent(), self.visit(child)) for child in node
-		)
+		# a {% %} block holds everything that follows it, up to the end of
+		# its parent, so the blocks of a long template nest as deep as there
+		# are blocks; the last child is taken in a loop instead of recursing
+		while node is not None:
+			children, node = list(node), None
+			if children and isinstance(children[-1], ast.HTMLJSContainer):
+				node = children.pop()
+			yield self.write_elements(children)
+			if node is not None:
+				if children:
+					self.write('\n')
+				self.write(self.indent())
 	
 	def visit_VarStatement(self, node):
-		return 'var {};'.format(', '.join(self.visit(child) for child in node))
+		if self.assign_vars:
+			yield self.write_all([decl for decl in node if decl.initializer is not None], ', ')
+			self.write(';')
+			return
+		self.write('var ')
+		yield self.write_all(node, ', ')
+		self.write(';')
 	
 	def visit_VarDecl(self, node):
-		init = ''
+		yield node.identifier
 		if node.initializer is not None:
-			init = ' = {}'.format(self.visit(node.initializer))
-		
-		return 'var {}{}'.format(self.visit(node.identifier), init)
+			self.write(' = ')
+			yield node.initializer
 	
 	def visit_Identifier(self, node):
-		if hasattr(node, 'safe'):
-			return node.value
-		return "$_{}".format(node.value)
+		if node.safe or self.is_global(node):
+			self.write(node.value)
+		else:
+			self.write(self.js_name(node.value))
+	
+	def is_global(self, node):
+		""" True for a reference to a JS global that the template doesn't
+		shadow, once the tree has been through read_directives()
+		"""
+		scope = getattr(node, 'scope', None)
+		return (
+			node.value in JS_GLOBALS and scope is not None and
+			scope.resolve(node.value) is None
+		)
 	
 	def visit_Assign(self, node):
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
+		if node.op == ':' and isinstance(node.left, ast.Identifier):
+			# a property name, not a variable
+			self.write(node.left.value)
+		else:
+			yield node.left
 		if node.op == ':':
-			template = '{}{} {}'
+			self.write('{} '.format(node.op))
 		else:
-			template = '{} {} {}'
-		if getattr(node, '_parens', False):
-			template = '({})'.format(template)
-		
-		return template.format(self.visit(node.left), node.op, self.visit(node.right))
+			self.write(' {} '.format(node.op))
+		yield node.right
+		if parens:
+			self.write(')')
 	
 	def visit_GetPropAssign(self, node):
-		template = 'get {}() {{\n{}\n{}}}'
-		if getattr(node, '_parens', False):
-			template = '({})'.format(template)
-		body = ''
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
+		self.write('get ')
+		yield node.prop_name
+		self.write('() {\n')
 		self.indent_level += 1
-		body += self.push_scope()
-		body += '\n'.join(
-			(self.indent() + self.visit(el)) for el in node.elements
-		)
-		body += self.pop_scope()
+		assign_vars, self.assign_vars = self.assign_vars, False
+		self.push_scope()
+		yield self.write_all(node.elements, '\n', indent = True)
+		self.pop_scope()
+		self.assign_vars = assign_vars
 		self.indent_level -= 1
-		return template.format(self.visit(node.prop_name), body, self.indent())
+		self.write('\n{}}}'.format(self.indent()))
+		if parens:
+			self.write(')')
 
 	def visit_SetPropAssign(self, node):
-		template = 'set {}({}) {{\n{}\n{}}}'
-		if getattr(node, '_parens', False):
-			template = '({})'.format(template)
 		if len(node.parameters) > 1:
 			raise SyntaxError('Setter functions must have one argument: %s' % node)
-		params = ','.join(self.visit(param) for param in node.parameters)
-		body = ''
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
+		self.write('set ')
+		yield node.prop_name
+		self.write('(')
+		yield self.write_all(node.parameters, ',')
+		self.write(') {\n')
 		self.indent_level += 1
-		body += self.push_scope()
-		body += '\n'.join(
-			(self.indent() + self.visit(el)) for el in node.elements
-		)
-		body += self.pop_scope()
+		assign_vars, self.assign_vars = self.assign_vars, False
+		self.push_scope()
+		yield self.write_all(node.elements, '\n', indent = True)
+		self.pop_scope()
+		self.assign_vars = assign_vars
 		self.indent_level -= 1
-		return template % (self.visit(node.prop_name), params, body, self.indent())
+		self.write('\n{}}}'.format(self.indent()))
+		if parens:
+			self.write(')')
 
 	def visit_Number(self, node):
-		return node.value
+		self.write(node.value)
 
 	def visit_Comma(self, node):
-		s = '{}, {}'.format(self.visit(node.left), self.visit(node.right))
-		if getattr(node, '_parens', False):
-			s = '(' + s + ')'
-		return s
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
+		yield node.left
+		self.write(', ')
+		yield node.right
+		if parens:
+			self.write(')')
 
 	def visit_EmptyStatement(self, node):
-		return node.value
+		self.write(node.value)
 
 	def visit_If(self, node):
-		s = 'if ('
+		self.write('if (')
 		if node.predicate is not None:
-			s += self.visit(node.predicate)
-		s += ') '
-		s += self.visit(node.consequent)
+			yield node.predicate
+		self.write(') ')
+		yield node.consequent
 		if node.alternative is not None:
-			s += ' else '
-			s += self.visit(node.alternative)
-		return s
+			self.write(' else ')
+			yield node.alternative
 
 	def visit_Boolean(self, node):
-		return node.value
+		self.write(node.value)
 
 	def visit_For(self, node):
-		s = 'for ('
+		self.write('for (')
 		if node.init is not None:
-			s += self.visit(node.init)
+			yield node.init
 		if node.init is None:
-			s += ' ; '
+			self.write(' ; ')
 		elif isinstance(node.init, (ast.Assign, ast.Comma, ast.FunctionCall,
 									ast.UnaryOp, ast.Identifier, ast.BinOp,
 									ast.Conditional, ast.Regex, ast.NewExpr)):
-			s += '; '
+			self.write('; ')
 		else:
-			s += ' '
+			self.write(' ')
 		if node.cond is not None:
-			s += self.visit(node.cond)
-		s += '; '
+			yield node.cond
+		self.write('; ')
 		if node.count is not None:
-			s += self.visit(node.count)
-		s += ') ' + self.visit(node.statement)
-		return s
+			yield node.count
+		self.write(') ')
+		yield node.statement
 
 	def visit_ForIn(self, node):
-		if isinstance(node.item, ast.VarDecl):
-			template = 'for (var {} in {}) '
+		if isinstance(node.item, ast.VarDecl) and not self.assign_vars:
+			self.write('for (var ')
 		else:
-			template = 'for ({} in {}) '
-		s = template.format(self.visit(node.item), self.visit(node.iterable))
-		s += self.visit(node.statement)
-		return s
+			self.write('for (')
+		yield node.item
+		self.write(' in ')
+		yield node.iterable
+		self.write(') ')
+		yield node.statement
 
 	def visit_BinOp(self, node):
-		if getattr(node, '_parens', False):
-			template = '({} {} {})'
-		else:
-			template = '{} {} {}'
-		return template.format(
-			self.visit(node.left), node.op, self.visit(node.right))
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
+		# long chains like a + b + c + ... nest to the left, walk down them
+		# in a loop
+		chain = [node]
+		left = node.left
+		while isinstance(left, ast.BinOp) and not left._parens:
+			chain.append(left)
+			left = left.left
+		yield left
+		for binop in reversed(chain):
+			self.write(' {} '.format(binop.op))
+			yield binop.right
+		if parens:
+			self.write(')')
 
 	def visit_UnaryOp(self, node):
-		s = self.visit(node.value)
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
 		if node.postfix:
-			s += node.op
+			yield node.value
+			self.write(node.op)
 		elif node.op in ('delete', 'void', 'typeof'):
-			s = '{} {}'.format(node.op, s)
+			self.write('{} '.format(node.op))
+			yield node.value
 		else:
-			s = '{}{}'.format(node.op, s)
-		if getattr(node, '_parens', False):
-			s = '({})'.format(s)
-		return s
+			self.write(node.op)
+			yield node.value
+		if parens:
+			self.write(')')
 
 	def visit_ExprStatement(self, node):
-		return '{};'.format(self.visit(node.expr))
+		yield node.expr
+		self.write(';')
 
 	def visit_DoWhile(self, node):
-		s = 'do '
-		s += self.visit(node.statement)
-		s += ' while ({});\n'.format(self.visit(node.predicate))
-		return s
+		self.write('do ')
+		yield node.statement
+		self.write(' while (')
+		yield node.predicate
+		self.write(');\n')
 
 	def visit_While(self, node):
-		s = 'while ({}) '.format(self.visit(node.predicate))
-		s += self.visit(node.statement)
-		return s
+		self.write('while (')
+		yield node.predicate
+		self.write(') ')
+		yield node.statement
 
 	def visit_Null(self, node):
-		return 'null'
+		self.write('null')
 
 	def visit_String(self, node):
-		return node.value
+		self.write(node.value)
 
 	def visit_Continue(self, node):
 		if node.identifier is not None:
-			s = 'continue {};\n'.format(self.visit_Identifier(node.identifier))
+			self.write('continue ')
+			self.visit_Identifier(node.identifier)
+			self.write(';\n')
 		else:
-			s = 'continue;\n'
-		return s
+			self.write('continue;\n')
 
 	def visit_Break(self, node):
 		if node.identifier is not None:
-			s = 'break {};\n'.format(self.visit_Identifier(node.identifier))
+			self.write('break ')
+			self.visit_Identifier(node.identifier)
+			self.write(';\n')
 		else:
-			s = 'break;\n'
-		return s
+			self.write('break;\n')
 
 	def visit_Return(self, node):
 		if node.expr is None:
-			return 'return;'
+			self.write('return;')
 		else:
-			return 'return {};'.format(self.visit(node.expr))
+			self.write('return ')
+			yield node.expr
+			self.write(';')
 
 	def visit_With(self, node):
-		s = 'with ({}) '.format(self.visit(node.expr))
-		s += self.visit(node.statement)
-		return s
+		self.write('with (')
+		yield node.expr
+		self.write(') ')
+		yield node.statement
 
 	def visit_Label(self, node):
-		s = '{}: {}'.format(self.visit(node.identifier), self.visit(node.statement))
-		return s
+		yield node.identifier
+		self.write(': ')
+		yield node.statement
 
 	def visit_Switch(self, node):
-		s = 'switch ({}) {{\n'.format(self.visit(node.expr))
+		self.write('switch (')
+		yield node.expr
+		self.write(') {\n')
 		self.indent_level += 1
 		for case in node.cases:
-			s += self.indent() + self.visit_Case(case)
+			self.write(self.indent())
+			yield self.visit_Case(case)
 		if node.default is not None:
-			s += self.visit_Default(node.default)
+			yield self.visit_Default(node.default)
 		self.indent_level -= 1
-		s += self.indent() + '}'
-		return s
+		self.write(self.indent() + '}')
 
 	def visit_Case(self, node):
-		s = 'case {}:\n'.format(self.visit(node.expr))
+		self.write('case ')
+		yield node.expr
+		self.write(':\n')
 		self.indent_level += 1
-		elements = '\n'.join(self.indent() + self.visit(element)
-							 for element in node.elements)
-		if elements:
-			s += elements + '\n'
+		if node.elements:
+			yield self.write_all(node.elements, '\n', indent = True)
+			self.write('\n')
+			self.end_clause()
 		self.indent_level -= 1
-		return s
 
 	def visit_Default(self, node):
-		s = self.indent() + 'default:\n'
+		self.write(self.indent() + 'default:\n')
 		self.indent_level += 1
-		s += '\n'.join(self.indent() + self.visit(element)
-					   for element in node.elements)
+		yield self.write_all(node.elements, '\n', indent = True)
 		if node.elements is not None:
-			s += '\n'
+			self.write('\n')
+			self.end_clause()
 		self.indent_level -= 1
-		return s
+
+	def end_clause(self):
+		""" Appends what the body of a case built, it doesn't run once the
+		switch is over
+		"""
+		self.append_children(self.current_root(), self.children_to_add[-1])
 
 	def visit_Throw(self, node):
-		s = 'throw {};'.format(self.visit(node.expr))
-		return s
+		self.write('throw ')
+		yield node.expr
+		self.write(';')
 
 	def visit_Debugger(self, node):
-		return '{};'.format(node.value)
+		self.write('{};'.format(node.value))
 
 	def visit_Try(self, node):
-		s = 'try '
-		s += self.visit(node.statements)
+		self.write('try ')
+		yield node.statements
 		if node.catch is not None:
-			s += ' ' + self.visit(node.catch)
+			self.write(' ')
+			yield node.catch
 		if node.fin is not None:
-			s += ' ' + self.visit(node.fin)
-		return s
+			self.write(' ')
+			yield node.fin
 
 	def visit_Catch(self, node):
-		s = 'catch ({}) {}'.format(self.visit(node.identifier), self.visit(node.elements))
-		return s
+		self.write('catch (')
+		yield node.identifier
+		self.write(') ')
+		yield node.elements
 
 	def visit_Finally(self, node):
-		s = 'finally {}'.format(self.visit(node.elements))
-		return s
+		self.write('finally ')
+		yield node.elements
 
 	def visit_FuncDecl(self, node):
-		params = ', '.join(self.visit(param) for param in node.parameters)
-		body = ''
+		self.write('function ')
+		yield node.identifier
+		self.write('(')
+		yield self.write_all(node.parameters, ', ')
+		self.write(') {\n')
 		
 		self.indent_level += 1
-		body += '\n'.join(self.indent() + self.visit(element) for element in node.elements)
+		assign_vars, self.assign_vars = self.assign_vars, False
+		yield self.write_all(node.elements, '\n', indent = True)
+		self.assign_vars = assign_vars
 		self.indent_level -= 1
 
-		return 'function {}({}) {{\n{}\n{}}}'.format(self.visit(node.identifier), params, body, self.indent())
+		self.write('\n{}}}'.format(self.indent()))
 
 	def visit_FuncExpr(self, node):
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
+		self.write('function')
+		if node.identifier is not None:
+			self.write(' ')
+			yield node.identifier
+		self.write('(')
+		yield self.write_all(node.parameters, ', ')
+		self.write(') {\n')
+
 		self.indent_level += 1
-		elements = '\n'.join(self.indent() + self.visit(element)
-							 for element in node.elements)
+		assign_vars, self.assign_vars = self.assign_vars, False
+		if id(node) in self._rows:
+			yield self.write_row(node.elements, *self._rows.pop(id(node)))
+		elif any(isinstance(element, (ast.HTMLTag, ast.HTMLDataList)) for element in node.elements):
+			# the DOM it builds has to be attached when it is called
+			self.push_scope()
+			yield self.write_all(node.elements, '\n', indent = True)
+			self.pop_scope()
+		else:
+			yield self.write_all(node.elements, '\n', indent = True)
+		self.assign_vars = assign_vars
 		self.indent_level -= 1
 
-		ident = node.identifier
-		ident = '' if ident is None else ' %s' % self.visit(ident)
-
-		header = 'function%s(%s)'
-		if getattr(node, '_parens', False):
-			header = '(' + header
-		s = (header + ' {\n%s') % (
-			ident,
-			', '.join(self.visit(param) for param in node.parameters),
-			elements,
-			)
-		s += '\n' + self.indent() + '}'
-		if getattr(node, '_parens', False):
-			s += ')'
-		return s
+		self.write('\n' + self.indent() + '}')
+		if parens:
+			self.write(')')
 
 	def visit_Conditional(self, node):
-		if getattr(node, '_parens', False):
-			template = '({} ? {} : {})'
-		else:
-			template = '{} ? {} : {}'
-
-		s = template.format(
-			self.visit(node.predicate),
-			self.visit(node.consequent), self.visit(node.alternative)
-		)
-		return s
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
+		yield node.predicate
+		self.write(' ? ')
+		yield node.consequent
+		self.write(' : ')
+		yield node.alternative
+		if parens:
+			self.write(')')
 
 	def visit_Regex(self, node):
 		if getattr(node, '_parens', False):
-			return '({})'.format(node.value)
+			self.write('({})'.format(node.value))
 		else:
-			return node.value
+			self.write(node.value)
 
 	def visit_NewExpr(self, node):
-		s = 'new {}({})'.format(
-			self.visit(node.identifier),
-			', '.join(self.visit(arg) for arg in node.args)
-			)
-		return s
+		self.write('new ')
+		yield node.identifier
+		self.write('(')
+		yield self.write_all(node.args, ', ')
+		self.write(')')
 
 	def visit_DotAccessor(self, node):
-		if getattr(node, '_parens', False):
-			template = '({}.{})'
-		else:
-			template = '{}.{}'
-		s = template.format(self.visit(node.node), node.identifier.value)
-		return s
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
+		yield node.node
+		self.write('.' + node.identifier.value)
+		if parens:
+			self.write(')')
 
 	def visit_BracketAccessor(self, node):
-		s = '{}[{}]'.format(self.visit(node.node), self.visit(node.expr))
-		return s
+		yield node.node
+		self.write('[')
+		yield node.expr
+		self.write(']')
 
 	def visit_FunctionCall(self, node):
-		s = '{}({})'.format(self.visit(node.identifier),
-						', '.join(self.visit(arg) for arg in node.args))
-		if getattr(node, '_parens', False):
-			s = '(' + s + ')'
-		return s
+		parens = getattr(node, '_parens', False)
+		if parens:
+			self.write('(')
+		yield node.identifier
+		self.write('(')
+		yield self.write_all(node.args, ', ')
+		self.write(')')
+		if parens:
+			self.write(')')
 
 	def visit_Object(self, node):
-		s = '{\n'
+		self.write('{\n')
 		self.indent_level += 1
-		s += ',\n'.join(self.indent() + self.visit(prop)
-						for prop in node.properties)
+		yield self.write_all(node.properties, ',\n', indent = True)
 		self.indent_level -= 1
 		if node.properties:
-			s += '\n'
-		s += self.indent() + '}'
-		return s
+			self.write('\n')
+		self.write(self.indent() + '}')
 
 	def visit_Array(self, node):
-		s = '['
+		self.write('[')
 		length = len(node.items) - 1
 		for index, item in enumerate(node.items):
 			if isinstance(item, ast.Elision):
-				s += ','
-			elif index != length:
-				s += self.visit(item) + ','
+				self.write(',')
 			else:
-				s += self.visit(item)
-		s += ']'
-		return s
+				yield item
+				if index != length:
+					self.write(',')
+		self.write(']')
 
 	def visit_This(self, node):
-		return 'this'
+		self.write('this')
 	
 	def visit_HTMLDataList(self, node):
 		if len(node):
-			node_parts = filter(lambda x: x and len(x), (self.visit(child) for child in node))
+			# The text node is numbered after its parts have been visited,
+			# and empty parts are dropped, so each part is captured first.
+			# Parts are a single text run or island, so this stays cheap.
+			node_parts = [part for part in (self.capture(child) for child in node) if part]
+			if not node_parts:
+				# only comments
+				return
 			txt_var = self.make_text()
 			self.add_child(txt_var)
-			ret = 'var {} = '.format(txt_var)
-			
-			ret += ' + '.join(node_parts)
-			
-			ret += ';\n'
-			return ret
-		return ''
+			self.write('var {} = T('.format(txt_var))
+			self.out.begin_capture()
+			self.write(' + '.join(node_parts))
+			self.bind(node, txt_var)
+			self.write(');\n')
 	
 	def visit_HTMLTag(self, node):
+		# a lone element costs a single call either way
+		if self.hoist_statics and (node.attrs or node.inner) and node.is_static():
+			static_var = self.make_static()
+			html = None
+			if self.use_template(node):
+				html = []
+				self.serialize(node, (), html, [])
+				html = ''.join(html)
+			self.statics.append((static_var, node, html))
+			var_name = self.make_html_node(node.name)
+			self.write('var {} = {}.cloneNode(true);\n'.format(var_name, static_var))
+			self.add_child(var_name)
+		elif self.hoist_statics and self.use_template(node):
+			yield self.write_template(node)
+		else:
+			yield self.write_tag(node)
+	
+	def write_template(self, node):
+		html, holes = [], []
+		self.serialize(node, (), html, holes)
+		static_var = self.make_static()
+		self.statics.append((static_var, node, ''.join(html)))
+		
 		var_name = self.make_html_node(node.name)
-		ret = 'var {} = C("{}");\n'.format(var_name, node.name)
+		self.write('var {} = {}.cloneNode(true);\n'.format(var_name, static_var))
+		self.add_child(var_name)
+		
+		# find all the holes before any of them is filled in
+		hole_vars = []
+		for path, hole in holes:
+			if not path:
+				hole_vars.append(var_name)
+				continue
+			hole_var = self.make_hole()
+			self.write('{}var {} = {}{};\n'.format(
+				self.indent(), hole_var, var_name,
+				''.join('.childNodes[{}]'.format(index) for index in path)
+			))
+			hole_vars.append(hole_var)
+		
+		for hole_var, (path, hole) in zip(hole_vars, holes):
+			if isinstance(hole, ast.HTMLTag):
+				for attr in hole.attrs:
+					if not attr.is_static():
+						self.write('{}{}.setAttribute("{}", '.format(self.indent(), hole_var, attr.name))
+						self.out.begin_capture()
+						yield attr
+						self.bind(attr, hole_var, attr.name)
+						self.write(');\n')
+			else:
+				self.write(self.indent())
+				self.children_to_add.append([])
+				yield hole
+				txt_var, = self.children_to_add.pop()
+				self.write('{}{}.parentNode.replaceChild({}, {});\n'.format(
+					self.indent(), hole_var, txt_var, hole_var))
+	
+	def write_tag(self, node, var_name = None):
+		""" Writes the code building a tag node by node, named `var_name`
+		when given
+		"""
+		if var_name is None:
+			var_name = self.make_html_node(node.name)
+		self.write('var {} = C("{}");\n'.format(var_name, node.name))
 		self.add_child(var_name)
 		if not node.void:
-			ret += self.push_scope(var_name)
-			
-			ret += self.visit(node.inner)
-			ret += self.pop_scope()
-		if len(node.attrs):
-			p = self.p
+			self.push_scope(var_name)
 			
-			for attr_name, attr_value in node.attrs:
-				attr_ast = p.parse(attr_value)
-				if isinstance(attr_ast, ast.Program):
-					v = ''
-					ret += self.push_scope()
-					tmp_var = self.roots[-1]
-					ret += self.visit(attr_ast.children())
-					self.roots.pop()
-					children_to_add = self.children_to_add.pop()
-					
-					for child in children_to_add:
-						if child not in self.root_map[tmp_var]:
-							ret += '{}{}.appendChild({});\n'.format(self.indent(), tmp_var, child)
-							self.root_map[tmp_var][child] = 1
-					v = tmp_var
-				else:
-					v = ''
-				ret += '{}.setAttribute("{}", {});\n'.format(var_name, attr_name, v.replace('\n', '\\n').replace('"', '\\"'))
-				
+			yield node.inner
+			self.pop_scope()
+		
+		for attr in node.attrs:
+			self.write('{}.setAttribute("{}", '.format(var_name, attr.name))
+			self.out.begin_capture()
+			yield attr
+			self.bind(attr, var_name, attr.name)
+			self.write(');\n')
+	
+	def visit_HTMLAttr(self, node):
+		if node.is_static():
+			self.write('"{}"'.format(''.join(part.data for part in node.parts)))
+			return
 		
-		return ret
+		if not isinstance(node.parts[0], ast.HTMLData) and len(node.parts) > 1:
+			# make sure + concatenates
+			self.write('"" + ')
+		yield self.write_all(node.parts, ' + ')
 	
 	def visit_HTMLComment(self, node):
 		comment_data = node.data['data'].strip()
@@ -526,30 +1520,6 @@ class JSDomplVisitor(Visitor):
 			if not isinstance(ret, list):
 				raise Exception("Found a Template() comment that does not specify a list of globals")
 			self.tpl_vars = ret
-		return ''
 	
 	def visit_HTMLData(self, node):
-		return '"{}"'.format(node.data)
-	
-	def parse_attribute_value(self, value):
-		""" Returns an AST for the attribute value
-		"""
-		ret = []
-		state = 'html'
-		
-		while len(value):
-			c = value.pop(0)
-			
-			if state == 'html':
-				if c == '{':
-					c2 = value[i + 1]
-					if c2 == '{':
-						c3 = value[i + 2]
-						if c3 == '{':
-							state = 'js expression'
-							
-							i += 3
-							continue
-		
-		
-		return ret
+		self.write('"{}"'.format(node.data))
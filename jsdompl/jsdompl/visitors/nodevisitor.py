@@ -24,8 +24,62 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
+from types import GeneratorType
 
-class ASTVisitor(object):
+from .. import ast
+
+# the node types whose methods are looked up when a visitor class is made
+NODE_TYPES = [
+	cls for cls in vars(ast).values()
+	if isinstance(cls, type) and issubclass(cls, ast.Node)
+	]
+
+
+class DispatchTable(dict):
+	"""Maps node types to the visit_<type name> function of a visitor class,
+	or to its generic_visit. Types not seen yet are looked up on first use.
+	"""
+
+	def __init__(self, cls):
+		dict.__init__(self)
+		self.cls = cls
+
+	def _lookup(self, name):
+		for klass in self.cls.__mro__:
+			if name in klass.__dict__:
+				return klass.__dict__[name]
+
+	def __missing__(self, node_type):
+		method = self._lookup('visit_' + node_type.__name__)
+		if method is None:
+			method = self._lookup('generic_visit')
+		self[node_type] = method
+		return method
+
+
+class VisitorType(type):
+	"""Gives every visitor class its own DispatchTable, filled in for
+	the AST node types."""
+
+	def __init__(cls, name, bases, namespace):
+		super(VisitorType, cls).__init__(name, bases, namespace)
+		cls._dispatch = DispatchTable(cls)
+		for node_type in NODE_TYPES:
+			cls._dispatch[node_type]
+
+
+def _visit(self, node):
+	"""Call the visit_<type name> method for node, or generic_visit."""
+	return self._dispatch[node.__class__](self, node)
+
+# made by calling the metaclass, which works under Python 2 and 3 alike
+DispatchVisitor = VisitorType('DispatchVisitor', (object,), {
+	'__doc__': 'Base class of visitors, dispatching on the type of nodes.',
+	'visit': _visit,
+	})
+
+
+class ASTVisitor(DispatchVisitor):
 	"""Base class for custom AST node visitors.
 
 	Example:
@@ -59,24 +113,183 @@ class ASTVisitor(object):
 
 	"""
 
-	def visit(self, node):
-		method = 'visit_%s' % node.__class__.__name__
-		return getattr(self, method, self.generic_visit)(node)
-
 	def generic_visit(self, node):
 		for child in node:
 			self.visit(child)
 
 
+# The walkers below keep the nodes still to visit on a list instead of the
+# Python stack, so they take time linear in the size of a tree and don't
+# run into the recursion limit however deep it is. Lists of nodes are
+# walked through as if their items were children of the list's owner.
+# A node that is to be left later is pushed back followed by _LEAVE.
+_LEAVE = object()
+
+def walk(tree, enter, leave = None, leave_types = ast.Node):
+	"""Walk `tree` depth first, in document order.
+
+	enter(node) is called when a node is reached, and returns the children
+	to walk into, or None for all of them. leave(node), if given, is
+	called once the children of a node have been walked, for the nodes
+	that are instances of `leave_types`.
+	"""
+	stack = [tree]
+	pop, push, extend = stack.pop, stack.append, stack.extend
+	while stack:
+		node = pop()
+		if node is None:
+			continue
+		if node is _LEAVE:
+			leave(pop())
+		elif type(node) is list:
+			extend(reversed(node))
+		else:
+			children = enter(node)
+			if leave is not None and isinstance(node, leave_types):
+				push(node)
+				push(_LEAVE)
+			if children is None:
+				children = node.children()
+			if children:
+				extend(reversed(children))
+
+
+def preorder(tree):
+	"""Yield the nodes of `tree`, each before its children."""
+	stack = [tree]
+	pop, extend = stack.pop, stack.extend
+	while stack:
+		node = pop()
+		if node is None:
+			continue
+		if type(node) is list:
+			extend(reversed(node))
+		else:
+			yield node
+			extend(reversed(node.children()))
+
+
+def postorder(tree):
+	"""Yield the nodes of `tree`, each after its children."""
+	stack = [tree]
+	pop, push, extend = stack.pop, stack.append, stack.extend
+	while stack:
+		node = pop()
+		if node is None:
+			continue
+		if node is _LEAVE:
+			yield pop()
+		elif type(node) is list:
+			extend(reversed(node))
+		else:
+			push(node)
+			push(_LEAVE)
+			extend(reversed(node.children()))
+
+
+ENTER = 'enter'
+LEAVE = 'leave'
+
+def events(tree):
+	"""Yield (ENTER, node) when a node of `tree` is reached and
+	(LEAVE, node) once its children have been."""
+	stack = [tree]
+	pop, push, extend = stack.pop, stack.append, stack.extend
+	while stack:
+		node = pop()
+		if node is None:
+			continue
+		if node is _LEAVE:
+			yield LEAVE, pop()
+		elif type(node) is list:
+			extend(reversed(node))
+		else:
+			yield ENTER, node
+			push(node)
+			push(_LEAVE)
+			extend(reversed(node.children()))
+
+
+class WalkingVisitor(DispatchVisitor):
+	"""Base class of visitors that walk a tree with an explicit stack, see
+	walk().
+
+	visit_<type name> methods are called as nodes are reached and return
+	the children to walk into, or None for all of them; they don't visit
+	the children themselves. leave(node), when defined, is called once the
+	children of a node of `leave_types` have been walked.
+	"""
+
+	leave = None
+	leave_types = ast.Node
+
+	def visit(self, tree):
+		# walk() inlined, this is the hot loop of the analysis passes
+		dispatch, leave, leave_types = self._dispatch, self.leave, self.leave_types
+		stack = [tree]
+		pop, push, extend = stack.pop, stack.append, stack.extend
+		while stack:
+			node = pop()
+			if node is None:
+				continue
+			if node is _LEAVE:
+				leave(pop())
+			elif type(node) is list:
+				extend(reversed(node))
+			else:
+				children = dispatch[node.__class__](self, node)
+				if leave is not None and isinstance(node, leave_types):
+					push(node)
+					push(_LEAVE)
+				if children is None:
+					children = node.children()
+				if children:
+					extend(reversed(children))
+
+	def generic_visit(self, node):
+		pass
+
+
+class SteppingVisitor(DispatchVisitor):
+	"""Base class of visitors that do work between the children of a node,
+	such as writing code, at constant Python stack depth.
+
+	visit_<type name> methods are generators that yield the nodes to visit
+	in turn instead of visiting them, and resume once a node has been. They
+	can also yield a generator of a helper method, which is run to its end
+	first. Methods that don't visit anything can be plain functions.
+	"""
+
+	def visit(self, node):
+		self.run(self._dispatch[node.__class__](self, node))
+
+	def run(self, steps):
+		"""Run `steps`, a generator of a visit or helper method, to its end,
+		visiting the nodes it yields."""
+		if type(steps) is not GeneratorType:
+			return
+		dispatch = self._dispatch
+		stack = [steps]
+		pop, push = stack.pop, stack.append
+		while stack:
+			try:
+				step = next(stack[-1])
+			except StopIteration:
+				pop()
+				continue
+			if type(step) is not GeneratorType:
+				step = dispatch[step.__class__](self, step)
+				if type(step) is not GeneratorType:
+					continue
+			push(step)
+
+
 class NodeVisitor(object):
 	"""Simple node visitor."""
 
 	def visit(self, node):
-		"""Returns a generator that walks all children recursively."""
-		for child in node:
-			yield child
-			for subchild in self.visit(child):
-				yield subchild
+		"""Returns a generator that walks all descendants of `node`."""
+		return preorder(list(node))
 
 
 def visit(node):
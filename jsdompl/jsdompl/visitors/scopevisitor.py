@@ -26,22 +26,11 @@ __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
 from .. import ast
 from ..scope import VarSymbol, FuncSymbol, LocalScope, SymbolTable
+from .nodevisitor import WalkingVisitor
 
 
-class Visitor(object):
-	def visit(self, node):
-		method = 'visit_%s' % node.__class__.__name__
-		return getattr(self, method, self.generic_visit)(node)
-
-	def generic_visit(self, node):
-		if node is None:
-			return
-		if isinstance(node, list):
-			for child in node:
-				self.visit(child)
-		else:
-			for child in node.children():
-				self.visit(child)
+# the scope passes walk trees with an explicit stack
+Visitor = WalkingVisitor
 
 
 class ScopeTreeVisitor(Visitor):
@@ -57,7 +46,7 @@ class ScopeTreeVisitor(Visitor):
 		if symbol not in self.current_scope:
 			self.current_scope.define(symbol)
 		ident.scope = self.current_scope
-		self.visit(node.initializer)
+		return [node.initializer]
 
 	def visit_Identifier(self, node):
 		node.scope = self.current_scope
@@ -81,15 +70,17 @@ class ScopeTreeVisitor(Visitor):
 			self.current_scope.define(VarSymbol(ident.value))
 			ident.scope = self.current_scope
 
-		for element in node.elements:
-			self.visit(element)
-
-		# pop the function scope
-		self.current_scope = self.current_scope.get_enclosing_scope()
+		return node.elements
 
 	# alias
 	visit_FuncExpr = visit_FuncDecl
 
+	leave_types = ast.FuncBase
+
+	def leave(self, node):
+		# pop the function scope
+		self.current_scope = self.current_scope.get_enclosing_scope()
+
 	def visit_Catch(self, node):
 		# The catch identifier actually lives in a new scope, but additional
 		# variables defined in the catch statement belong to the outer scope.
@@ -101,8 +92,7 @@ class ScopeTreeVisitor(Visitor):
 			self.current_scope.define(VarSymbol(ident.value))
 		ident.scope = self.current_scope
 
-		for element in node.elements:
-			self.visit(element)
+		return [node.elements]
 
 class RefVisitor(Visitor):
 	"""Fill 'ref' attribute in scopes."""
@@ -124,31 +114,80 @@ class RefVisitor(Visitor):
 		"""Put referenced name in 'ref' dictionary of a scope.
 
 		Walks up the scope tree and adds the name to 'ref' of every scope
-		up in the tree until a scope that defines referenced name is reached.
+		up in the tree until a scope that defines referenced name is reached,
+		or one that already has it, as do the scopes above it.
 		"""
 		symbol = scope.resolve(name)
 		if symbol is None:
 			return
 
 		orig_scope = symbol.scope
-		scope.refs[name] = orig_scope
-		while scope is not orig_scope:
-			scope = scope.get_enclosing_scope()
+		while scope.refs.get(name) is not orig_scope:
 			scope.refs[name] = orig_scope
+			if scope is orig_scope:
+				break
+			scope = scope.get_enclosing_scope()
 
 
-def mangle_scope_tree(root, toplevel):
+class FreeNameVisitor(Visitor):
+	"""Collects the names referenced but not defined by a tree, in order."""
+
+	def __init__(self):
+		self.names = []
+
+	def visit_Identifier(self, node):
+		if (RefVisitor._is_id_in_expr(node) and
+			node.scope.resolve(node.value) is None and
+			node.value not in self.names):
+			self.names.append(node.value)
+
+
+def free_names(tree):
+	"""Return the names `tree` references without defining them."""
+	ScopeTreeVisitor(SymbolTable()).visit(tree)
+	visitor = FreeNameVisitor()
+	visitor.visit(tree)
+	return visitor.names
+
+
+def mangle(tree, reserved = ()):
+	"""Mangle the names `tree` defines, including its top level ones.
+
+	Names in `reserved` and the names `tree` references without defining
+	are left to the names they refer to. Returns the set of mangled names.
+	"""
+	sym_table = SymbolTable()
+	ScopeTreeVisitor(sym_table).visit(tree)
+	visitor = FreeNameVisitor()
+	visitor.visit(tree)
+	fill_scope_references(tree)
+	mangle_scope_tree(
+		sym_table.globals, toplevel = True,
+		reserved = frozenset(reserved).union(visitor.names))
+	NameManglerVisitor().visit(tree)
+
+	names = set()
+	scopes = [sym_table.globals]
+	while scopes:
+		scope = scopes.pop()
+		names.update(scope.rev_mangled)
+		scopes.extend(scope.children)
+	return names
+
+
+def mangle_scope_tree(root, toplevel, reserved = ()):
 	"""Walk over a scope tree and mangle symbol names.
 
 	Args:
 		toplevel: Defines if global scope should be mangled or not.
+		reserved: Names that mangled names must not take.
 	"""
 	def mangle(scope):
 		# don't mangle global scope if not specified otherwise
 		if scope.get_enclosing_scope() is None and not toplevel:
 			return
 		for name in scope.symbols:
-			mangled_name = scope.get_next_mangled_name()
+			mangled_name = scope.get_next_mangled_name(reserved)
 			scope.mangled[name] = mangled_name
 			scope.rev_mangled[mangled_name] = name
 
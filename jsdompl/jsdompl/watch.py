@@ -0,0 +1,272 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+
+# inotify(7) event masks
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+# a file is only reported once it is written and closed, or moved in place,
+# so that half written files are not compiled
+WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+_EVENT = struct.Struct(str('iIII'))
+
+def scan(roots, predicate):
+	""" Returns the {path: (mtime, size)} of the files under `roots` for which
+	`predicate(path)` is true. `roots` is a list of (directory, recursive)
+	pairs.
+	"""
+	files = {}
+	for root, recursive in roots:
+		for directory, dirs, filenames in os.walk(root):
+			if not recursive:
+				del dirs[:]
+			for filename in filenames:
+				path = os.path.join(directory, filename)
+				if not predicate(path):
+					continue
+				try:
+					st = os.stat(path)
+				except OSError:
+					continue
+				files[path] = st.st_mtime, st.st_size
+	return files
+
+class PollingWatcher(object):
+	""" Finds the files that changed under `roots` by scanning them every
+	`interval` seconds. Works everywhere, but a scan takes time linear in the
+	number of files.
+
+	See InotifyWatcher for the arguments.
+	"""
+
+	def __init__(self, roots, predicate, debounce = 0.03, interval = 0.25):
+		self.roots = roots
+		self.predicate = predicate
+		self.debounce = debounce
+		self.interval = interval
+		self._files = scan(roots, predicate)
+
+	def _changes(self):
+		files = scan(self.roots, self.predicate)
+		changed = set(path for path in files if self._files.get(path) != files[path])
+		changed.update(path for path in self._files if path not in files)
+		self._files = files
+		return changed
+
+	def wait(self, timeout = None):
+		""" Returns the set of paths added, modified or removed since the last
+		call, waiting up to `timeout` seconds (forever by default) for one.
+		Changes are collected until none came for `debounce` seconds.
+		"""
+		end = None if timeout is None else time.time() + timeout
+		while True:
+			changed = self._changes()
+			if changed:
+				break
+			if end is not None and time.time() >= end:
+				return changed
+			time.sleep(self.interval)
+
+		while True:
+			time.sleep(self.debounce)
+			more = self._changes()
+			if not more:
+				return changed
+			changed.update(more)
+
+	def close(self):
+		pass
+
+class InotifyWatcher(object):
+	""" Finds the files that changed under `roots` with inotify(7), Linux only.
+
+	`roots` is a list of (directory, recursive) pairs, only the files for
+	which `predicate(path)` is true are reported. A burst of changes is
+	reported at once, after `debounce` seconds without any. Roots that don't
+	exist yet are not watched, unlike with PollingWatcher.
+
+	Raises OSError when inotify isn't available.
+	"""
+
+	def __init__(self, roots, predicate, debounce = 0.03):
+		self.roots = roots
+		self.predicate = predicate
+		self.debounce = debounce
+
+		self._libc = _load_libc()
+		self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+		if self.fd < 0:
+			_raise_errno()
+
+		# {watch descriptor: (directory, recursive)}
+		self._watches = {}
+		try:
+			for root, recursive in roots:
+				self._add_watch(root, recursive)
+		except BaseException:
+			self.close()
+			raise
+		# the files reported so far, to know which ones a directory that is
+		# moved away took with it
+		self._files = set(scan(roots, predicate))
+
+	def _add_watch(self, directory, recursive):
+		""" Watches `directory` and, if `recursive`, the directories under it.
+		Returns the files found under the directories that were watched, for
+		those created before the watch was in place.
+		"""
+		found = []
+		for path, dirs, filenames in os.walk(directory):
+			wd = self._libc.inotify_add_watch(self.fd, path.encode(sys.getfilesystemencoding()), WATCH_MASK)
+			if wd < 0:
+				if ctypes.get_errno() in (errno.ENOENT, errno.ENOTDIR):
+					# removed in the meantime
+					continue
+				_raise_errno()
+			self._watches[wd] = path, recursive
+			found.extend(os.path.join(path, filename) for filename in filenames)
+			if not recursive:
+				break
+		return found
+
+	def _read(self):
+		""" Returns the files the pending events are about
+		"""
+		changed = set()
+		removed = set()
+		while True:
+			try:
+				data = os.read(self.fd, 64 * 1024)
+			except OSError as e:
+				if e.errno in (errno.EAGAIN, errno.EINTR):
+					break
+				raise
+
+			pos = 0
+			while pos < len(data):
+				wd, mask, _, length = _EVENT.unpack_from(data, pos)
+				pos += _EVENT.size
+				name = data[pos:pos + length].rstrip(b'\0').decode(sys.getfilesystemencoding())
+				pos += length
+
+				if mask & IN_Q_OVERFLOW:
+					# events were lost, anything may have changed
+					files = set(scan(self.roots, self.predicate))
+					changed.update(files)
+					removed.update(self._files - files)
+					continue
+				if mask & IN_IGNORED:
+					self._watches.pop(wd, None)
+					continue
+				if wd not in self._watches:
+					continue
+				directory, recursive = self._watches[wd]
+				path = os.path.join(directory, name)
+				if mask & IN_ISDIR:
+					if recursive and mask & (IN_CREATE | IN_MOVED_TO):
+						changed.update(self._add_watch(path, recursive))
+					elif mask & IN_MOVED_FROM:
+						removed.update(self._drop_watches(path))
+				elif mask & (IN_DELETE | IN_MOVED_FROM):
+					removed.add(path)
+				elif not mask & IN_CREATE:
+					changed.add(path)
+
+		changed = set(path for path in changed if self.predicate(path))
+		self._files.update(changed)
+		removed &= self._files
+		self._files -= removed
+		return changed | removed
+
+	def _drop_watches(self, directory):
+		""" Stops watching `directory` and the directories under it, which
+		were moved away, and returns the files that were in them
+		"""
+		prefix = os.path.join(directory, '')
+		for wd, (path, _) in list(self._watches.items()):
+			if path == directory or path.startswith(prefix):
+				# the watch would follow the directory where it went
+				self._libc.inotify_rm_watch(self.fd, wd)
+				del self._watches[wd]
+		return set(path for path in self._files if path.startswith(prefix))
+
+	def _poll(self, timeout):
+		try:
+			readable, _, _ = select.select([self.fd], [], [], timeout)
+		except select.error as e:
+			if e.args[0] == errno.EINTR:
+				return False
+			raise
+		return bool(readable)
+
+	def wait(self, timeout = None):
+		""" Returns the set of paths added, modified or removed since the last
+		call, waiting up to `timeout` seconds (forever by default) for one.
+		"""
+		end = None if timeout is None else time.time() + timeout
+		changed = set()
+		while True:
+			remaining = None if end is None else max(0, end - time.time())
+			if self._poll(remaining):
+				changed.update(self._read())
+			if changed:
+				break
+			if end is not None and time.time() >= end:
+				return changed
+
+		while self._poll(self.debounce):
+			changed.update(self._read())
+		return changed
+
+	def close(self):
+		if self.fd >= 0:
+			os.close(self.fd)
+			self.fd = -1
+
+_libc = None
+
+def _load_libc():
+	global _libc
+	if _libc is None:
+		libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno = True)
+		if not hasattr(libc, 'inotify_init1'):
+			raise OSError(errno.ENOSYS, "inotify is not available")
+		_libc = libc
+	return _libc
+
+def _raise_errno():
+	code = ctypes.get_errno()
+	raise OSError(code, os.strerror(code))
+
+def make_watcher(roots, predicate, debounce = 0.03, poll = False):
+	""" Returns an InotifyWatcher for `roots`, or a PollingWatcher when
+	inotify isn't available or `poll` is true
+	"""
+	if not poll:
+		try:
+			return InotifyWatcher(roots, predicate, debounce)
+		except (OSError, AttributeError):
+			pass
+	return PollingWatcher(roots, predicate, debounce)
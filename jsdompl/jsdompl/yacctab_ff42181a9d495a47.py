@@ -0,0 +1,356 @@
+
+# /root/package/jsdompl/jsdompl/yacctab_ff42181a9d495a47.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'F2\xe0\x9d`~\xc0\xfa\x85k\x9d\x16\xfa=V\xa9'
+    
+_lr_action_items = {'VOID':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[12,-24,-1,-17,12,12,12,12,12,-25,-28,-311,-23,-15,12,-314,12,-10,-21,-19,12,-11,-22,-308,12,-13,12,-27,12,-307,-12,-9,-313,-312,-8,-4,-26,12,-14,-306,-6,-315,12,-309,-247,-20,-18,-16,12,12,12,-310,12,12,12,12,-56,-55,-54,-7,-295,-294,-2,12,12,12,12,12,12,-273,-272,12,-248,-249,12,12,12,12,12,12,12,-264,-265,12,12,12,12,12,-268,-269,12,12,12,12,12,12,12,12,12,12,12,12,12,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,12,12,-1,-57,12,12,-235,-236,12,-286,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,-274,-275,12,12,12,12,12,12,12,-290,-289,-29,-266,-267,12,-316,-271,-270,-305,-317,-319,-287,-288,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,-293,-291,12,12,12,12,-276,12,12,12,12,12,-254,-277,-318,-250,12,12,12,12,12,12,12,12,12,12,-296,12,12,-257,-292,-278,-252,-253,-251,12,-297,12,-258,12,12,12,12,-259,-255,-279,-256,]),'LBRACKET':([0,2,3,4,5,6,7,8,10,11,12,14,16,17,19,21,22,23,25,26,27,28,29,31,32,33,34,35,36,41,43,45,46,48,49,50,53,54,55,56,58,61,62,65,67,69,71,72,73,74,75,76,77,79,80,81,82,83,85,86,87,90,92,93,94,95,96,97,98,100,101,102,104,106,107,108,110,111,112,113,116,120,121,123,125,126,127,128,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,177,178,181,182,186,187,188,189,191,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,239,241,242,245,249,250,252,261,262,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,326,328,333,334,335,336,337,338,342,347,348,349,350,351,365,367,369,370,371,372,373,375,376,380,382,383,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,446,447,448,453,454,457,460,462,466,467,468,469,474,476,479,480,504,505,511,513,515,520,521,526,529,530,531,533,539,540,542,544,546,547,550,552,554,557,560,561,562,564,566,567,569,570,571,572,574,575,578,579,580,582,585,],[4,-24,-31,-1,-17,4,4,-75,4,4,4,-25,-74,-30,-28,-311,-23,-15,-45,4,-44,-314,4,-10,-21,-19,4,-11,-22,-308,-33,4,176,-13,4,-27,4,-307,186,-12,-9,4,-313,-312,-8,-4,-34,-32,-26,4,-35,-36,-14,-306,-6,-315,4,-309,-38,-37,-247,-20,-18,-16,-40,-39,4,-46,-47,4,4,-41,-310,4,4,4,4,-56,-55,-54,4,-42,249,-43,-70,-69,261,-44,-7,-295,-294,-2,4,4,4,4,4,4,-273,-272,4,-248,-249,4,4,4,4,4,4,-88,4,-264,-265,4,-87,4,4,261,4,4,-268,-269,4,4,4,4,4,4,4,4,4,4,4,4,4,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,4,4,-1,-50,-49,-57,261,4,-84,-58,4,-83,-235,-236,4,-286,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-274,-275,4,4,4,4,4,4,4,-90,-91,-290,-289,-29,-266,-267,-77,-78,4,-316,-271,-270,-305,-317,-48,-319,-287,-288,4,4,-73,-86,-59,4,-72,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-89,4,-92,-293,-291,-76,4,4,4,-51,-85,-60,-71,4,-276,4,4,4,4,4,-254,-277,-318,-250,4,-298,4,4,4,4,4,4,4,4,4,-299,-296,4,4,-257,-292,-278,-252,-253,-251,-300,4,-297,4,-258,4,4,4,-301,4,-259,-255,-279,-256,]),'TRUE':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,116,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[75,-24,-1,-17,75,75,75,75,75,-25,-28,-311,-23,-15,75,-314,75,-10,-21,-19,75,-11,-22,-308,75,-13,75,-27,75,-307,-12,-9,75,-313,-312,-8,-4,-26,75,-14,-306,-6,-315,75,-309,-247,-20,-18,-16,75,75,75,-310,75,75,75,75,-56,-55,-54,75,-7,-295,-294,-2,75,75,75,75,75,75,-273,-272,75,-248,-249,75,75,75,75,75,75,75,-264,-265,75,75,75,75,75,-268,-269,75,75,75,75,75,75,75,75,75,75,75,75,75,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,75,75,-1,-57,75,75,-235,-236,75,-286,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-274,-275,75,75,75,75,75,75,75,-290,-289,-29,-266,-267,75,-316,-271,-270,-305,-317,-319,-287,-288,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-293,-291,75,75,75,75,-276,75,75,75,75,75,-254,-277,-318,-250,75,75,75,75,75,75,75,75,75,75,-296,75,75,-257,-292,-278,-252,-253,-251,75,-297,75,-258,75,75,75,75,-259,-255,-279,-256,]),'MINUS':([0,2,3,4,5,6,7,8,10,11,12,13,14,16,17,19,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,40,41,43,45,46,48,49,50,51,53,54,55,56,58,62,65,67,69,70,71,72,73,74,75,76,77,79,80,81,82,83,85,86,87,90,92,93,94,95,96,97,98,99,100,101,102,104,106,107,108,110,111,112,113,115,117,118,119,120,121,123,124,125,126,127,128,129,130,131,132,133,134,135,139,140,141,142,143,144,145,146,151,152,158,160,161,163,164,165,166,167,168,169,170,173,174,176,177,178,181,182,184,186,187,188,189,190,191,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,231,232,236,238,239,241,242,244,245,246,247,249,250,252,261,262,263,264,266,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,304,305,306,324,326,328,333,334,335,336,337,338,342,347,348,349,350,351,365,367,369,370,371,372,373,375,376,380,382,383,387,388,389,398,399,400,407,408,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,446,447,448,453,454,457,460,462,466,467,468,469,474,476,479,480,497,504,505,511,513,515,520,521,526,529,530,531,533,539,540,542,544,546,547,550,552,554,557,560,561,562,564,566,567,569,570,571,572,574,575,578,579,580,582,585,],[6,-24,-31,-1,-17,6,6,-75,6,6,6,-97,-25,-74,-30,-28,-311,-23,-15,143,-45,6,-44,-314,6,-122,-10,-21,-19,6,-11,-22,-129,-308,-33,6,-98,-13,6,-27,-108,6,-307,-81,-12,-9,-313,-312,-8,-4,-107,-34,-32,-26,6,-35,-36,-14,-306,-6,-315,6,-309,-38,-37,-247,-20,-18,-16,-40,-39,6,-46,-47,-102,6,6,-41,-310,6,6,6,6,-56,-55,-54,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-7,-114,-109,-110,-295,-294,-2,6,6,6,6,6,-111,6,-126,-273,-118,297,-99,-272,-116,6,-248,-249,6,6,6,6,6,-112,6,-88,6,-264,-265,-117,6,-87,6,6,-82,-79,6,6,-268,-269,6,6,6,6,6,6,6,6,6,6,6,6,6,-219,-224,-225,-103,-222,-220,-227,-218,-221,-223,-226,-104,-217,-228,6,-113,6,-102,-1,-50,-49,-57,-80,-79,-100,-101,6,-84,-58,6,-83,-235,-236,6,297,297,297,-130,-131,-286,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,-274,-275,6,6,6,6,6,6,6,-125,-124,-123,-99,-90,-91,-290,-289,-29,-266,-267,-77,-78,6,-316,-271,-270,-305,-317,-48,-319,-287,-288,6,6,-73,-86,-59,6,-72,-120,-121,-119,297,297,297,-127,-128,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,-89,6,-92,-293,-291,-76,6,6,6,-51,-85,-60,-71,6,-276,6,6,6,6,6,-99,-254,-277,-318,-250,6,-298,6,6,6,6,6,6,6,6,6,-299,-296,6,6,-257,-292,-278,-252,-253,-251,-300,6,-297,6,-258,6,6,6,-301,6,-259,-255,-279,-256,]),'RPAREN':([3,17,25,43,71,72,75,76,85,86,94,95,97,98,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,148,149,150,152,153,154,155,157,158,159,160,162,163,171,174,178,184,230,231,239,241,244,245,246,247,250,252,262,302,307,309,310,328,329,330,340,344,367,368,374,375,376,380,383,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,410,411,412,417,443,457,458,460,461,462,466,470,493,494,498,502,503,512,517,518,520,527,529,544,547,549,551,564,568,575,],[-31,-30,-45,-33,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-193,-199,-140,-118,-187,-175,-211,-229,-132,-205,-99,-181,-116,308,-112,328,-117,367,-113,-50,-49,-80,-79,-100,-101,-84,-58,-83,413,414,-302,418,-91,443,-93,448,449,-48,454,459,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-230,-127,-128,-200,-212,-176,473,-92,-51,514,-85,516,-60,-71,-303,-260,-261,530,-94,532,538,543,-206,-298,550,-1,-299,-1,569,571,-300,578,-301,]),'PLUS':([0,2,3,4,5,6,7,8,10,11,12,13,14,16,17,19,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,40,41,43,45,46,48,49,50,51,53,54,55,56,58,62,65,67,69,70,71,72,73,74,75,76,77,79,80,81,82,83,85,86,87,90,92,93,94,95,96,97,98,99,100,101,102,104,106,107,108,110,111,112,113,115,117,118,119,120,121,123,124,125,126,127,128,129,130,131,132,133,134,135,139,140,141,142,143,144,145,146,151,152,158,160,161,163,164,165,166,167,168,169,170,173,174,176,177,178,181,182,184,186,187,188,189,190,191,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,231,232,236,238,239,241,242,244,245,246,247,249,250,252,261,262,263,264,266,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,304,305,306,324,326,328,333,334,335,336,337,338,342,347,348,349,350,351,365,367,369,370,371,372,373,375,376,380,382,383,387,388,389,398,399,400,407,408,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,446,447,448,453,454,457,460,462,466,467,468,469,474,476,479,480,497,504,505,511,513,515,520,521,526,529,530,531,533,539,540,542,544,546,547,550,552,554,557,560,561,562,564,566,567,569,570,571,572,574,575,578,579,580,582,585,],[10,-24,-31,-1,-17,10,10,-75,10,10,10,-97,-25,-74,-30,-28,-311,-23,-15,142,-45,10,-44,-314,10,-122,-10,-21,-19,10,-11,-22,-129,-308,-33,10,-98,-13,10,-27,-108,10,-307,-81,-12,-9,-313,-312,-8,-4,-107,-34,-32,-26,10,-35,-36,-14,-306,-6,-315,10,-309,-38,-37,-247,-20,-18,-16,-40,-39,10,-46,-47,-102,10,10,-41,-310,10,10,10,10,-56,-55,-54,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-7,-114,-109,-110,-295,-294,-2,10,10,10,10,10,-111,10,-126,-273,-118,296,-99,-272,-116,10,-248,-249,10,10,10,10,10,-112,10,-88,10,-264,-265,-117,10,-87,10,10,-82,-79,10,10,-268,-269,10,10,10,10,10,10,10,10,10,10,10,10,10,-219,-224,-225,-103,-222,-220,-227,-218,-221,-223,-226,-104,-217,-228,10,-113,10,-102,-1,-50,-49,-57,-80,-79,-100,-101,10,-84,-58,10,-83,-235,-236,10,296,296,296,-130,-131,-286,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,-274,-275,10,10,10,10,10,10,10,-125,-124,-123,-99,-90,-91,-290,-289,-29,-266,-267,-77,-78,10,-316,-271,-270,-305,-317,-48,-319,-287,-288,10,10,-73,-86,-59,10,-72,-120,-121,-119,296,296,296,-127,-128,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,-89,10,-92,-293,-291,-76,10,10,10,-51,-85,-60,-71,10,-276,10,10,10,10,10,-99,-254,-277,-318,-250,10,-298,10,10,10,10,10,10,10,10,10,-299,-296,10,10,-257,-292,-278,-252,-253,-251,-300,10,-297,10,-258,10,10,10,-301,10,-259,-255,-279,-256,]),'BOR':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,60,70,71,72,75,76,84,85,86,88,89,91,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,148,150,152,153,154,158,160,162,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,314,315,316,317,320,324,326,328,338,341,342,343,353,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,407,408,412,441,443,447,457,460,462,466,475,481,482,483,484,485,486,487,488,489,490,491,495,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-191,-107,-34,-32,-35,-36,202,-38,-37,-179,-170,-185,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,283,-140,-118,-187,-175,-132,-99,-181,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-165,-183,-147,-189,-177,435,-99,-90,-91,-77,-186,-78,202,-192,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,-180,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,283,-135,-134,-133,-182,-161,-162,-164,-163,-127,-128,-176,-89,-92,-76,-51,-85,-60,-71,435,-152,-149,-148,-151,-150,-178,-184,-166,-167,-169,-168,-190,-99,-298,-299,-300,-300,-301,-301,]),'GT':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,315,324,326,328,338,342,354,355,356,357,358,359,360,361,362,363,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,441,443,447,457,460,462,466,481,482,483,484,485,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,208,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,278,-140,-118,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,424,-147,-99,-90,-91,-77,-78,278,278,278,278,-158,-155,-154,-157,-156,-159,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,278,278,278,278,-127,-128,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,278,278,278,278,-99,-298,-299,-300,-300,-301,-301,]),'DEBUGGER':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[15,-24,-17,15,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,15,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,15,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,15,-273,-272,-248,-249,-264,-265,-268,-269,15,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,15,-316,-271,-270,-305,-317,-319,-287,-288,15,15,-293,-291,15,15,-276,15,15,-254,-277,-318,-250,15,15,15,15,15,15,-296,15,-257,-292,-278,-252,-253,-251,15,-297,15,-258,15,15,15,15,-259,-255,-279,-256,]),'PERIOD':([3,8,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,102,120,121,123,125,126,127,128,177,187,191,239,241,245,250,252,262,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,520,544,546,564,567,575,],[-31,-75,-74,-30,-45,-44,-33,175,185,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-41,-42,248,-43,-70,-69,260,-44,-88,-87,260,-50,-49,260,-84,-58,-83,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,-298,-299,-300,-300,-301,-301,]),'GE':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,315,324,326,328,338,342,354,355,356,357,358,359,360,361,362,363,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,441,443,447,457,460,462,466,481,482,483,484,485,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,210,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,280,-140,-118,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,426,-147,-99,-90,-91,-77,-78,280,280,280,280,-158,-155,-154,-157,-156,-159,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,280,280,280,280,-127,-128,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,280,280,280,280,-99,-298,-299,-300,-300,-301,-301,]),'VAR':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,173,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[18,-24,-17,18,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,18,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,18,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,18,-273,-272,-248,-249,312,-264,-265,-268,-269,18,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,18,-316,-271,-270,-305,-317,-319,-287,-288,18,18,-293,-291,18,18,-276,18,18,-254,-277,-318,-250,18,18,18,18,18,18,-296,18,-257,-292,-278,-252,-253,-251,18,-297,18,-258,18,18,18,18,-259,-255,-279,-256,]),'THIS':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,116,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[25,-24,-1,-17,25,25,25,25,25,-25,-28,-311,-23,-15,25,-314,25,-10,-21,-19,25,-11,-22,-308,25,-13,25,-27,25,-307,-12,-9,25,-313,-312,-8,-4,-26,25,-14,-306,-6,-315,25,-309,-247,-20,-18,-16,25,25,25,-310,25,25,25,25,-56,-55,-54,25,-7,-295,-294,-2,25,25,25,25,25,25,-273,-272,25,-248,-249,25,25,25,25,25,25,25,-264,-265,25,25,25,25,25,-268,-269,25,25,25,25,25,25,25,25,25,25,25,25,25,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,25,25,-1,-57,25,25,-235,-236,25,-286,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-274,-275,25,25,25,25,25,25,25,-290,-289,-29,-266,-267,25,-316,-271,-270,-305,-317,-319,-287,-288,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-293,-291,25,25,25,25,-276,25,25,25,25,25,-254,-277,-318,-250,25,25,25,25,25,25,25,25,25,25,-296,25,25,-257,-292,-278,-252,-253,-251,25,-297,25,-258,25,25,25,25,-259,-255,-279,-256,]),'MINUSEQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,219,-41,-95,-42,-96,-43,-70,-69,-79,-44,219,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,219,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,219,-298,-299,-300,-300,-301,-301,]),'HTML_ENDTAG':([2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,444,446,452,468,504,505,511,513,546,552,554,557,560,561,562,567,570,579,580,582,585,],[-24,-17,-5,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,-1,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,-1,-316,-271,-270,-305,-317,-319,-287,-288,-293,-291,511,-276,-254,-277,-318,-250,-296,-257,-292,-278,-252,-253,-251,-297,-258,-259,-255,-279,-256,]),'TYPEOF':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[26,-24,-1,-17,26,26,26,26,26,-25,-28,-311,-23,-15,26,-314,26,-10,-21,-19,26,-11,-22,-308,26,-13,26,-27,26,-307,-12,-9,-313,-312,-8,-4,-26,26,-14,-306,-6,-315,26,-309,-247,-20,-18,-16,26,26,26,-310,26,26,26,26,-56,-55,-54,-7,-295,-294,-2,26,26,26,26,26,26,-273,-272,26,-248,-249,26,26,26,26,26,26,26,-264,-265,26,26,26,26,26,-268,-269,26,26,26,26,26,26,26,26,26,26,26,26,26,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,26,26,-1,-57,26,26,-235,-236,26,-286,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-274,-275,26,26,26,26,26,26,26,-290,-289,-29,-266,-267,26,-316,-271,-270,-305,-317,-319,-287,-288,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-293,-291,26,26,26,26,-276,26,26,26,26,26,-254,-277,-318,-250,26,26,26,26,26,26,26,26,26,26,-296,26,26,-257,-292,-278,-252,-253,-251,26,-297,26,-258,26,26,26,26,-259,-255,-279,-256,]),'OR':([1,3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,60,64,70,71,72,75,76,84,85,86,88,89,91,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,148,149,150,152,153,154,158,159,160,162,163,174,177,184,187,190,191,218,226,231,236,237,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,311,313,314,315,316,317,320,324,325,326,328,338,341,342,343,353,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,407,408,410,412,441,443,447,457,460,462,466,475,481,482,483,484,485,486,487,488,489,490,491,495,497,501,520,544,546,564,567,575,],[108,-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-191,-203,-107,-34,-32,-35,-36,-197,-38,-37,-179,-170,-185,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-193,-199,-140,-118,-187,-175,-132,299,-99,-181,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-204,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-201,-165,-183,-147,-189,-177,-195,-99,440,-90,-91,-77,-186,-78,-198,-192,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,-180,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-127,-128,-200,-176,-89,-92,-76,-51,-85,-60,-71,-196,-152,-149,-148,-151,-150,-178,-184,-166,-167,-169,-168,-190,-99,-202,-298,-299,-300,-300,-301,-301,]),'HTML_WS':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,416,444,446,468,469,474,504,505,511,513,515,521,540,542,546,552,554,557,560,561,562,566,567,570,572,574,579,580,582,585,],[28,-24,-17,28,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,28,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,28,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,28,-316,-271,-270,-305,-317,-319,-287,-288,28,-293,-291,-276,28,28,-254,-277,-318,-250,28,28,28,28,-296,-257,-292,-278,-252,-253,-251,28,-297,-258,28,28,-259,-255,-279,-256,]),'DIVEQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,215,-41,-95,-42,-96,-43,-70,-69,-79,-44,215,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,215,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,215,-298,-299,-300,-300,-301,-301,]),'RETURN':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[29,-24,-17,29,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,29,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,29,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,29,-273,-272,-248,-249,-264,-265,-268,-269,29,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,29,-316,-271,-270,-305,-317,-319,-287,-288,29,29,-293,-291,29,29,-276,29,29,-254,-277,-318,-250,29,29,29,29,29,29,-296,29,-257,-292,-278,-252,-253,-251,29,-297,29,-258,29,29,29,29,-259,-255,-279,-256,]),'RSHIFTEQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,216,-41,-95,-42,-96,-43,-70,-69,-79,-44,216,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,216,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,216,-298,-299,-300,-300,-301,-301,]),'EQEQ':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,88,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,154,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,315,317,324,326,328,338,342,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,412,441,443,447,457,460,462,466,481,482,483,484,485,486,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,203,-170,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-140,-118,289,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-165,-147,430,-99,-90,-91,-77,-78,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,203,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,-161,-162,-164,-163,-127,-128,289,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,430,-166,-167,-169,-168,-99,-298,-299,-300,-300,-301,-301,]),'SETPROP':([122,379,],[254,254,]),'BNOT':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[34,-24,-1,-17,34,34,34,34,34,-25,-28,-311,-23,-15,34,-314,34,-10,-21,-19,34,-11,-22,-308,34,-13,34,-27,34,-307,-12,-9,-313,-312,-8,-4,-26,34,-14,-306,-6,-315,34,-309,-247,-20,-18,-16,34,34,34,-310,34,34,34,34,-56,-55,-54,-7,-295,-294,-2,34,34,34,34,34,34,-273,-272,34,-248,-249,34,34,34,34,34,34,34,-264,-265,34,34,34,34,34,-268,-269,34,34,34,34,34,34,34,34,34,34,34,34,34,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,34,34,-1,-57,34,34,-235,-236,34,-286,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-274,-275,34,34,34,34,34,34,34,-290,-289,-29,-266,-267,34,-316,-271,-270,-305,-317,-319,-287,-288,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-293,-291,34,34,34,34,-276,34,34,34,34,34,-254,-277,-318,-250,34,34,34,34,34,34,34,34,34,34,-296,34,34,-257,-292,-278,-252,-253,-251,34,-297,34,-258,34,34,34,34,-259,-255,-279,-256,]),'JS_TERMINATOR':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,416,444,446,468,469,474,504,505,511,513,515,521,540,542,546,552,554,557,560,561,562,566,567,570,572,574,579,580,582,585,],[35,-24,-17,35,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,35,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,35,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,35,-316,-271,-270,-305,-317,-319,-287,-288,35,-293,-291,-276,35,35,-254,-277,-318,-250,35,35,35,35,-296,-257,-292,-278,-252,-253,-251,35,-297,-258,35,35,-259,-255,-279,-256,]),'HTML_ATTR':([68,105,194,195,233,345,346,348,365,450,451,507,508,509,510,],[-1,-1,345,-320,345,-1,-321,-316,-317,-322,-323,-325,-327,-326,-324,]),'WITH':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[37,-24,-17,37,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,37,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,37,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,37,-273,-272,-248,-249,-264,-265,-268,-269,37,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,37,-316,-271,-270,-305,-317,-319,-287,-288,37,37,-293,-291,37,37,-276,37,37,-254,-277,-318,-250,37,37,37,37,37,37,-296,37,-257,-292,-278,-252,-253,-251,37,-297,37,-258,37,37,37,37,-259,-255,-279,-256,]),'COLON':([3,17,25,27,43,71,72,75,76,85,86,94,95,97,98,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,148,149,150,152,153,154,155,157,158,159,160,162,163,174,184,231,235,239,241,244,245,246,247,250,252,255,257,258,259,262,311,313,314,315,316,317,320,321,325,328,367,375,376,380,383,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,443,457,460,462,466,475,481,482,483,484,485,486,487,488,489,490,491,495,497,499,500,501,518,520,544,553,555,559,564,575,],[-31,-30,-45,145,-33,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-193,-199,-140,-118,-187,-175,-211,-229,-132,-205,-99,-181,-116,-112,-117,-113,372,-50,-49,-80,-79,-100,-101,-84,-58,-68,-66,382,-67,-83,-201,-165,-183,-147,-189,-177,-195,-213,-207,-91,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-230,-127,-128,467,-200,-212,-176,-92,-51,-85,-60,-71,-196,-152,-149,-148,-151,-150,-178,-184,-166,-167,-169,-168,-190,-99,-214,531,-202,-206,-298,-299,-208,572,574,-300,-301,]),'$end':([0,2,5,7,9,14,19,21,22,23,28,31,32,33,35,36,38,41,48,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,348,349,350,351,365,369,370,371,444,446,468,504,505,511,513,546,552,554,557,560,561,562,567,570,579,580,582,585,],[-1,-24,-17,-5,0,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-3,-308,-13,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,-1,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,-316,-271,-270,-305,-317,-319,-287,-288,-293,-291,-276,-254,-277,-318,-250,-296,-257,-292,-278,-252,-253,-251,-297,-258,-259,-255,-279,-256,]),'FUNCTION':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,116,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[42,-24,-1,-17,114,42,114,114,114,-25,-28,-311,-23,-15,114,-314,114,-10,-21,-19,114,-11,-22,-308,114,-13,42,-27,114,-307,-12,-9,114,-313,-312,-8,-4,-26,114,-14,-306,-6,-315,42,-309,-247,-20,-18,-16,114,114,114,-310,114,114,114,114,-56,-55,-54,114,-7,-295,-294,-2,114,114,114,114,114,42,-273,-272,114,-248,-249,114,114,114,114,114,114,114,-264,-265,114,114,114,114,114,-268,-269,42,114,114,114,114,114,114,114,114,114,114,114,114,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,114,114,-1,-57,114,114,-235,-236,114,-286,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,-274,-275,114,114,114,114,114,114,114,-290,-289,-29,-266,-267,42,-316,-271,-270,-305,-317,-319,-287,-288,114,114,114,42,42,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,-293,-291,42,114,42,114,-276,42,42,114,114,114,-254,-277,-318,-250,42,42,114,114,42,114,114,42,42,42,-296,114,42,-257,-292,-278,-252,-253,-251,42,-297,42,-258,42,42,42,42,-259,-255,-279,-256,]),'FOR':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[44,-24,-17,44,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,44,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,44,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,44,-273,-272,-248,-249,-264,-265,-268,-269,44,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,44,-316,-271,-270,-305,-317,-319,-287,-288,44,44,-293,-291,44,44,-276,44,44,-254,-277,-318,-250,44,44,44,44,44,44,-296,44,-257,-292,-278,-252,-253,-251,44,-297,44,-258,44,44,44,44,-259,-255,-279,-256,]),'PLUSPLUS':([0,2,3,4,5,6,7,8,10,11,12,13,14,16,17,19,21,22,23,25,26,27,28,29,31,32,33,34,35,36,41,43,45,46,48,49,50,53,54,55,56,58,62,65,67,69,71,72,73,74,75,76,77,79,80,81,82,83,85,86,87,90,92,93,94,95,96,97,98,99,100,101,102,104,106,107,108,110,111,112,113,117,119,120,121,123,125,126,127,128,129,133,134,135,139,140,141,142,143,145,151,160,161,164,165,166,167,168,169,170,173,176,177,178,181,182,186,187,188,189,190,191,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,236,238,239,241,242,244,245,249,250,252,261,262,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,324,326,328,333,334,335,336,337,338,342,347,348,349,350,351,365,367,369,370,371,372,373,375,376,380,382,383,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,446,447,448,453,454,457,460,462,466,467,468,469,474,476,479,480,497,504,505,511,513,515,520,521,526,529,530,531,533,539,540,542,544,546,547,550,552,554,557,560,561,562,564,566,567,569,570,571,572,574,575,578,579,580,582,585,],[45,-24,-31,-1,-17,45,45,-75,45,45,45,-97,-25,-74,-30,-28,-311,-23,-15,-45,45,-44,-314,45,-10,-21,-19,45,-11,-22,-308,-33,45,-98,-13,45,-27,45,-307,-81,-12,-9,-313,-312,-8,-4,-34,-32,-26,45,-35,-36,-14,-306,-6,-315,45,-309,-38,-37,-247,-20,-18,-16,-40,-39,45,-46,-47,218,45,45,-41,-310,45,45,45,45,-56,-55,-54,246,-95,-42,-96,-43,-70,-69,-79,-44,-7,-295,-294,-2,45,45,45,45,45,45,-273,246,-272,45,-248,-249,45,45,45,45,45,45,-88,45,-264,-265,45,-87,45,45,-82,-79,45,45,-268,-269,45,45,45,45,45,45,45,45,45,45,45,45,45,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,45,45,218,-1,-50,-49,-57,-80,-79,45,-84,-58,45,-83,-235,-236,45,-286,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-274,-275,45,45,45,45,45,45,45,246,-90,-91,-290,-289,-29,-266,-267,-77,-78,45,-316,-271,-270,-305,-317,-48,-319,-287,-288,45,45,-73,-86,-59,45,-72,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-89,45,-92,-293,-291,-76,45,45,45,-51,-85,-60,-71,45,-276,45,45,45,45,45,246,-254,-277,-318,-250,45,-298,45,45,45,45,45,45,45,45,45,-299,-296,45,45,-257,-292,-278,-252,-253,-251,-300,45,-297,45,-258,45,45,45,-301,45,-259,-255,-279,-256,]),'JS_OPEN':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[79,-24,-17,79,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,79,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,79,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,79,-273,-272,-248,-249,-264,-265,-268,-269,79,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,79,-316,-271,-270,-305,-317,-319,-287,-288,79,79,-293,-291,79,79,-276,79,79,-254,-277,-318,-250,79,79,79,79,79,79,-296,79,-257,-292,-278,-252,-253,-251,79,-297,79,-258,79,79,79,79,-259,-255,-279,-256,]),'ELSE':([2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,348,349,350,351,365,369,370,371,444,446,468,504,505,511,513,546,552,554,557,560,561,562,567,570,579,580,582,585,],[-24,-17,-5,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,-1,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,-316,-271,-270,-305,-317,-319,-287,-288,-293,-291,-276,-254,-277,-318,539,-296,-257,-292,-278,-252,-253,-251,-297,-258,-259,-255,-279,-256,]),'TRY':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[47,-24,-17,47,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,47,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,47,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,47,-273,-272,-248,-249,-264,-265,-268,-269,47,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,47,-316,-271,-270,-305,-317,-319,-287,-288,47,47,-293,-291,47,47,-276,47,47,-254,-277,-318,-250,47,47,47,47,47,47,-296,47,-257,-292,-278,-252,-253,-251,47,-297,47,-258,47,47,47,47,-259,-255,-279,-256,]),'EQ':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,137,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,422,441,443,447,457,460,462,466,497,520,525,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,227,-41,-95,-42,-96,-43,-70,-69,-79,-44,266,227,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,227,-90,-91,-77,-78,-48,-73,-86,-59,-72,480,-89,-92,-76,-51,-85,-60,-71,227,-298,480,-299,-300,-300,-301,-301,]),'AND':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,60,64,70,71,72,75,76,84,85,86,88,89,91,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,148,149,150,152,153,154,158,160,162,163,174,177,184,187,190,191,218,226,231,236,237,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,311,313,314,315,316,317,320,324,326,328,338,341,342,343,353,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,407,408,410,412,441,443,447,457,460,462,466,475,481,482,483,484,485,486,487,488,489,490,491,495,497,501,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-191,192,-107,-34,-32,-35,-36,-197,-38,-37,-179,-170,-185,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-193,284,-140,-118,-187,-175,-132,-99,-181,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,192,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,419,-165,-183,-147,-189,-177,-195,-99,-90,-91,-77,-186,-78,-198,-192,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,-180,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-127,-128,284,-176,-89,-92,-76,-51,-85,-60,-71,-196,-152,-149,-148,-151,-150,-178,-184,-166,-167,-169,-168,-190,-99,419,-298,-299,-300,-300,-301,-301,]),'LBRACE':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,47,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,110,111,112,113,116,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,193,197,198,200,203,204,205,206,207,208,209,210,211,212,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,308,331,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,414,416,418,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,449,453,454,459,467,468,469,473,474,476,479,480,504,505,511,513,514,515,516,521,526,529,530,531,532,533,539,540,542,543,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[49,-24,-1,-17,122,49,122,122,122,-25,-28,-311,-23,-15,122,-314,122,-10,-21,-19,122,-11,-22,-308,122,49,-13,49,-27,122,-307,-12,-9,122,-313,-312,-8,-4,-26,122,-14,-306,-6,-315,49,-309,-247,-20,-18,-16,122,122,122,-310,122,122,122,-56,-55,-54,122,-7,-295,-294,-2,122,122,122,122,122,49,-273,-272,122,-248,-249,122,122,122,122,122,122,122,-264,-265,122,122,122,-268,-269,49,122,122,122,122,122,122,122,122,122,122,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,122,122,-1,-57,122,122,-235,-236,122,-286,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,-274,-275,122,122,122,122,122,122,122,416,49,-290,-289,-29,-266,-267,49,-316,-271,-270,-305,-317,-319,-287,-288,122,122,122,49,469,49,474,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,-293,-291,49,506,122,49,515,122,-276,49,521,49,122,122,122,-254,-277,-318,-250,540,49,542,49,122,122,49,122,49,122,49,49,49,566,-296,122,49,-257,-292,-278,-252,-253,-251,49,-297,49,-258,49,49,49,49,-259,-255,-279,-256,]),'HTML_ATTR_TEXT':([345,348,365,450,451,507,508,509,510,],[-1,-316,-317,507,-323,-325,-327,-326,-324,]),'CONTINUE':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[52,-24,-17,52,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,52,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,52,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,52,-273,-272,-248,-249,-264,-265,-268,-269,52,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,52,-316,-271,-270,-305,-317,-319,-287,-288,52,52,-293,-291,52,52,-276,52,52,-254,-277,-318,-250,52,52,52,52,52,52,-296,52,-257,-292,-278,-252,-253,-251,52,-297,52,-258,52,52,52,52,-259,-255,-279,-256,]),'NOT':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[53,-24,-1,-17,53,53,53,53,53,-25,-28,-311,-23,-15,53,-314,53,-10,-21,-19,53,-11,-22,-308,53,-13,53,-27,53,-307,-12,-9,-313,-312,-8,-4,-26,53,-14,-306,-6,-315,53,-309,-247,-20,-18,-16,53,53,53,-310,53,53,53,53,-56,-55,-54,-7,-295,-294,-2,53,53,53,53,53,53,-273,-272,53,-248,-249,53,53,53,53,53,53,53,-264,-265,53,53,53,53,53,-268,-269,53,53,53,53,53,53,53,53,53,53,53,53,53,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,53,53,-1,-57,53,53,-235,-236,53,-286,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-274,-275,53,53,53,53,53,53,53,-290,-289,-29,-266,-267,53,-316,-271,-270,-305,-317,-319,-287,-288,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-293,-291,53,53,53,53,-276,53,53,53,53,53,-254,-277,-318,-250,53,53,53,53,53,53,53,53,53,53,-296,53,53,-257,-292,-278,-252,-253,-251,53,-297,53,-258,53,53,53,53,-259,-255,-279,-256,]),'OREQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,228,-41,-95,-42,-96,-43,-70,-69,-79,-44,228,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,228,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,228,-298,-299,-300,-300,-301,-301,]),'DELETE':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[11,-24,-1,-17,11,11,11,11,11,-25,-28,-311,-23,-15,11,-314,11,-10,-21,-19,11,-11,-22,-308,11,-13,11,-27,11,-307,-12,-9,-313,-312,-8,-4,-26,11,-14,-306,-6,-315,11,-309,-247,-20,-18,-16,11,11,11,-310,11,11,11,11,-56,-55,-54,-7,-295,-294,-2,11,11,11,11,11,11,-273,-272,11,-248,-249,11,11,11,11,11,11,11,-264,-265,11,11,11,11,11,-268,-269,11,11,11,11,11,11,11,11,11,11,11,11,11,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,11,11,-1,-57,11,11,-235,-236,11,-286,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-274,-275,11,11,11,11,11,11,11,-290,-289,-29,-266,-267,11,-316,-271,-270,-305,-317,-319,-287,-288,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-293,-291,11,11,11,11,-276,11,11,11,11,11,-254,-277,-318,-250,11,11,11,11,11,11,11,11,11,11,-296,11,11,-257,-292,-278,-252,-253,-251,11,-297,11,-258,11,11,11,11,-259,-255,-279,-256,]),'MOD':([3,8,13,16,17,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,152,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,271,272,304,305,306,324,326,328,338,342,367,375,376,380,383,387,388,389,407,408,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-122,168,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,275,-118,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,275,275,-125,-124,-123,-99,-90,-91,-77,-78,-48,-73,-86,-59,-72,-120,-121,-119,275,275,-89,-92,-76,-51,-85,-60,-71,-99,-298,-299,-300,-300,-301,-301,]),'EXPRESSION_TERMINATOR':([3,17,25,43,71,72,75,76,85,86,94,95,97,98,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,148,149,150,152,153,154,155,157,158,159,160,162,163,174,184,214,231,239,241,244,245,246,247,250,252,262,328,367,375,376,380,383,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,410,411,412,443,457,460,462,466,518,520,544,564,575,],[-31,-30,-45,-33,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-193,-199,-140,-118,-187,-175,-211,-229,-132,-205,-99,-181,-116,-112,-117,365,-113,-50,-49,-80,-79,-100,-101,-84,-58,-83,-91,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-230,-127,-128,-200,-212,-176,-92,-51,-85,-60,-71,-206,-298,-299,-300,-301,]),'RSHIFT':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,150,152,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,315,324,326,328,338,342,358,359,360,361,362,363,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,407,408,441,443,447,457,460,462,466,481,482,483,484,485,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,140,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,286,-118,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,286,-99,-90,-91,-77,-78,286,286,286,286,286,286,-48,-73,-86,-59,-72,-120,-121,-119,286,286,286,286,286,286,-135,-134,-133,-127,-128,-89,-92,-76,-51,-85,-60,-71,286,286,286,286,286,-99,-298,-299,-300,-300,-301,-301,]),'DEFAULT':([2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,348,349,350,351,365,369,370,371,444,446,468,504,505,506,511,513,534,535,536,537,546,552,554,556,557,560,561,562,567,570,572,579,580,581,582,585,],[-24,-17,-5,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,-1,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,-316,-271,-270,-305,-317,-319,-287,-288,-293,-291,-276,-254,-277,-1,-318,-250,-281,559,-282,-280,-296,-257,-292,-283,-278,-252,-253,-251,-297,-258,-1,-259,-255,-284,-279,-256,]),'WHILE':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,201,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[59,-24,-17,59,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,59,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,59,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,59,-273,-272,-248,-249,-264,-265,-268,-269,59,352,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,59,-316,-271,-270,-305,-317,-319,-287,-288,59,59,-293,-291,59,59,-276,59,59,-254,-277,-318,-250,59,59,59,59,59,59,-296,59,-257,-292,-278,-252,-253,-251,59,-297,59,-258,59,59,59,59,-259,-255,-279,-256,]),'NEW':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,116,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[61,-24,-1,-17,116,61,116,116,116,-25,-28,-311,-23,-15,116,-314,116,-10,-21,-19,116,-11,-22,-308,116,-13,61,-27,116,-307,-12,-9,116,-313,-312,-8,-4,-26,116,-14,-306,-6,-315,61,-309,-247,-20,-18,-16,116,116,116,-310,116,116,61,116,-56,-55,-54,116,-7,-295,-294,-2,116,116,116,116,116,61,-273,-272,116,-248,-249,116,116,116,116,116,116,116,-264,-265,116,116,61,61,116,-268,-269,61,61,116,116,116,116,116,116,116,116,116,116,61,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,116,116,-1,-57,116,116,-235,-236,116,-286,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-274,-275,116,116,116,116,116,116,116,-290,-289,-29,-266,-267,61,-316,-271,-270,-305,-317,-319,-287,-288,116,116,116,61,61,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-293,-291,61,116,61,116,-276,61,61,116,116,116,-254,-277,-318,-250,61,61,116,116,61,116,116,61,61,61,-296,116,61,-257,-292,-278,-252,-253,-251,61,-297,61,-258,61,61,61,61,-259,-255,-279,-256,]),'HTML_CHARS':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,416,444,446,468,469,474,504,505,511,513,515,521,540,542,546,552,554,557,560,561,562,566,567,570,572,574,579,580,582,585,],[62,-24,-17,62,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,62,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,62,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,62,-316,-271,-270,-305,-317,-319,-287,-288,62,-293,-291,-276,62,62,-254,-277,-318,-250,62,62,62,62,-296,-257,-292,-278,-252,-253,-251,62,-297,-258,62,62,-259,-255,-279,-256,]),'CASE':([2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,348,349,350,351,365,369,370,371,444,446,468,504,505,506,511,513,534,536,546,552,554,556,557,558,560,561,562,567,570,572,574,579,580,581,582,583,585,],[-24,-17,-5,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,-1,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,-316,-271,-270,-305,-317,-319,-287,-288,-293,-291,-276,-254,-277,533,-318,-250,533,-282,-296,-257,-292,-283,-278,533,-252,-253,-251,-297,-258,-1,-1,-259,-255,-284,-279,-285,-256,]),'MODEQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,220,-41,-95,-42,-96,-43,-70,-69,-79,-44,220,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,220,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,220,-298,-299,-300,-300,-301,-301,]),'NE':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,88,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,154,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,315,317,324,326,328,338,342,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,412,441,443,447,457,460,462,466,481,482,483,484,485,486,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,204,-170,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-140,-118,290,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-165,-147,431,-99,-90,-91,-77,-78,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,204,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,-161,-162,-164,-163,-127,-128,290,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,431,-166,-167,-169,-168,-99,-298,-299,-300,-300,-301,-301,]),'MULTEQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,222,-41,-95,-42,-96,-43,-70,-69,-79,-44,222,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,222,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,222,-298,-299,-300,-300,-301,-301,]),'SWITCH':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[66,-24,-17,66,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,66,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,66,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,66,-273,-272,-248,-249,-264,-265,-268,-269,66,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,66,-316,-271,-270,-305,-317,-319,-287,-288,66,66,-293,-291,66,66,-276,66,66,-254,-277,-318,-250,66,66,66,66,66,66,-296,66,-257,-292,-278,-252,-253,-251,66,-297,66,-258,66,66,66,66,-259,-255,-279,-256,]),'HTML_STARTTAG':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,416,444,446,468,469,474,504,505,511,513,515,521,540,542,546,552,554,557,560,561,562,566,567,570,572,574,579,580,582,585,],[68,-24,-17,68,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,68,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,68,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,68,-316,-271,-270,-305,-317,-319,-287,-288,68,-293,-291,-276,68,68,-254,-277,-318,-250,68,68,68,68,-296,-257,-292,-278,-252,-253,-251,68,-297,-258,68,68,-259,-255,-279,-256,]),'CATCH':([179,335,],[332,-29,]),'STREQ':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,88,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,154,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,315,317,324,326,328,338,342,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,412,441,443,447,457,460,462,466,481,482,483,484,485,486,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,206,-170,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-140,-118,292,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-165,-147,433,-99,-90,-91,-77,-78,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,206,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,-161,-162,-164,-163,-127,-128,292,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,433,-166,-167,-169,-168,-99,-298,-299,-300,-300,-301,-301,]),'INSTANCEOF':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,315,324,326,328,338,342,354,355,356,357,358,359,360,361,362,363,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,441,443,447,457,460,462,466,481,482,483,484,485,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,207,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,277,-140,-118,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,423,-147,-99,-90,-91,-77,-78,277,277,277,277,-158,-155,-154,-157,-156,-159,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,277,277,277,277,-127,-128,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,277,277,277,277,-99,-298,-299,-300,-300,-301,-301,]),'PLUSEQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,223,-41,-95,-42,-96,-43,-70,-69,-79,-44,223,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,223,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,223,-298,-299,-300,-300,-301,-301,]),'ESCAPED_OPEN':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,345,347,348,349,350,351,365,369,370,371,416,444,446,450,451,468,469,474,504,505,507,508,509,510,511,513,515,521,540,542,546,552,554,557,560,561,562,566,567,570,572,574,579,580,582,585,],[74,-24,-17,74,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,74,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,74,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,-1,74,-316,-271,-270,-305,-317,-319,-287,-288,74,-293,-291,74,-323,-276,74,74,-254,-277,-325,-327,-326,-324,-318,-250,74,74,74,74,-296,-257,-292,-278,-252,-253,-251,74,-297,-258,74,74,-259,-255,-279,-256,]),'GETPROP':([122,379,],[251,251,]),'FALSE':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,116,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[76,-24,-1,-17,76,76,76,76,76,-25,-28,-311,-23,-15,76,-314,76,-10,-21,-19,76,-11,-22,-308,76,-13,76,-27,76,-307,-12,-9,76,-313,-312,-8,-4,-26,76,-14,-306,-6,-315,76,-309,-247,-20,-18,-16,76,76,76,-310,76,76,76,76,-56,-55,-54,76,-7,-295,-294,-2,76,76,76,76,76,76,-273,-272,76,-248,-249,76,76,76,76,76,76,76,-264,-265,76,76,76,76,76,-268,-269,76,76,76,76,76,76,76,76,76,76,76,76,76,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,76,76,-1,-57,76,76,-235,-236,76,-286,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-274,-275,76,76,76,76,76,76,76,-290,-289,-29,-266,-267,76,-316,-271,-270,-305,-317,-319,-287,-288,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-293,-291,76,76,76,76,-276,76,76,76,76,76,-254,-277,-318,-250,76,76,76,76,76,76,76,76,76,76,-296,76,76,-257,-292,-278,-252,-253,-251,76,-297,76,-258,76,76,76,76,-259,-255,-279,-256,]),'CONDOP':([1,3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,60,64,70,71,72,75,76,84,85,86,88,89,91,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,148,149,150,152,153,154,158,159,160,162,163,174,177,184,187,190,191,218,226,231,236,237,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,311,313,314,315,316,317,320,324,325,326,328,338,341,342,343,353,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,407,408,410,412,441,443,447,457,460,462,466,475,481,482,483,484,485,486,487,488,489,490,491,495,497,501,520,544,546,564,567,575,],[107,-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-191,-203,-107,-34,-32,-35,-36,-197,-38,-37,-179,-170,-185,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-193,-199,-140,-118,-187,-175,-132,298,-99,-181,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-204,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-201,-165,-183,-147,-189,-177,-195,-99,439,-90,-91,-77,-186,-78,-198,-192,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,-180,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-127,-128,-200,-176,-89,-92,-76,-51,-85,-60,-71,-196,-152,-149,-148,-151,-150,-178,-184,-166,-167,-169,-168,-190,-99,-202,-298,-299,-300,-300,-301,-301,]),'BREAK':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[78,-24,-17,78,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,78,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,78,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,78,-273,-272,-248,-249,-264,-265,-268,-269,78,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,78,-316,-271,-270,-305,-317,-319,-287,-288,78,78,-293,-291,78,78,-276,78,78,-254,-277,-318,-250,78,78,78,78,78,78,-296,78,-257,-292,-278,-252,-253,-251,78,-297,78,-258,78,78,78,78,-259,-255,-279,-256,]),'URSHIFTEQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,217,-41,-95,-42,-96,-43,-70,-69,-79,-44,217,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,217,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,217,-298,-299,-300,-300,-301,-301,]),'error':([1,3,8,13,15,16,17,20,24,25,27,29,30,39,40,43,46,51,52,55,57,60,63,64,70,71,72,75,76,78,84,85,86,88,89,91,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,136,137,138,144,146,147,148,149,150,152,153,154,155,156,157,158,159,160,162,163,174,177,183,184,187,190,191,199,218,226,231,234,236,237,239,241,244,245,246,247,250,252,262,267,268,269,270,271,272,303,304,305,306,326,328,338,341,342,343,353,354,355,356,357,358,359,360,361,362,363,364,366,367,375,376,380,383,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,410,411,412,441,443,447,455,457,460,462,466,518,520,538,544,546,564,567,575,],[-209,-31,-75,-97,135,-74,-30,-153,-136,-45,-44,135,-122,135,-129,-33,-98,-108,135,-81,-233,-191,-215,-203,-107,-34,-32,-35,-36,135,-197,-38,-37,-179,-170,-185,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,135,-241,-237,-111,-126,-160,-193,-199,-140,-118,-187,-175,-211,135,-229,-132,-205,-99,-181,-116,-112,-88,135,-117,-87,-82,-79,135,-103,-104,-113,135,-102,-204,-50,-49,-80,-79,-100,-101,-84,-58,-83,-242,-139,-138,-137,-130,-131,-234,-125,-124,-123,-90,-91,-77,-186,-78,-198,-192,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,-180,-216,-48,-73,-86,-59,-72,-238,-245,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-230,-127,-128,-200,-212,-176,-89,-92,-76,-210,-51,-85,-60,-71,-206,-298,135,-299,-300,-300,-301,-301,]),'ANDEQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,225,-41,-95,-42,-96,-43,-70,-69,-79,-44,225,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,225,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,225,-298,-299,-300,-300,-301,-301,]),'HTML_COMMENT':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,416,444,446,468,469,474,504,505,511,513,515,521,540,542,546,552,554,557,560,561,562,566,567,570,572,574,579,580,582,585,],[81,-24,-17,81,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,81,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,81,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,81,-316,-271,-270,-305,-317,-319,-287,-288,81,-293,-291,-276,81,81,-254,-277,-318,-250,81,81,81,81,-296,-257,-292,-278,-252,-253,-251,81,-297,-258,81,81,-259,-255,-279,-256,]),'DO':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[82,-24,-17,82,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,82,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,82,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,82,-273,-272,-248,-249,-264,-265,-268,-269,82,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,82,-316,-271,-270,-305,-317,-319,-287,-288,82,82,-293,-291,82,82,-276,82,82,-254,-277,-318,-250,82,82,82,82,82,82,-296,82,-257,-292,-278,-252,-253,-251,82,-297,82,-258,82,82,82,82,-259,-255,-279,-256,]),'NUMBER':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,116,122,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,251,254,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,379,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[85,-24,-1,-17,85,85,85,85,85,-25,-28,-311,-23,-15,85,-314,85,-10,-21,-19,85,-11,-22,-308,85,-13,85,-27,85,-307,-12,-9,85,-313,-312,-8,-4,-26,85,-14,-306,-6,-315,85,-309,-247,-20,-18,-16,85,85,85,-310,85,85,85,85,-56,-55,-54,85,85,-7,-295,-294,-2,85,85,85,85,85,85,-273,-272,85,-248,-249,85,85,85,85,85,85,85,-264,-265,85,85,85,85,85,-268,-269,85,85,85,85,85,85,85,85,85,85,85,85,85,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,85,85,-1,-57,85,85,85,85,-235,-236,85,-286,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-274,-275,85,85,85,85,85,85,85,-290,-289,-29,-266,-267,85,-316,-271,-270,-305,-317,-319,-287,-288,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-293,-291,85,85,85,85,-276,85,85,85,85,85,-254,-277,-318,-250,85,85,85,85,85,85,85,85,85,85,-296,85,85,-257,-292,-278,-252,-253,-251,85,-297,85,-258,85,85,85,85,-259,-255,-279,-256,]),'LSHIFT':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,150,152,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,315,324,326,328,338,342,358,359,360,361,362,363,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,407,408,441,443,447,457,460,462,466,481,482,483,484,485,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,141,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,287,-118,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,287,-99,-90,-91,-77,-78,287,287,287,287,287,287,-48,-73,-86,-59,-72,-120,-121,-119,287,287,287,287,287,287,-135,-134,-133,-127,-128,-89,-92,-76,-51,-85,-60,-71,287,287,287,287,287,-99,-298,-299,-300,-300,-301,-301,]),'DIV':([3,8,13,16,17,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,152,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,271,272,304,305,306,324,326,328,338,342,367,375,376,380,383,387,388,389,407,408,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-122,169,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,274,-118,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,274,274,-125,-124,-123,-99,-90,-91,-77,-78,-48,-73,-86,-59,-72,-120,-121,-119,274,274,-89,-92,-76,-51,-85,-60,-71,-99,-298,-299,-300,-300,-301,-301,]),'NULL':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,116,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[86,-24,-1,-17,86,86,86,86,86,-25,-28,-311,-23,-15,86,-314,86,-10,-21,-19,86,-11,-22,-308,86,-13,86,-27,86,-307,-12,-9,86,-313,-312,-8,-4,-26,86,-14,-306,-6,-315,86,-309,-247,-20,-18,-16,86,86,86,-310,86,86,86,86,-56,-55,-54,86,-7,-295,-294,-2,86,86,86,86,86,86,-273,-272,86,-248,-249,86,86,86,86,86,86,86,-264,-265,86,86,86,86,86,-268,-269,86,86,86,86,86,86,86,86,86,86,86,86,86,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,86,86,-1,-57,86,86,-235,-236,86,-286,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-274,-275,86,86,86,86,86,86,86,-290,-289,-29,-266,-267,86,-316,-271,-270,-305,-317,-319,-287,-288,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-293,-291,86,86,86,86,-276,86,86,86,86,86,-254,-277,-318,-250,86,86,86,86,86,86,86,86,86,86,-296,86,86,-257,-292,-278,-252,-253,-251,86,-297,86,-258,86,86,86,86,-259,-255,-279,-256,]),'HTML_TAG_END':([68,105,194,195,233,345,346,348,365,450,451,507,508,509,510,],[-1,-1,347,-320,369,-1,-321,-316,-317,-322,-323,-325,-327,-326,-324,]),'MULT':([3,8,13,16,17,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,152,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,271,272,304,305,306,324,326,328,338,342,367,375,376,380,383,387,388,389,407,408,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-122,170,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,276,-118,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,276,276,-125,-124,-123,-99,-90,-91,-77,-78,-48,-73,-86,-59,-72,-120,-121,-119,276,276,-89,-92,-76,-51,-85,-60,-71,-99,-298,-299,-300,-300,-301,-301,]),'RBRACE':([2,3,5,7,14,17,19,21,22,23,25,28,31,32,33,35,36,41,43,48,49,50,54,56,58,62,65,67,69,71,72,73,75,76,77,79,80,81,83,85,86,87,90,92,93,94,95,97,98,102,104,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,144,146,147,148,149,150,151,152,153,154,155,158,159,160,161,162,163,165,166,174,180,181,182,184,197,198,200,231,239,241,244,245,246,247,250,252,253,256,262,263,264,273,293,294,328,333,334,335,336,337,348,349,350,351,365,367,369,370,371,375,376,379,380,383,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,407,408,410,411,412,416,443,444,446,457,460,462,463,465,466,468,469,471,472,474,504,505,506,511,513,515,518,519,520,521,522,534,535,536,537,540,541,542,544,545,546,552,554,556,557,558,560,561,562,563,564,565,566,567,570,572,573,574,575,576,577,579,580,581,582,583,584,585,],[-24,-31,-17,-5,-25,-30,-28,-311,-23,-15,-45,-314,-10,-21,-19,-11,-22,-308,-33,-13,-1,-27,-307,-12,-9,-313,-312,-8,-4,-34,-32,-26,-35,-36,-14,-306,-6,-315,-309,-38,-37,-247,-20,-18,-16,-40,-39,-46,-47,-41,-310,-115,-99,-105,-95,-42,-96,252,-43,-106,-70,-69,-79,-44,-7,-114,-109,-110,-295,-294,-2,-111,-126,-160,-193,-199,-140,-273,-118,-187,-175,-211,-132,-205,-99,-272,-181,-116,-248,-249,-112,335,-264,-265,-117,-268,-269,-1,-113,-50,-49,-80,-79,-100,-101,-84,-58,380,-61,-83,-235,-236,-286,-274,-275,-91,-290,-289,-29,-266,-267,-316,-271,-270,-305,-317,-48,-319,-287,-288,-73,-86,462,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-127,-128,-200,-212,-176,-1,-92,-293,-291,-51,-85,-60,-62,-63,-71,-276,-1,-304,520,-1,-254,-277,-1,-318,-250,-1,-206,544,-298,-1,546,-281,557,-282,-280,-1,564,-1,-299,567,-296,-257,-292,-283,-278,-1,-252,-253,-251,575,-300,576,-1,-297,-258,-1,582,-1,-301,-64,584,-259,-255,-284,-279,-285,-65,-256,]),'LE':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,315,324,326,328,338,342,354,355,356,357,358,359,360,361,362,363,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,441,443,447,457,460,462,466,481,482,483,484,485,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,211,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,281,-140,-118,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,427,-147,-99,-90,-91,-77,-78,281,281,281,281,-158,-155,-154,-157,-156,-159,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,281,281,281,281,-127,-128,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,281,281,281,281,-99,-298,-299,-300,-300,-301,-301,]),'SEMI':([0,1,2,3,5,7,8,13,14,15,16,17,19,20,21,22,23,24,25,27,28,29,30,31,32,33,35,36,39,40,41,43,46,48,49,50,51,52,54,55,56,57,58,60,62,63,64,65,67,69,70,71,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,98,99,102,104,115,117,118,119,120,121,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,165,166,173,174,177,181,182,183,184,187,190,191,197,198,199,200,218,226,231,234,236,237,239,241,244,245,246,247,250,252,262,263,264,267,268,269,270,271,272,273,293,294,303,304,305,306,311,313,314,315,316,317,318,319,320,321,322,323,324,325,326,328,333,334,335,336,337,338,341,342,343,347,348,349,350,351,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,369,370,371,375,376,380,383,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,410,411,412,413,416,420,421,422,434,441,443,444,446,447,448,454,455,457,460,462,466,468,469,474,475,476,478,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,499,501,504,505,511,513,515,518,520,521,523,524,525,528,530,538,539,540,542,544,546,548,550,552,553,554,557,560,561,562,564,566,567,569,570,571,572,574,575,578,579,580,582,585,],[87,-209,-24,-31,-17,87,-75,-97,-25,134,-74,-30,-28,-153,-311,-23,-15,-136,-45,-44,-314,161,-122,-10,-21,-19,-11,-22,165,-129,-308,-33,-98,-13,87,-27,-108,181,-307,-81,-12,-233,-9,-191,-313,-215,-203,-312,-8,-4,-107,-34,-32,-26,-35,-36,-14,197,-306,-6,-315,87,-309,-197,-38,-37,-247,-179,-170,-20,-185,-18,-16,-40,-39,-46,-47,-102,-41,-310,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-7,-114,-109,-110,-295,-294,-2,263,-241,-237,-111,87,-126,-160,-193,-199,-140,-273,-118,-187,-175,-211,293,-229,-132,-205,-99,-272,-181,-116,-248,-249,-1,-112,-88,-264,-265,336,-117,-87,-82,-79,-268,-269,350,87,-103,-104,-113,370,-102,-204,-50,-49,-80,-79,-100,-101,-84,-58,-83,-235,-236,-242,-139,-138,-137,-130,-131,-286,-274,-275,-234,-125,-124,-123,-201,-165,-183,-147,-189,-177,-231,434,-195,-213,-263,-262,-99,-207,-90,-91,-290,-289,-29,-266,-267,-77,-186,-78,-198,87,-316,-271,-270,-305,-192,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,-180,-317,-216,-48,-319,-287,-288,-73,-86,-59,-72,-238,-245,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-230,-127,-128,-200,-212,-176,87,87,-239,476,-243,-1,-89,-92,-293,-291,-76,87,87,-210,-51,-85,-60,-71,-276,87,87,-196,-1,-244,-152,-149,-148,-151,-150,-178,-184,-166,-167,-169,-168,529,-260,-261,-190,-232,-99,-214,-202,-254,-277,-318,-250,87,-206,-298,87,547,-240,-243,-246,87,560,87,87,87,-299,-296,-244,87,-257,-208,-292,-278,-252,-253,-251,-300,87,-297,87,-258,87,87,87,-301,87,-259,-255,-279,-256,]),'BXOR':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,60,70,71,72,75,76,85,86,88,89,91,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,153,154,158,160,162,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,314,315,316,317,324,326,328,338,341,342,353,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,396,398,399,400,401,402,403,404,405,407,408,412,441,443,447,457,460,462,466,481,482,483,484,485,486,487,488,489,490,491,495,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,189,-107,-34,-32,-35,-36,-38,-37,-179,-170,-185,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-140,-118,288,-175,-132,-99,-181,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-165,-183,-147,429,-177,-99,-90,-91,-77,-186,-78,189,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,-180,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,288,-135,-134,-133,-182,-161,-162,-164,-163,-127,-128,-176,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,-178,-184,-166,-167,-169,-168,429,-99,-298,-299,-300,-300,-301,-301,]),'LT':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,315,324,326,328,338,342,354,355,356,357,358,359,360,361,362,363,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,441,443,447,457,460,462,466,481,482,483,484,485,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,209,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,279,-140,-118,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,425,-147,-99,-90,-91,-77,-78,279,279,279,279,-158,-155,-154,-157,-156,-159,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,279,279,279,279,-127,-128,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,279,279,279,279,-99,-298,-299,-300,-300,-301,-301,]),'COMMA':([1,3,4,8,13,16,17,20,24,25,27,30,39,40,43,46,51,55,57,60,63,64,70,71,72,75,76,84,85,86,88,89,91,94,95,97,98,99,102,109,111,112,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,136,137,138,144,146,147,148,149,150,152,153,154,155,156,157,158,159,160,162,163,174,177,184,187,190,191,196,214,218,226,230,231,234,236,237,238,239,240,241,242,244,245,246,247,250,252,253,256,262,267,268,269,270,271,272,302,303,304,305,306,307,309,311,313,314,315,316,317,318,320,321,322,324,325,326,327,328,329,330,338,339,340,341,342,343,344,353,354,355,356,357,358,359,360,361,362,363,364,366,367,368,375,376,377,380,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,410,411,412,417,420,421,422,441,443,447,455,456,457,458,460,462,463,465,466,470,475,478,481,482,483,484,485,486,487,488,489,490,491,494,495,496,497,498,499,501,502,512,517,518,520,524,525,527,528,544,546,548,549,553,555,564,567,575,576,584,],[-209,-31,111,-75,-97,-74,-30,-153,-136,-45,-44,-122,167,-129,-33,-98,-108,-81,-233,-191,-215,-203,-107,-34,-32,-35,-36,-197,-38,-37,-179,-170,-185,-40,-39,-46,-47,-102,-41,238,-56,242,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,265,-241,-237,-111,-126,-160,-193,-199,-140,-118,-187,-175,-211,295,-229,-132,-205,-99,-181,-116,-112,-88,-117,-87,-82,-79,295,295,-103,-104,295,-113,295,-102,-204,111,-50,-52,-49,-57,-80,-79,-100,-101,-84,-58,379,-61,-83,-242,-139,-138,-137,-130,-131,295,-234,-125,-124,-123,415,-302,-201,-165,-183,-147,-189,-177,-231,-195,-213,436,-99,-207,-90,295,-91,442,-93,-77,295,295,-186,-78,-198,295,-192,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,-180,-216,-48,295,-73,-86,295,-59,-72,295,-238,-245,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-230,-127,-128,-200,-212,-176,415,-239,477,-243,-89,-92,-76,-210,-53,-51,415,-85,-60,-62,-63,-71,-303,-196,-244,-152,-149,-148,-151,-150,-178,-184,-166,-167,-169,-168,295,-190,-232,-99,295,-214,-202,-94,295,415,-206,-298,-240,-243,295,-246,-299,-300,-244,295,-208,295,-300,-301,-301,-64,-65,]),'ESCAPED_TERMINATOR':([3,17,25,43,71,72,75,76,85,86,94,95,97,98,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,148,149,150,152,153,154,155,157,158,159,160,162,163,174,184,196,231,239,241,244,245,246,247,250,252,262,328,367,375,376,380,383,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,410,411,412,443,457,460,462,466,518,520,544,564,575,],[-31,-30,-45,-33,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-193,-199,-140,-118,-187,-175,-211,-229,-132,-205,-99,-181,-116,-112,-117,348,-113,-50,-49,-80,-79,-100,-101,-84,-58,-83,-91,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-230,-127,-128,-200,-212,-176,-92,-51,-85,-60,-71,-206,-298,-299,-300,-301,]),'REGEX':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,116,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[94,-24,-1,-17,94,94,94,94,94,-25,-28,-311,-23,-15,94,-314,94,-10,-21,-19,94,-11,-22,-308,94,-13,94,-27,94,-307,-12,-9,94,-313,-312,-8,-4,-26,94,-14,-306,-6,-315,94,-309,-247,-20,-18,-16,94,94,94,-310,94,94,94,94,-56,-55,-54,94,-7,-295,-294,-2,94,94,94,94,94,94,-273,-272,94,-248,-249,94,94,94,94,94,94,94,-264,-265,94,94,94,94,94,-268,-269,94,94,94,94,94,94,94,94,94,94,94,94,94,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,94,94,-1,-57,94,94,-235,-236,94,-286,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-274,-275,94,94,94,94,94,94,94,-290,-289,-29,-266,-267,94,-316,-271,-270,-305,-317,-319,-287,-288,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-293,-291,94,94,94,94,-276,94,94,94,94,94,-254,-277,-318,-250,94,94,94,94,94,94,94,94,94,94,-296,94,94,-257,-292,-278,-252,-253,-251,94,-297,94,-258,94,94,94,94,-259,-255,-279,-256,]),'STRING':([0,2,4,5,6,7,10,11,12,14,19,21,22,23,26,28,29,31,32,33,34,35,36,41,45,48,49,50,53,54,56,58,61,62,65,67,69,73,74,77,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,116,122,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,173,176,178,181,182,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,249,251,254,261,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,379,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,446,448,453,454,467,468,469,474,476,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[95,-24,-1,-17,95,95,95,95,95,-25,-28,-311,-23,-15,95,-314,95,-10,-21,-19,95,-11,-22,-308,95,-13,95,-27,95,-307,-12,-9,95,-313,-312,-8,-4,-26,95,-14,-306,-6,-315,95,-309,-247,-20,-18,-16,95,95,95,-310,95,95,95,95,-56,-55,-54,95,95,-7,-295,-294,-2,95,95,95,95,95,95,-273,-272,95,-248,-249,95,95,95,95,95,95,95,-264,-265,95,95,95,95,95,-268,-269,95,95,95,95,95,95,95,95,95,95,95,95,95,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,95,95,-1,-57,95,95,95,95,-235,-236,95,-286,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-274,-275,95,95,95,95,95,95,95,-290,-289,-29,-266,-267,95,-316,-271,-270,-305,-317,-319,-287,-288,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-293,-291,95,95,95,95,-276,95,95,95,95,95,-254,-277,-318,-250,95,95,95,95,95,95,95,95,95,95,-296,95,95,-257,-292,-278,-252,-253,-251,95,-297,95,-258,95,95,95,95,-259,-255,-279,-256,]),'EXPRESSION_OPEN':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,345,347,348,349,350,351,365,369,370,371,416,444,446,450,451,468,469,474,504,505,507,508,509,510,511,513,515,521,540,542,546,552,554,557,560,561,562,566,567,570,572,574,579,580,582,585,],[96,-24,-17,96,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,96,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,96,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,-1,96,-316,-271,-270,-305,-317,-319,-287,-288,96,-293,-291,96,-323,-276,96,96,-254,-277,-325,-327,-326,-324,-318,-250,96,96,96,96,-296,-257,-292,-278,-252,-253,-251,96,-297,-258,96,96,-259,-255,-279,-256,]),'BAND':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,88,89,91,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,154,158,160,162,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,314,315,317,324,326,328,338,341,342,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,401,402,403,404,405,407,408,412,441,443,447,457,460,462,466,481,482,483,484,485,486,487,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,-179,-170,213,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-140,-118,-175,-132,-99,301,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-165,428,-147,-177,-99,-90,-91,-77,213,-78,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,-180,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,301,-161,-162,-164,-163,-127,-128,-176,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,-178,428,-166,-167,-169,-168,-99,-298,-299,-300,-300,-301,-301,]),'FINALLY':([179,334,335,554,],[331,331,-29,-292,]),'STRNEQ':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,88,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,154,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,313,315,317,324,326,328,338,342,354,355,356,357,358,359,360,361,362,363,364,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,412,441,443,447,457,460,462,466,481,482,483,484,485,486,488,489,490,491,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,205,-170,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-140,-118,291,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-165,-147,432,-99,-90,-91,-77,-78,-171,-172,-174,-173,-158,-155,-154,-157,-156,-159,205,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,-161,-162,-164,-163,-127,-128,291,-89,-92,-76,-51,-85,-60,-71,-152,-149,-148,-151,-150,432,-166,-167,-169,-168,-99,-298,-299,-300,-300,-301,-301,]),'LPAREN':([0,2,3,4,5,6,7,8,10,11,12,14,16,17,19,21,22,23,25,26,27,28,29,31,32,33,34,35,36,37,41,42,43,44,45,46,48,49,50,53,54,55,56,58,59,61,62,65,66,67,69,71,72,73,74,75,76,77,79,80,81,82,83,85,86,87,90,92,93,94,95,96,97,98,100,101,102,103,104,106,107,108,110,111,112,113,114,116,120,121,123,125,126,127,128,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,172,173,176,177,178,181,182,186,187,188,189,191,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,239,241,242,243,245,249,250,252,255,257,259,261,262,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,326,328,332,333,334,335,336,337,338,342,347,348,349,350,351,352,365,367,369,370,371,372,373,375,376,378,380,381,382,383,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,446,447,448,453,454,457,460,462,466,467,468,469,474,476,479,480,504,505,511,513,515,520,521,526,529,530,531,533,539,540,542,544,546,547,550,552,554,557,560,561,562,564,566,567,569,570,571,572,574,575,578,579,580,582,585,],[100,-24,-31,-1,-17,100,100,-75,100,100,100,-25,-74,-30,-28,-311,-23,-15,-45,100,-44,-314,100,-10,-21,-19,100,-11,-22,164,-308,171,-33,173,100,178,-13,100,-27,100,-307,178,-12,-9,188,100,-313,-312,193,-8,-4,-34,-32,-26,100,-35,-36,-14,-306,-6,-315,100,-309,-38,-37,-247,-20,-18,-16,-40,-39,100,-46,-47,100,100,-41,232,-310,100,100,100,100,-56,-55,-54,171,100,-42,178,-43,-70,-69,178,-44,-7,-295,-294,-2,100,100,100,100,100,100,-273,-272,100,-248,-249,100,100,100,100,310,100,100,-88,100,-264,-265,100,-87,100,100,178,100,100,-268,-269,100,100,100,100,100,100,100,100,100,100,100,100,100,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,100,100,-1,-50,-49,-57,374,178,100,-84,-58,-68,-66,-67,100,-83,-235,-236,100,-286,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-274,-275,100,100,100,100,100,100,100,-90,-91,445,-290,-289,-29,-266,-267,-77,-78,100,-316,-271,-270,-305,453,-317,-48,-319,-287,-288,100,100,-73,-86,461,-59,464,100,-72,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-89,100,-92,-293,-291,-76,100,100,100,-51,-85,-60,-71,100,-276,100,100,100,100,100,-254,-277,-318,-250,100,-298,100,100,100,100,100,100,100,100,100,-299,-296,100,100,-257,-292,-278,-252,-253,-251,-300,100,-297,100,-258,100,100,100,-301,100,-259,-255,-279,-256,]),'IN':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,89,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,150,152,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,311,313,314,315,316,317,320,321,324,325,326,328,338,342,354,355,356,357,358,359,360,361,362,363,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,402,403,404,405,407,408,422,441,443,447,457,460,462,466,475,478,481,482,483,484,485,486,487,488,489,490,491,495,497,499,501,520,528,544,546,553,564,567,575,],[-31,-75,-97,-74,-30,-153,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,212,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,282,-140,-118,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,-201,-165,-183,-147,-189,-177,-195,-213,437,-207,-90,-91,-77,-78,282,282,282,282,-158,-155,-154,-157,-156,-159,-48,-73,-86,-59,-72,-120,-121,-119,-145,-142,-141,-144,-143,-146,-135,-134,-133,282,282,282,282,-127,-128,479,-89,-92,-76,-51,-85,-60,-71,-196,526,-152,-149,-148,-151,-150,-178,-184,282,282,282,282,-190,-99,-214,-202,-298,-246,-299,-300,-208,-300,-301,-301,]),'MINUSMINUS':([0,2,3,4,5,6,7,8,10,11,12,13,14,16,17,19,21,22,23,25,26,27,28,29,31,32,33,34,35,36,41,43,45,46,48,49,50,53,54,55,56,58,62,65,67,69,71,72,73,74,75,76,77,79,80,81,82,83,85,86,87,90,92,93,94,95,96,97,98,99,100,101,102,104,106,107,108,110,111,112,113,117,119,120,121,123,125,126,127,128,129,133,134,135,139,140,141,142,143,145,151,160,161,164,165,166,167,168,169,170,173,176,177,178,181,182,186,187,188,189,190,191,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,236,238,239,241,242,244,245,249,250,252,261,262,263,264,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,324,326,328,333,334,335,336,337,338,342,347,348,349,350,351,365,367,369,370,371,372,373,375,376,380,382,383,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,446,447,448,453,454,457,460,462,466,467,468,469,474,476,479,480,497,504,505,511,513,515,520,521,526,529,530,531,533,539,540,542,544,546,547,550,552,554,557,560,561,562,564,566,567,569,570,571,572,574,575,578,579,580,582,585,],[101,-24,-31,-1,-17,101,101,-75,101,101,101,-97,-25,-74,-30,-28,-311,-23,-15,-45,101,-44,-314,101,-10,-21,-19,101,-11,-22,-308,-33,101,-98,-13,101,-27,101,-307,-81,-12,-9,-313,-312,-8,-4,-34,-32,-26,101,-35,-36,-14,-306,-6,-315,101,-309,-38,-37,-247,-20,-18,-16,-40,-39,101,-46,-47,226,101,101,-41,-310,101,101,101,101,-56,-55,-54,247,-95,-42,-96,-43,-70,-69,-79,-44,-7,-295,-294,-2,101,101,101,101,101,101,-273,247,-272,101,-248,-249,101,101,101,101,101,101,-88,101,-264,-265,101,-87,101,101,-82,-79,101,101,-268,-269,101,101,101,101,101,101,101,101,101,101,101,101,101,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,101,101,226,-1,-50,-49,-57,-80,-79,101,-84,-58,101,-83,-235,-236,101,-286,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-274,-275,101,101,101,101,101,101,101,247,-90,-91,-290,-289,-29,-266,-267,-77,-78,101,-316,-271,-270,-305,-317,-48,-319,-287,-288,101,101,-73,-86,-59,101,-72,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-89,101,-92,-293,-291,-76,101,101,101,-51,-85,-60,-71,101,-276,101,101,101,101,101,247,-254,-277,-318,-250,101,-298,101,101,101,101,101,101,101,101,101,-299,-296,101,101,-257,-292,-278,-252,-253,-251,-300,101,-297,101,-258,101,101,101,-301,101,-259,-255,-279,-256,]),'ID':([0,2,4,5,6,7,10,11,12,14,18,19,21,22,23,26,28,29,31,32,33,34,35,36,41,42,45,48,49,50,52,53,54,56,58,61,62,65,67,69,73,74,77,78,79,80,81,82,83,87,90,92,93,96,100,101,104,106,107,108,110,111,112,113,114,116,122,129,133,134,135,139,140,141,142,143,145,151,161,164,165,166,167,168,169,170,171,173,175,176,178,181,182,185,186,188,189,192,193,197,198,200,202,203,204,205,206,207,208,209,210,211,212,213,215,216,217,219,220,221,222,223,224,225,227,228,229,232,238,242,248,249,251,254,260,261,263,264,265,266,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,310,312,333,334,335,336,337,347,348,349,350,351,365,369,370,371,372,373,374,379,382,413,415,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,444,445,446,448,453,454,464,467,468,469,474,476,477,479,480,504,505,511,513,515,521,526,529,530,531,533,539,540,542,546,547,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[102,-24,-1,-17,102,102,102,102,102,-25,102,-28,-311,-23,-15,102,-314,102,-10,-21,-19,102,-11,-22,-308,102,102,-13,102,-27,102,102,-307,-12,-9,102,-313,-312,-8,-4,-26,102,-14,102,-306,-6,-315,102,-309,-247,-20,-18,-16,102,102,102,-310,102,102,102,102,-56,-55,-54,102,102,102,-7,-295,-294,-2,102,102,102,102,102,102,-273,-272,102,-248,-249,102,102,102,102,102,102,102,102,102,-264,-265,102,102,102,102,102,102,-268,-269,102,102,102,102,102,102,102,102,102,102,102,102,102,-219,-224,-225,-222,-220,-227,-218,-221,-223,-226,-217,-228,102,102,-1,-57,102,102,102,102,102,102,-235,-236,102,102,-286,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-274,-275,102,102,102,102,102,102,102,102,102,-290,-289,-29,-266,-267,102,-316,-271,-270,-305,-317,-319,-287,-288,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-293,102,-291,102,102,102,102,102,-276,102,102,102,102,102,102,-254,-277,-318,-250,102,102,102,102,102,102,102,102,102,102,-296,102,102,-257,-292,-278,-252,-253,-251,102,-297,102,-258,102,102,102,102,-259,-255,-279,-256,]),'IF':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[103,-24,-17,103,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,103,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,103,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,103,-273,-272,-248,-249,-264,-265,-268,-269,103,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,103,-316,-271,-270,-305,-317,-319,-287,-288,103,103,-293,-291,103,103,-276,103,103,-254,-277,-318,-250,103,103,103,103,103,103,-296,103,-257,-292,-278,-252,-253,-251,103,-297,103,-258,103,103,103,103,-259,-255,-279,-256,]),'XOREQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,221,-41,-95,-42,-96,-43,-70,-69,-79,-44,221,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,221,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,221,-298,-299,-300,-300,-301,-301,]),'LSHIFTEQUAL':([3,8,13,16,17,25,27,43,46,55,71,72,75,76,85,86,94,95,97,98,99,102,119,120,121,123,125,126,127,128,160,177,187,190,191,239,241,244,245,250,252,262,324,326,328,338,342,367,375,376,380,383,441,443,447,457,460,462,466,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,-45,-44,-33,-98,-81,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,224,-41,-95,-42,-96,-43,-70,-69,-79,-44,224,-88,-87,-82,-79,-50,-49,-80,-79,-84,-58,-83,224,-90,-91,-77,-78,-48,-73,-86,-59,-72,-89,-92,-76,-51,-85,-60,-71,224,-298,-299,-300,-300,-301,-301,]),'HTML_VOID_TAG':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,83,87,90,92,93,104,129,133,134,135,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,416,444,446,468,469,474,504,505,511,513,515,521,540,542,546,552,554,557,560,561,562,566,567,570,572,574,579,580,582,585,],[105,-24,-17,105,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,105,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,-273,-272,-248,-249,-264,-265,-268,-269,105,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,105,-316,-271,-270,-305,-317,-319,-287,-288,105,-293,-291,-276,105,105,-254,-277,-318,-250,105,105,105,105,-296,-257,-292,-278,-252,-253,-251,105,-297,-258,105,105,-259,-255,-279,-256,]),'URSHIFT':([3,8,13,16,17,20,24,25,27,30,40,43,46,51,55,70,71,72,75,76,85,86,94,95,97,98,99,102,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,150,152,158,160,163,174,177,184,187,190,191,218,226,231,236,239,241,244,245,246,247,250,252,262,268,269,270,271,272,304,305,306,315,324,326,328,338,342,358,359,360,361,362,363,367,375,376,380,383,387,388,389,390,391,392,393,394,395,398,399,400,407,408,441,443,447,457,460,462,466,481,482,483,484,485,497,520,544,546,564,567,575,],[-31,-75,-97,-74,-30,139,-136,-45,-44,-122,-129,-33,-98,-108,-81,-107,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-102,-41,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,285,-118,-132,-99,-116,-112,-88,-117,-87,-82,-79,-103,-104,-113,-102,-50,-49,-80,-79,-100,-101,-84,-58,-83,-139,-138,-137,-130,-131,-125,-124,-123,285,-99,-90,-91,-77,-78,285,285,285,285,285,285,-48,-73,-86,-59,-72,-120,-121,-119,285,285,285,285,285,285,-135,-134,-133,-127,-128,-89,-92,-76,-51,-85,-60,-71,285,285,285,285,285,-99,-298,-299,-300,-300,-301,-301,]),'RBRACKET':([3,4,17,25,43,71,72,75,76,85,86,94,95,97,98,102,109,110,111,112,113,115,117,118,119,120,121,123,124,125,126,127,128,130,131,132,144,146,147,148,149,150,152,153,154,155,157,158,159,160,162,163,174,184,231,238,239,240,241,242,244,245,246,247,250,252,262,327,328,339,367,373,375,376,377,380,383,384,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,410,411,412,443,456,457,460,462,466,518,520,544,564,575,],[-31,-1,-30,-45,-33,-34,-32,-35,-36,-38,-37,-40,-39,-46,-47,-41,239,241,-56,-55,-54,-115,-99,-105,-95,-42,-96,-43,-106,-70,-69,-79,-44,-114,-109,-110,-111,-126,-160,-193,-199,-140,-118,-187,-175,-211,-229,-132,-205,-99,-181,-116,-112,-117,-113,-1,-50,-52,-49,-57,-80,-79,-100,-101,-84,-58,-83,441,-91,447,-48,457,-73,-86,460,-59,-72,466,-120,-121,-119,-145,-142,-141,-144,-143,-146,-188,-194,-135,-134,-133,-182,-161,-162,-164,-163,-230,-127,-128,-200,-212,-176,-92,-53,-51,-85,-60,-71,-206,-298,-299,-300,-301,]),'THROW':([0,2,5,7,14,19,21,22,23,28,31,32,33,35,36,41,48,49,50,54,56,58,62,65,67,69,73,77,79,80,81,82,83,87,90,92,93,104,129,133,134,135,145,151,161,165,166,181,182,197,198,200,263,264,273,293,294,333,334,335,336,337,347,348,349,350,351,365,369,370,371,413,416,444,446,448,454,468,469,474,504,505,511,513,515,521,530,539,540,542,546,550,552,554,557,560,561,562,566,567,569,570,571,572,574,578,579,580,582,585,],[106,-24,-17,106,-25,-28,-311,-23,-15,-314,-10,-21,-19,-11,-22,-308,-13,106,-27,-307,-12,-9,-313,-312,-8,-4,-26,-14,-306,-6,-315,106,-309,-247,-20,-18,-16,-310,-7,-295,-294,-2,106,-273,-272,-248,-249,-264,-265,-268,-269,106,-235,-236,-286,-274,-275,-290,-289,-29,-266,-267,106,-316,-271,-270,-305,-317,-319,-287,-288,106,106,-293,-291,106,106,-276,106,106,-254,-277,-318,-250,106,106,106,106,106,106,-296,106,-257,-292,-278,-252,-253,-251,106,-297,106,-258,106,106,106,106,-259,-255,-279,-256,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'logical_or_expr_nobf':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,]),'throw_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,]),'boolean_literal':([0,6,7,10,11,12,26,29,34,45,49,53,61,74,82,96,100,101,106,107,108,110,116,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'bitwise_or_expr':([29,74,96,100,106,107,110,164,167,176,178,186,188,193,229,232,249,261,266,284,295,298,299,300,372,373,382,434,437,442,453,467,476,479,526,529,533,547,],[148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,397,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,]),'property_assignment':([122,379,],[256,463,]),'logical_and_expr_noin':([173,436,438,439,440,480,531,],[311,311,311,311,501,311,311,]),'iteration_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'variable_declaration_noin':([312,477,],[420,524,]),'source_element_list':([0,49,200,347,416,469,474,515,521,540,542,566,572,574,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'function_expr':([0,6,7,10,11,12,26,29,34,45,49,53,61,74,82,96,100,101,106,107,108,110,116,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[8,125,8,125,125,125,125,125,125,125,8,125,125,125,8,125,125,125,125,125,8,125,125,125,125,125,125,125,8,125,125,125,125,125,125,125,125,125,125,8,8,125,8,8,125,125,125,125,125,125,125,125,125,125,8,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,8,125,125,125,8,8,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,8,125,8,125,8,8,125,125,125,8,8,125,125,8,125,125,8,8,8,125,8,8,8,8,8,8,8,]),'multiplicative_expr':([29,74,96,100,106,107,110,139,140,141,142,143,164,167,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[146,146,146,146,146,146,146,146,146,146,271,272,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,407,408,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,]),'finally':([179,334,],[333,446,]),'program':([0,],[9,]),'arguments':([46,55,121,127,191,245,],[177,187,250,262,342,375,]),'case_block':([449,],[505,]),'formal_parameter_list':([171,310,374,464,],[307,417,458,517,]),'new_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'try_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'element_list':([4,],[109,]),'relational_expr':([29,74,96,100,106,107,110,164,167,176,178,186,188,193,203,204,205,206,229,232,249,261,266,283,284,288,289,290,291,292,295,298,299,300,301,372,373,382,430,431,432,433,434,437,442,453,467,476,479,526,529,533,547,],[147,147,147,147,147,147,147,147,147,147,147,147,147,147,354,355,356,357,147,147,147,147,147,147,147,147,402,403,404,405,147,147,147,147,147,147,147,147,488,489,490,491,147,147,147,147,147,147,147,147,147,147,147,]),'primary_expr_no_brace':([0,6,7,10,11,12,26,29,34,45,49,53,61,74,82,96,100,101,106,107,108,110,116,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[16,120,16,120,120,120,120,120,120,120,16,120,120,120,16,120,120,120,120,120,16,120,120,120,120,120,120,120,16,120,120,120,120,120,120,120,120,120,120,16,16,120,16,16,120,120,120,120,120,120,120,120,120,120,16,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,16,120,120,120,16,16,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,16,120,16,120,16,16,120,120,120,16,16,120,120,16,120,120,16,16,16,120,16,16,16,16,16,16,16,]),'variable_declaration_list_noin':([312,],[421,]),'null_literal':([0,6,7,10,11,12,26,29,34,45,49,53,61,74,82,96,100,101,106,107,108,110,116,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'html_attr_part':([450,],[510,]),'js_html_stmt':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'html_tag':([0,7,49,200,347,416,469,474,515,521,540,542,566,572,574,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'labelled_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'expr_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'logical_and_expr':([29,74,96,100,106,107,110,164,167,176,178,186,188,193,229,232,249,261,266,295,298,299,300,372,373,382,434,437,442,453,467,476,479,526,529,533,547,],[149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,410,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,]),'additive_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'primary_expr':([6,10,11,12,26,29,34,45,53,61,74,96,100,101,106,107,110,116,139,140,141,142,143,164,167,168,169,170,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'identifier':([0,6,7,10,11,12,18,26,29,34,42,45,49,52,53,61,74,78,82,96,100,101,106,107,108,110,114,116,122,139,140,141,142,143,145,164,167,168,169,170,171,173,175,176,178,185,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,248,249,251,254,260,261,265,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,310,312,347,372,373,374,379,382,413,415,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,445,448,453,454,464,467,469,474,476,477,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[27,128,27,128,128,128,137,128,128,128,172,128,27,183,128,128,128,199,27,128,128,128,128,128,128,128,243,128,257,128,128,128,128,128,27,128,128,128,128,128,309,128,326,128,128,338,128,128,128,128,128,27,128,128,128,128,128,128,128,128,128,128,128,128,128,128,376,128,257,257,383,128,137,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,309,422,27,128,128,309,257,128,27,470,27,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,503,27,128,27,309,128,27,27,128,525,128,128,27,27,128,128,27,128,128,27,27,27,128,27,27,27,27,27,27,27,]),'html_attr_value':([345,],[450,]),'bitwise_xor_expr_nobf':([0,7,49,82,108,145,192,200,202,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[60,60,60,60,60,60,60,60,353,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'relational_expr_noin':([173,419,428,429,435,436,438,439,440,480,531,],[313,313,313,313,313,313,313,313,313,313,313,]),'end_js':([0,7,49,200,347,416,469,474,515,521,540,542,566,572,574,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'with_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'case_clauses_opt':([506,558,],[535,573,]),'initializer':([137,],[267,]),'break_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'html_attrs':([68,105,],[194,233,]),'bitwise_and_expr_noin':([173,419,429,435,436,438,439,440,480,531,],[314,314,487,314,314,314,314,314,314,314,]),'switch_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'property_list':([122,],[253,]),'postfix_expr':([6,10,11,12,26,29,34,45,53,74,96,100,101,106,107,110,139,140,141,142,143,164,167,168,169,170,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'source_elements':([0,49,200,347,416,469,474,515,521,540,542,566,572,574,],[38,180,351,452,471,471,471,471,471,471,471,471,581,583,]),'shift_expr':([29,74,96,100,106,107,110,164,167,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,277,278,279,280,281,282,283,284,288,289,290,291,292,295,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[150,150,150,150,150,150,150,150,150,315,150,150,150,150,150,150,150,150,150,358,359,360,361,362,363,150,150,150,150,150,390,391,392,393,394,395,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,315,481,482,483,484,485,315,315,150,150,150,150,150,315,315,150,315,315,315,150,150,150,150,150,315,150,150,315,150,150,]),'expr_nobf':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'expr_opt':([434,476,529,547,],[492,523,551,568,]),'multiplicative_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'html_data':([0,7,49,200,347,416,469,474,515,521,540,542,566,572,574,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'argument_list':([178,],[329,]),'expr_noin_opt':([173,],[319,]),'string_literal':([0,6,7,10,11,12,26,29,34,45,49,53,61,74,82,96,100,101,106,107,108,110,116,122,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,251,254,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,379,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,259,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,259,259,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,259,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'call_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'bitwise_xor_expr_noin':([173,419,435,436,438,439,440,480,531,],[316,316,495,316,316,316,316,316,316,]),'assignment_expr':([29,74,96,100,106,107,110,164,167,176,178,186,188,193,229,232,249,261,266,295,298,300,372,373,382,434,437,442,453,467,476,479,526,529,533,547,],[157,157,157,157,157,235,240,157,303,157,330,157,157,157,366,157,157,157,386,406,409,411,455,456,465,157,157,502,157,518,157,157,157,157,157,157,]),'object_literal':([6,10,11,12,26,29,34,45,53,61,74,96,100,101,106,107,110,116,139,140,141,142,143,164,167,168,169,170,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,]),'function_declaration':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'unary_expr_common':([0,6,7,10,11,12,26,29,34,45,49,53,74,82,96,100,101,106,107,108,110,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[51,124,51,124,124,124,124,124,124,124,51,124,124,51,124,124,124,124,124,51,124,124,124,124,124,124,51,124,124,124,124,124,124,124,124,124,124,51,51,124,51,51,124,124,124,124,124,124,124,124,124,124,51,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,51,124,124,124,51,51,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,51,124,51,124,51,51,124,124,124,51,51,124,124,51,124,124,51,51,51,124,51,51,51,51,51,51,51,]),'additive_expr':([29,74,96,100,106,107,110,139,140,141,164,167,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[158,158,158,158,158,158,158,268,269,270,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,398,399,400,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,]),'assignment_operator':([99,160,324,497,],[229,300,438,438,]),'case_clause':([506,534,558,],[536,556,536,]),'html_source_item':([0,7,49,200,347,416,469,474,515,521,540,542,566,572,574,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'member_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'block':([0,7,47,49,82,145,200,331,347,413,416,448,454,469,474,515,521,530,532,539,540,542,550,566,569,571,572,574,578,],[56,56,179,56,56,56,56,444,56,56,56,56,56,56,56,56,56,56,554,56,56,56,56,56,56,56,56,56,56,]),'assignment_expr_nobf':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'equality_expr_noin':([173,419,428,429,435,436,438,439,440,480,531,],[317,317,486,317,317,317,317,317,317,317,317,]),'html_attr':([194,233,],[346,346,]),'unary_expr':([6,10,11,12,26,29,34,45,53,74,96,100,101,106,107,110,139,140,141,142,143,164,167,168,169,170,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[115,130,131,132,144,152,163,174,184,152,152,152,231,152,152,152,152,152,152,152,152,152,152,304,305,306,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,387,388,389,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,]),'html_source':([0,7,49,200,347,416,469,474,515,521,540,542,566,572,574,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'continue_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,]),'unary_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'function_body':([416,469,474,515,521,540,542,566,],[472,519,522,541,545,563,565,577,]),'variable_declaration':([18,265,],[138,385,]),'bitwise_xor_expr':([29,74,96,100,106,107,110,164,167,176,178,186,188,193,229,232,249,261,266,283,284,295,298,299,300,372,373,382,434,437,442,453,467,476,479,526,529,533,547,],[153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,396,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,]),'conditional_expr_nobf':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'equality_expr':([29,74,96,100,106,107,110,164,167,176,178,186,188,193,229,232,249,261,266,283,284,288,295,298,299,300,301,372,373,382,434,437,442,453,467,476,479,526,529,533,547,],[154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,412,154,154,154,154,154,154,154,154,154,154,154,154,154,154,]),'logical_and_expr_nobf':([0,7,49,82,108,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[64,64,64,64,237,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'literal':([0,6,7,10,11,12,26,29,34,45,49,53,61,74,82,96,100,101,106,107,108,110,116,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'shift_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'elision':([4,238,],[112,112,]),'statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[67,67,67,201,273,67,67,468,67,504,513,67,67,67,67,552,562,67,67,570,67,579,580,67,67,585,]),'empty':([0,4,49,68,105,173,200,238,345,347,416,434,469,474,476,506,515,521,529,540,542,547,558,566,572,574,],[69,113,69,195,195,323,69,113,451,69,69,493,69,69,493,537,69,69,493,69,69,493,537,69,69,69,]),'new_expr':([6,10,11,12,26,29,34,45,53,61,74,96,100,101,106,107,110,116,139,140,141,142,143,164,167,168,169,170,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[119,119,119,119,119,119,119,119,119,190,119,119,119,119,119,119,119,244,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'postfix_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'regex_literal':([0,6,7,10,11,12,26,29,34,45,49,53,61,74,82,96,100,101,106,107,108,110,116,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'conditional_expr_noin':([173,436,438,439,480,531,],[321,321,321,321,321,321,]),'variable_declaration_list':([18,],[136,]),'catch':([179,],[334,]),'expr_noin':([173,],[322,]),'conditional_expr':([29,74,96,100,106,107,110,164,167,176,178,186,188,193,229,232,249,261,266,295,298,300,372,373,382,434,437,442,453,467,476,479,526,529,533,547,],[155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,]),'default_clause':([535,],[558,]),'expr':([29,74,96,100,106,164,176,186,188,193,232,249,261,434,437,453,476,479,526,529,533,547,],[156,196,214,230,234,302,327,339,340,344,368,377,384,494,498,512,494,527,549,494,555,494,]),'empty_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,]),'bitwise_or_expr_noin':([173,419,436,438,439,440,480,531,],[320,475,320,320,320,320,320,320,]),'member_expr':([6,10,11,12,26,29,34,45,53,61,74,96,100,101,106,107,110,116,139,140,141,142,143,164,167,168,169,170,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[127,127,127,127,127,127,127,127,127,191,127,127,127,127,127,127,127,245,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,]),'variable_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'initializer_noin':([422,525,],[478,548,]),'source_element':([0,7,49,200,347,416,469,474,515,521,540,542,566,572,574,],[80,129,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'html_embedded_js':([0,7,49,200,347,416,450,469,474,515,521,540,542,566,572,574,],[104,104,104,104,104,104,508,104,104,104,104,104,104,104,104,104,]),'html_escaped_js':([0,7,49,200,347,416,450,469,474,515,521,540,542,566,572,574,],[83,83,83,83,83,83,509,83,83,83,83,83,83,83,83,83,]),'bitwise_or_expr_nobf':([0,7,49,82,108,145,192,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[84,84,84,84,84,84,343,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,]),'case_clauses':([506,558,],[534,534,]),'logical_or_expr':([29,74,96,100,106,107,110,164,167,176,178,186,188,193,229,232,249,261,266,295,298,300,372,373,382,434,437,442,453,467,476,479,526,529,533,547,],[159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,]),'left_hand_side_expr':([6,10,11,12,26,29,34,45,53,74,96,100,101,106,107,110,139,140,141,142,143,164,167,168,169,170,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[117,117,117,117,117,160,117,117,117,160,160,160,117,160,160,160,117,117,117,117,117,160,160,117,117,117,324,160,160,160,160,160,117,117,117,117,117,117,117,117,117,117,160,160,160,160,160,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,160,117,117,160,117,160,117,160,160,160,117,117,117,117,117,117,117,117,117,117,117,117,160,117,497,160,497,497,117,160,160,160,160,160,497,160,160,497,160,160,]),'property_name':([122,251,254,379,],[258,378,381,258,]),'js_check_in_stmt':([79,],[200,]),'equality_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[88,88,88,88,88,88,88,88,88,88,364,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,]),'relational_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'return_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,]),'bitwise_and_expr_nobf':([0,7,49,82,108,145,189,192,200,202,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[91,91,91,91,91,91,341,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,]),'numeric_literal':([0,6,7,10,11,12,26,29,34,45,49,53,61,74,82,96,100,101,106,107,108,110,116,122,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,251,254,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,379,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,255,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,255,255,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,255,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'if_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,]),'logical_or_expr_noin':([173,436,438,439,480,531,],[325,325,325,325,325,325,]),'auto_semi':([15,29,39,52,78,136,156,183,199,234,538,],[133,151,166,182,198,264,294,337,349,371,561,]),'call_expr':([6,10,11,12,26,29,34,45,53,74,96,100,101,106,107,110,139,140,141,142,143,164,167,168,169,170,173,176,178,186,188,193,203,204,205,206,207,208,209,210,211,212,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,372,373,382,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,453,467,476,479,480,526,529,531,533,547,],[121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,]),'array_literal':([0,6,7,10,11,12,26,29,34,45,49,53,61,74,82,96,100,101,106,107,108,110,116,139,140,141,142,143,145,164,167,168,169,170,173,176,178,186,188,189,192,193,200,202,203,204,205,206,207,208,209,210,211,212,213,229,232,249,261,266,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,301,347,372,373,382,413,416,419,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,442,448,453,454,467,469,474,476,479,480,515,521,526,529,530,531,533,539,540,542,547,550,566,569,571,572,574,578,],[98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,]),'left_hand_side_expr_nobf':([0,7,49,82,108,145,189,192,200,202,213,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[99,99,99,99,236,99,236,236,99,236,236,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,]),'assignment_expr_noin':([173,436,438,439,480,531,],[318,496,499,500,528,553,]),'html_comment':([0,7,49,200,347,416,469,474,515,521,540,542,566,572,574,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'elision_opt':([4,238,],[110,373,]),'bitwise_and_expr':([29,74,96,100,106,107,110,164,167,176,178,186,188,193,229,232,249,261,266,283,284,288,295,298,299,300,372,373,382,434,437,442,453,467,476,479,526,529,533,547,],[162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,401,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,]),'debugger_statement':([0,7,49,82,145,200,347,413,416,448,454,469,474,515,521,530,539,540,542,550,566,569,571,572,574,578,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('empty -> <empty>','empty',0,'p_empty','/root/package/jsdompl/jsdompl/parser.py',235),
+  ('auto_semi -> error','auto_semi',1,'p_auto_semi','/root/package/jsdompl/jsdompl/parser.py',239),
+  ('program -> source_elements','program',1,'p_program','/root/package/jsdompl/jsdompl/parser.py',273),
+  ('source_elements -> empty','source_elements',1,'p_source_elements','/root/package/jsdompl/jsdompl/parser.py',277),
+  ('source_elements -> source_element_list','source_elements',1,'p_source_elements','/root/package/jsdompl/jsdompl/parser.py',278),
+  ('source_element_list -> source_element','source_element_list',1,'p_source_element_list','/root/package/jsdompl/jsdompl/parser.py',301),
+  ('source_element_list -> source_element_list source_element','source_element_list',2,'p_source_element_list','/root/package/jsdompl/jsdompl/parser.py',302),
+  ('source_element -> statement','source_element',1,'p_source_element','/root/package/jsdompl/jsdompl/parser.py',311),
+  ('source_element -> html_source','source_element',1,'p_source_element','/root/package/jsdompl/jsdompl/parser.py',313),
+  ('source_element -> end_js','source_element',1,'p_source_element','/root/package/jsdompl/jsdompl/parser.py',314),
+  ('end_js -> JS_TERMINATOR','end_js',1,'p_end_js','/root/package/jsdompl/jsdompl/parser.py',320),
+  ('statement -> block','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',325),
+  ('statement -> variable_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',326),
+  ('statement -> empty_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',327),
+  ('statement -> expr_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',328),
+  ('statement -> if_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',329),
+  ('statement -> iteration_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',330),
+  ('statement -> continue_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',331),
+  ('statement -> break_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',332),
+  ('statement -> return_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',333),
+  ('statement -> with_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',334),
+  ('statement -> switch_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',335),
+  ('statement -> labelled_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',336),
+  ('statement -> throw_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',337),
+  ('statement -> try_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',338),
+  ('statement -> debugger_statement','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',339),
+  ('statement -> function_declaration','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',340),
+  ('statement -> js_html_stmt','statement',1,'p_statement','/root/package/jsdompl/jsdompl/parser.py',341),
+  ('block -> LBRACE source_elements RBRACE','block',3,'p_block','/root/package/jsdompl/jsdompl/parser.py',350),
+  ('literal -> null_literal','literal',1,'p_literal','/root/package/jsdompl/jsdompl/parser.py',354),
+  ('literal -> boolean_literal','literal',1,'p_literal','/root/package/jsdompl/jsdompl/parser.py',355),
+  ('literal -> numeric_literal','literal',1,'p_literal','/root/package/jsdompl/jsdompl/parser.py',356),
+  ('literal -> string_literal','literal',1,'p_literal','/root/package/jsdompl/jsdompl/parser.py',357),
+  ('literal -> regex_literal','literal',1,'p_literal','/root/package/jsdompl/jsdompl/parser.py',358),
+  ('boolean_literal -> TRUE','boolean_literal',1,'p_boolean_literal','/root/package/jsdompl/jsdompl/parser.py',363),
+  ('boolean_literal -> FALSE','boolean_literal',1,'p_boolean_literal','/root/package/jsdompl/jsdompl/parser.py',364),
+  ('null_literal -> NULL','null_literal',1,'p_null_literal','/root/package/jsdompl/jsdompl/parser.py',369),
+  ('numeric_literal -> NUMBER','numeric_literal',1,'p_numeric_literal','/root/package/jsdompl/jsdompl/parser.py',373),
+  ('string_literal -> STRING','string_literal',1,'p_string_literal','/root/package/jsdompl/jsdompl/parser.py',377),
+  ('regex_literal -> REGEX','regex_literal',1,'p_regex_literal','/root/package/jsdompl/jsdompl/parser.py',381),
+  ('identifier -> ID','identifier',1,'p_identifier','/root/package/jsdompl/jsdompl/parser.py',385),
+  ('primary_expr -> primary_expr_no_brace','primary_expr',1,'p_primary_expr','/root/package/jsdompl/jsdompl/parser.py',392),
+  ('primary_expr -> object_literal','primary_expr',1,'p_primary_expr','/root/package/jsdompl/jsdompl/parser.py',393),
+  ('primary_expr_no_brace -> identifier','primary_expr_no_brace',1,'p_primary_expr_no_brace_1','/root/package/jsdompl/jsdompl/parser.py',398),
+  ('primary_expr_no_brace -> THIS','primary_expr_no_brace',1,'p_primary_expr_no_brace_2','/root/package/jsdompl/jsdompl/parser.py',404),
+  ('primary_expr_no_brace -> literal','primary_expr_no_brace',1,'p_primary_expr_no_brace_3','/root/package/jsdompl/jsdompl/parser.py',408),
+  ('primary_expr_no_brace -> array_literal','primary_expr_no_brace',1,'p_primary_expr_no_brace_3','/root/package/jsdompl/jsdompl/parser.py',409),
+  ('primary_expr_no_brace -> LPAREN expr RPAREN','primary_expr_no_brace',3,'p_primary_expr_no_brace_4','/root/package/jsdompl/jsdompl/parser.py',414),
+  ('array_literal -> LBRACKET elision_opt RBRACKET','array_literal',3,'p_array_literal_1','/root/package/jsdompl/jsdompl/parser.py',419),
+  ('array_literal -> LBRACKET element_list RBRACKET','array_literal',3,'p_array_literal_2','/root/package/jsdompl/jsdompl/parser.py',423),
+  ('array_literal -> LBRACKET element_list COMMA elision_opt RBRACKET','array_literal',5,'p_array_literal_2','/root/package/jsdompl/jsdompl/parser.py',424),
+  ('element_list -> elision_opt assignment_expr','element_list',2,'p_element_list','/root/package/jsdompl/jsdompl/parser.py',433),
+  ('element_list -> element_list COMMA elision_opt assignment_expr','element_list',4,'p_element_list','/root/package/jsdompl/jsdompl/parser.py',434),
+  ('elision_opt -> empty','elision_opt',1,'p_elision_opt_1','/root/package/jsdompl/jsdompl/parser.py',444),
+  ('elision_opt -> elision','elision_opt',1,'p_elision_opt_2','/root/package/jsdompl/jsdompl/parser.py',448),
+  ('elision -> COMMA','elision',1,'p_elision','/root/package/jsdompl/jsdompl/parser.py',452),
+  ('elision -> elision COMMA','elision',2,'p_elision','/root/package/jsdompl/jsdompl/parser.py',453),
+  ('object_literal -> LBRACE RBRACE','object_literal',2,'p_object_literal','/root/package/jsdompl/jsdompl/parser.py',462),
+  ('object_literal -> LBRACE property_list RBRACE','object_literal',3,'p_object_literal','/root/package/jsdompl/jsdompl/parser.py',463),
+  ('object_literal -> LBRACE property_list COMMA RBRACE','object_literal',4,'p_object_literal','/root/package/jsdompl/jsdompl/parser.py',464),
+  ('property_list -> property_assignment','property_list',1,'p_property_list','/root/package/jsdompl/jsdompl/parser.py',472),
+  ('property_list -> property_list COMMA property_assignment','property_list',3,'p_property_list','/root/package/jsdompl/jsdompl/parser.py',473),
+  ('property_assignment -> property_name COLON assignment_expr','property_assignment',3,'p_property_assignment','/root/package/jsdompl/jsdompl/parser.py',483),
+  ('property_assignment -> GETPROP property_name LPAREN RPAREN LBRACE function_body RBRACE','property_assignment',7,'p_property_assignment','/root/package/jsdompl/jsdompl/parser.py',484),
+  ('property_assignment -> SETPROP property_name LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','property_assignment',8,'p_property_assignment','/root/package/jsdompl/jsdompl/parser.py',485),
+  ('property_name -> identifier','property_name',1,'p_property_name','/root/package/jsdompl/jsdompl/parser.py',498),
+  ('property_name -> string_literal','property_name',1,'p_property_name','/root/package/jsdompl/jsdompl/parser.py',499),
+  ('property_name -> numeric_literal','property_name',1,'p_property_name','/root/package/jsdompl/jsdompl/parser.py',500),
+  ('member_expr -> primary_expr','member_expr',1,'p_member_expr','/root/package/jsdompl/jsdompl/parser.py',506),
+  ('member_expr -> function_expr','member_expr',1,'p_member_expr','/root/package/jsdompl/jsdompl/parser.py',507),
+  ('member_expr -> member_expr LBRACKET expr RBRACKET','member_expr',4,'p_member_expr','/root/package/jsdompl/jsdompl/parser.py',508),
+  ('member_expr -> member_expr PERIOD identifier','member_expr',3,'p_member_expr','/root/package/jsdompl/jsdompl/parser.py',509),
+  ('member_expr -> NEW member_expr arguments','member_expr',3,'p_member_expr','/root/package/jsdompl/jsdompl/parser.py',510),
+  ('member_expr_nobf -> primary_expr_no_brace','member_expr_nobf',1,'p_member_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',522),
+  ('member_expr_nobf -> function_expr','member_expr_nobf',1,'p_member_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',523),
+  ('member_expr_nobf -> member_expr_nobf LBRACKET expr RBRACKET','member_expr_nobf',4,'p_member_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',524),
+  ('member_expr_nobf -> member_expr_nobf PERIOD identifier','member_expr_nobf',3,'p_member_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',525),
+  ('member_expr_nobf -> NEW member_expr arguments','member_expr_nobf',3,'p_member_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',526),
+  ('new_expr -> member_expr','new_expr',1,'p_new_expr','/root/package/jsdompl/jsdompl/parser.py',538),
+  ('new_expr -> NEW new_expr','new_expr',2,'p_new_expr','/root/package/jsdompl/jsdompl/parser.py',539),
+  ('new_expr_nobf -> member_expr_nobf','new_expr_nobf',1,'p_new_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',547),
+  ('new_expr_nobf -> NEW new_expr','new_expr_nobf',2,'p_new_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',548),
+  ('call_expr -> member_expr arguments','call_expr',2,'p_call_expr','/root/package/jsdompl/jsdompl/parser.py',556),
+  ('call_expr -> call_expr arguments','call_expr',2,'p_call_expr','/root/package/jsdompl/jsdompl/parser.py',557),
+  ('call_expr -> call_expr LBRACKET expr RBRACKET','call_expr',4,'p_call_expr','/root/package/jsdompl/jsdompl/parser.py',558),
+  ('call_expr -> call_expr PERIOD identifier','call_expr',3,'p_call_expr','/root/package/jsdompl/jsdompl/parser.py',559),
+  ('call_expr_nobf -> member_expr_nobf arguments','call_expr_nobf',2,'p_call_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',569),
+  ('call_expr_nobf -> call_expr_nobf arguments','call_expr_nobf',2,'p_call_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',570),
+  ('call_expr_nobf -> call_expr_nobf LBRACKET expr RBRACKET','call_expr_nobf',4,'p_call_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',571),
+  ('call_expr_nobf -> call_expr_nobf PERIOD identifier','call_expr_nobf',3,'p_call_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',572),
+  ('arguments -> LPAREN RPAREN','arguments',2,'p_arguments','/root/package/jsdompl/jsdompl/parser.py',582),
+  ('arguments -> LPAREN argument_list RPAREN','arguments',3,'p_arguments','/root/package/jsdompl/jsdompl/parser.py',583),
+  ('argument_list -> assignment_expr','argument_list',1,'p_argument_list','/root/package/jsdompl/jsdompl/parser.py',589),
+  ('argument_list -> argument_list COMMA assignment_expr','argument_list',3,'p_argument_list','/root/package/jsdompl/jsdompl/parser.py',590),
+  ('left_hand_side_expr -> new_expr','left_hand_side_expr',1,'p_lef_hand_side_expr','/root/package/jsdompl/jsdompl/parser.py',599),
+  ('left_hand_side_expr -> call_expr','left_hand_side_expr',1,'p_lef_hand_side_expr','/root/package/jsdompl/jsdompl/parser.py',600),
+  ('left_hand_side_expr_nobf -> new_expr_nobf','left_hand_side_expr_nobf',1,'p_lef_hand_side_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',605),
+  ('left_hand_side_expr_nobf -> call_expr_nobf','left_hand_side_expr_nobf',1,'p_lef_hand_side_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',606),
+  ('postfix_expr -> left_hand_side_expr','postfix_expr',1,'p_postfix_expr','/root/package/jsdompl/jsdompl/parser.py',612),
+  ('postfix_expr -> left_hand_side_expr PLUSPLUS','postfix_expr',2,'p_postfix_expr','/root/package/jsdompl/jsdompl/parser.py',613),
+  ('postfix_expr -> left_hand_side_expr MINUSMINUS','postfix_expr',2,'p_postfix_expr','/root/package/jsdompl/jsdompl/parser.py',614),
+  ('postfix_expr_nobf -> left_hand_side_expr_nobf','postfix_expr_nobf',1,'p_postfix_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',622),
+  ('postfix_expr_nobf -> left_hand_side_expr_nobf PLUSPLUS','postfix_expr_nobf',2,'p_postfix_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',623),
+  ('postfix_expr_nobf -> left_hand_side_expr_nobf MINUSMINUS','postfix_expr_nobf',2,'p_postfix_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',624),
+  ('unary_expr -> postfix_expr','unary_expr',1,'p_unary_expr','/root/package/jsdompl/jsdompl/parser.py',633),
+  ('unary_expr -> unary_expr_common','unary_expr',1,'p_unary_expr','/root/package/jsdompl/jsdompl/parser.py',634),
+  ('unary_expr_nobf -> postfix_expr_nobf','unary_expr_nobf',1,'p_unary_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',639),
+  ('unary_expr_nobf -> unary_expr_common','unary_expr_nobf',1,'p_unary_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',640),
+  ('unary_expr_common -> DELETE unary_expr','unary_expr_common',2,'p_unary_expr_common','/root/package/jsdompl/jsdompl/parser.py',645),
+  ('unary_expr_common -> VOID unary_expr','unary_expr_common',2,'p_unary_expr_common','/root/package/jsdompl/jsdompl/parser.py',646),
+  ('unary_expr_common -> TYPEOF unary_expr','unary_expr_common',2,'p_unary_expr_common','/root/package/jsdompl/jsdompl/parser.py',647),
+  ('unary_expr_common -> PLUSPLUS unary_expr','unary_expr_common',2,'p_unary_expr_common','/root/package/jsdompl/jsdompl/parser.py',648),
+  ('unary_expr_common -> MINUSMINUS unary_expr','unary_expr_common',2,'p_unary_expr_common','/root/package/jsdompl/jsdompl/parser.py',649),
+  ('unary_expr_common -> PLUS unary_expr','unary_expr_common',2,'p_unary_expr_common','/root/package/jsdompl/jsdompl/parser.py',650),
+  ('unary_expr_common -> MINUS unary_expr','unary_expr_common',2,'p_unary_expr_common','/root/package/jsdompl/jsdompl/parser.py',651),
+  ('unary_expr_common -> BNOT unary_expr','unary_expr_common',2,'p_unary_expr_common','/root/package/jsdompl/jsdompl/parser.py',652),
+  ('unary_expr_common -> NOT unary_expr','unary_expr_common',2,'p_unary_expr_common','/root/package/jsdompl/jsdompl/parser.py',653),
+  ('multiplicative_expr -> unary_expr','multiplicative_expr',1,'p_multiplicative_expr','/root/package/jsdompl/jsdompl/parser.py',659),
+  ('multiplicative_expr -> multiplicative_expr MULT unary_expr','multiplicative_expr',3,'p_multiplicative_expr','/root/package/jsdompl/jsdompl/parser.py',660),
+  ('multiplicative_expr -> multiplicative_expr DIV unary_expr','multiplicative_expr',3,'p_multiplicative_expr','/root/package/jsdompl/jsdompl/parser.py',661),
+  ('multiplicative_expr -> multiplicative_expr MOD unary_expr','multiplicative_expr',3,'p_multiplicative_expr','/root/package/jsdompl/jsdompl/parser.py',662),
+  ('multiplicative_expr_nobf -> unary_expr_nobf','multiplicative_expr_nobf',1,'p_multiplicative_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',670),
+  ('multiplicative_expr_nobf -> multiplicative_expr_nobf MULT unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',671),
+  ('multiplicative_expr_nobf -> multiplicative_expr_nobf DIV unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',672),
+  ('multiplicative_expr_nobf -> multiplicative_expr_nobf MOD unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',673),
+  ('additive_expr -> multiplicative_expr','additive_expr',1,'p_additive_expr','/root/package/jsdompl/jsdompl/parser.py',682),
+  ('additive_expr -> additive_expr PLUS multiplicative_expr','additive_expr',3,'p_additive_expr','/root/package/jsdompl/jsdompl/parser.py',683),
+  ('additive_expr -> additive_expr MINUS multiplicative_expr','additive_expr',3,'p_additive_expr','/root/package/jsdompl/jsdompl/parser.py',684),
+  ('additive_expr_nobf -> multiplicative_expr_nobf','additive_expr_nobf',1,'p_additive_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',692),
+  ('additive_expr_nobf -> additive_expr_nobf PLUS multiplicative_expr','additive_expr_nobf',3,'p_additive_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',693),
+  ('additive_expr_nobf -> additive_expr_nobf MINUS multiplicative_expr','additive_expr_nobf',3,'p_additive_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',694),
+  ('shift_expr -> additive_expr','shift_expr',1,'p_shift_expr','/root/package/jsdompl/jsdompl/parser.py',703),
+  ('shift_expr -> shift_expr LSHIFT additive_expr','shift_expr',3,'p_shift_expr','/root/package/jsdompl/jsdompl/parser.py',704),
+  ('shift_expr -> shift_expr RSHIFT additive_expr','shift_expr',3,'p_shift_expr','/root/package/jsdompl/jsdompl/parser.py',705),
+  ('shift_expr -> shift_expr URSHIFT additive_expr','shift_expr',3,'p_shift_expr','/root/package/jsdompl/jsdompl/parser.py',706),
+  ('shift_expr_nobf -> additive_expr_nobf','shift_expr_nobf',1,'p_shift_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',714),
+  ('shift_expr_nobf -> shift_expr_nobf LSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',715),
+  ('shift_expr_nobf -> shift_expr_nobf RSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',716),
+  ('shift_expr_nobf -> shift_expr_nobf URSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',717),
+  ('relational_expr -> shift_expr','relational_expr',1,'p_relational_expr','/root/package/jsdompl/jsdompl/parser.py',727),
+  ('relational_expr -> relational_expr LT shift_expr','relational_expr',3,'p_relational_expr','/root/package/jsdompl/jsdompl/parser.py',728),
+  ('relational_expr -> relational_expr GT shift_expr','relational_expr',3,'p_relational_expr','/root/package/jsdompl/jsdompl/parser.py',729),
+  ('relational_expr -> relational_expr LE shift_expr','relational_expr',3,'p_relational_expr','/root/package/jsdompl/jsdompl/parser.py',730),
+  ('relational_expr -> relational_expr GE shift_expr','relational_expr',3,'p_relational_expr','/root/package/jsdompl/jsdompl/parser.py',731),
+  ('relational_expr -> relational_expr INSTANCEOF shift_expr','relational_expr',3,'p_relational_expr','/root/package/jsdompl/jsdompl/parser.py',732),
+  ('relational_expr -> relational_expr IN shift_expr','relational_expr',3,'p_relational_expr','/root/package/jsdompl/jsdompl/parser.py',733),
+  ('relational_expr_noin -> shift_expr','relational_expr_noin',1,'p_relational_expr_noin','/root/package/jsdompl/jsdompl/parser.py',741),
+  ('relational_expr_noin -> relational_expr_noin LT shift_expr','relational_expr_noin',3,'p_relational_expr_noin','/root/package/jsdompl/jsdompl/parser.py',742),
+  ('relational_expr_noin -> relational_expr_noin GT shift_expr','relational_expr_noin',3,'p_relational_expr_noin','/root/package/jsdompl/jsdompl/parser.py',743),
+  ('relational_expr_noin -> relational_expr_noin LE shift_expr','relational_expr_noin',3,'p_relational_expr_noin','/root/package/jsdompl/jsdompl/parser.py',744),
+  ('relational_expr_noin -> relational_expr_noin GE shift_expr','relational_expr_noin',3,'p_relational_expr_noin','/root/package/jsdompl/jsdompl/parser.py',745),
+  ('relational_expr_noin -> relational_expr_noin INSTANCEOF shift_expr','relational_expr_noin',3,'p_relational_expr_noin','/root/package/jsdompl/jsdompl/parser.py',746),
+  ('relational_expr_nobf -> shift_expr_nobf','relational_expr_nobf',1,'p_relational_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',754),
+  ('relational_expr_nobf -> relational_expr_nobf LT shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',755),
+  ('relational_expr_nobf -> relational_expr_nobf GT shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',756),
+  ('relational_expr_nobf -> relational_expr_nobf LE shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',757),
+  ('relational_expr_nobf -> relational_expr_nobf GE shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',758),
+  ('relational_expr_nobf -> relational_expr_nobf INSTANCEOF shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',759),
+  ('relational_expr_nobf -> relational_expr_nobf IN shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',760),
+  ('equality_expr -> relational_expr','equality_expr',1,'p_equality_expr','/root/package/jsdompl/jsdompl/parser.py',769),
+  ('equality_expr -> equality_expr EQEQ relational_expr','equality_expr',3,'p_equality_expr','/root/package/jsdompl/jsdompl/parser.py',770),
+  ('equality_expr -> equality_expr NE relational_expr','equality_expr',3,'p_equality_expr','/root/package/jsdompl/jsdompl/parser.py',771),
+  ('equality_expr -> equality_expr STREQ relational_expr','equality_expr',3,'p_equality_expr','/root/package/jsdompl/jsdompl/parser.py',772),
+  ('equality_expr -> equality_expr STRNEQ relational_expr','equality_expr',3,'p_equality_expr','/root/package/jsdompl/jsdompl/parser.py',773),
+  ('equality_expr_noin -> relational_expr_noin','equality_expr_noin',1,'p_equality_expr_noin','/root/package/jsdompl/jsdompl/parser.py',781),
+  ('equality_expr_noin -> equality_expr_noin EQEQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','/root/package/jsdompl/jsdompl/parser.py',782),
+  ('equality_expr_noin -> equality_expr_noin NE relational_expr','equality_expr_noin',3,'p_equality_expr_noin','/root/package/jsdompl/jsdompl/parser.py',783),
+  ('equality_expr_noin -> equality_expr_noin STREQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','/root/package/jsdompl/jsdompl/parser.py',784),
+  ('equality_expr_noin -> equality_expr_noin STRNEQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','/root/package/jsdompl/jsdompl/parser.py',785),
+  ('equality_expr_nobf -> relational_expr_nobf','equality_expr_nobf',1,'p_equality_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',793),
+  ('equality_expr_nobf -> equality_expr_nobf EQEQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',794),
+  ('equality_expr_nobf -> equality_expr_nobf NE relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',795),
+  ('equality_expr_nobf -> equality_expr_nobf STREQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',796),
+  ('equality_expr_nobf -> equality_expr_nobf STRNEQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',797),
+  ('bitwise_and_expr -> equality_expr','bitwise_and_expr',1,'p_bitwise_and_expr','/root/package/jsdompl/jsdompl/parser.py',806),
+  ('bitwise_and_expr -> bitwise_and_expr BAND equality_expr','bitwise_and_expr',3,'p_bitwise_and_expr','/root/package/jsdompl/jsdompl/parser.py',807),
+  ('bitwise_and_expr_noin -> equality_expr_noin','bitwise_and_expr_noin',1,'p_bitwise_and_expr_noin','/root/package/jsdompl/jsdompl/parser.py',815),
+  ('bitwise_and_expr_noin -> bitwise_and_expr_noin BAND equality_expr_noin','bitwise_and_expr_noin',3,'p_bitwise_and_expr_noin','/root/package/jsdompl/jsdompl/parser.py',816),
+  ('bitwise_and_expr_nobf -> equality_expr_nobf','bitwise_and_expr_nobf',1,'p_bitwise_and_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',825),
+  ('bitwise_and_expr_nobf -> bitwise_and_expr_nobf BAND equality_expr_nobf','bitwise_and_expr_nobf',3,'p_bitwise_and_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',826),
+  ('bitwise_xor_expr -> bitwise_and_expr','bitwise_xor_expr',1,'p_bitwise_xor_expr','/root/package/jsdompl/jsdompl/parser.py',835),
+  ('bitwise_xor_expr -> bitwise_xor_expr BXOR bitwise_and_expr','bitwise_xor_expr',3,'p_bitwise_xor_expr','/root/package/jsdompl/jsdompl/parser.py',836),
+  ('bitwise_xor_expr_noin -> bitwise_and_expr_noin','bitwise_xor_expr_noin',1,'p_bitwise_xor_expr_noin','/root/package/jsdompl/jsdompl/parser.py',845),
+  ('bitwise_xor_expr_noin -> bitwise_xor_expr_noin BXOR bitwise_and_expr_noin','bitwise_xor_expr_noin',3,'p_bitwise_xor_expr_noin','/root/package/jsdompl/jsdompl/parser.py',846),
+  ('bitwise_xor_expr_nobf -> bitwise_and_expr_nobf','bitwise_xor_expr_nobf',1,'p_bitwise_xor_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',856),
+  ('bitwise_xor_expr_nobf -> bitwise_xor_expr_nobf BXOR bitwise_and_expr_nobf','bitwise_xor_expr_nobf',3,'p_bitwise_xor_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',857),
+  ('bitwise_or_expr -> bitwise_xor_expr','bitwise_or_expr',1,'p_bitwise_or_expr','/root/package/jsdompl/jsdompl/parser.py',866),
+  ('bitwise_or_expr -> bitwise_or_expr BOR bitwise_xor_expr','bitwise_or_expr',3,'p_bitwise_or_expr','/root/package/jsdompl/jsdompl/parser.py',867),
+  ('bitwise_or_expr_noin -> bitwise_xor_expr_noin','bitwise_or_expr_noin',1,'p_bitwise_or_expr_noin','/root/package/jsdompl/jsdompl/parser.py',876),
+  ('bitwise_or_expr_noin -> bitwise_or_expr_noin BOR bitwise_xor_expr_noin','bitwise_or_expr_noin',3,'p_bitwise_or_expr_noin','/root/package/jsdompl/jsdompl/parser.py',877),
+  ('bitwise_or_expr_nobf -> bitwise_xor_expr_nobf','bitwise_or_expr_nobf',1,'p_bitwise_or_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',887),
+  ('bitwise_or_expr_nobf -> bitwise_or_expr_nobf BOR bitwise_xor_expr_nobf','bitwise_or_expr_nobf',3,'p_bitwise_or_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',888),
+  ('logical_and_expr -> bitwise_or_expr','logical_and_expr',1,'p_logical_and_expr','/root/package/jsdompl/jsdompl/parser.py',898),
+  ('logical_and_expr -> logical_and_expr AND bitwise_or_expr','logical_and_expr',3,'p_logical_and_expr','/root/package/jsdompl/jsdompl/parser.py',899),
+  ('logical_and_expr_noin -> bitwise_or_expr_noin','logical_and_expr_noin',1,'p_logical_and_expr_noin','/root/package/jsdompl/jsdompl/parser.py',908),
+  ('logical_and_expr_noin -> logical_and_expr_noin AND bitwise_or_expr_noin','logical_and_expr_noin',3,'p_logical_and_expr_noin','/root/package/jsdompl/jsdompl/parser.py',909),
+  ('logical_and_expr_nobf -> bitwise_or_expr_nobf','logical_and_expr_nobf',1,'p_logical_and_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',918),
+  ('logical_and_expr_nobf -> logical_and_expr_nobf AND bitwise_or_expr_nobf','logical_and_expr_nobf',3,'p_logical_and_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',919),
+  ('logical_or_expr -> logical_and_expr','logical_or_expr',1,'p_logical_or_expr','/root/package/jsdompl/jsdompl/parser.py',927),
+  ('logical_or_expr -> logical_or_expr OR logical_and_expr','logical_or_expr',3,'p_logical_or_expr','/root/package/jsdompl/jsdompl/parser.py',928),
+  ('logical_or_expr_noin -> logical_and_expr_noin','logical_or_expr_noin',1,'p_logical_or_expr_noin','/root/package/jsdompl/jsdompl/parser.py',936),
+  ('logical_or_expr_noin -> logical_or_expr_noin OR logical_and_expr_noin','logical_or_expr_noin',3,'p_logical_or_expr_noin','/root/package/jsdompl/jsdompl/parser.py',937),
+  ('logical_or_expr_nobf -> logical_and_expr_nobf','logical_or_expr_nobf',1,'p_logical_or_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',945),
+  ('logical_or_expr_nobf -> logical_or_expr_nobf OR logical_and_expr_nobf','logical_or_expr_nobf',3,'p_logical_or_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',946),
+  ('conditional_expr -> logical_or_expr','conditional_expr',1,'p_conditional_expr','/root/package/jsdompl/jsdompl/parser.py',956),
+  ('conditional_expr -> logical_or_expr CONDOP assignment_expr COLON assignment_expr','conditional_expr',5,'p_conditional_expr','/root/package/jsdompl/jsdompl/parser.py',957),
+  ('conditional_expr_noin -> logical_or_expr_noin','conditional_expr_noin',1,'p_conditional_expr_noin','/root/package/jsdompl/jsdompl/parser.py',968),
+  ('conditional_expr_noin -> logical_or_expr_noin CONDOP assignment_expr_noin COLON assignment_expr_noin','conditional_expr_noin',5,'p_conditional_expr_noin','/root/package/jsdompl/jsdompl/parser.py',969),
+  ('conditional_expr_nobf -> logical_or_expr_nobf','conditional_expr_nobf',1,'p_conditional_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',981),
+  ('conditional_expr_nobf -> logical_or_expr_nobf CONDOP assignment_expr COLON assignment_expr','conditional_expr_nobf',5,'p_conditional_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',982),
+  ('assignment_expr -> conditional_expr','assignment_expr',1,'p_assignment_expr','/root/package/jsdompl/jsdompl/parser.py',994),
+  ('assignment_expr -> left_hand_side_expr assignment_operator assignment_expr','assignment_expr',3,'p_assignment_expr','/root/package/jsdompl/jsdompl/parser.py',995),
+  ('assignment_expr_noin -> conditional_expr_noin','assignment_expr_noin',1,'p_assignment_expr_noin','/root/package/jsdompl/jsdompl/parser.py',1005),
+  ('assignment_expr_noin -> left_hand_side_expr assignment_operator assignment_expr_noin','assignment_expr_noin',3,'p_assignment_expr_noin','/root/package/jsdompl/jsdompl/parser.py',1006),
+  ('assignment_expr_nobf -> conditional_expr_nobf','assignment_expr_nobf',1,'p_assignment_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',1016),
+  ('assignment_expr_nobf -> left_hand_side_expr_nobf assignment_operator assignment_expr','assignment_expr_nobf',3,'p_assignment_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',1017),
+  ('assignment_operator -> EQ','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1026),
+  ('assignment_operator -> MULTEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1027),
+  ('assignment_operator -> DIVEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1028),
+  ('assignment_operator -> MODEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1029),
+  ('assignment_operator -> PLUSEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1030),
+  ('assignment_operator -> MINUSEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1031),
+  ('assignment_operator -> LSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1032),
+  ('assignment_operator -> RSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1033),
+  ('assignment_operator -> URSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1034),
+  ('assignment_operator -> ANDEQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1035),
+  ('assignment_operator -> XOREQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1036),
+  ('assignment_operator -> OREQUAL','assignment_operator',1,'p_assignment_operator','/root/package/jsdompl/jsdompl/parser.py',1037),
+  ('expr -> assignment_expr','expr',1,'p_expr','/root/package/jsdompl/jsdompl/parser.py',1043),
+  ('expr -> expr COMMA assignment_expr','expr',3,'p_expr','/root/package/jsdompl/jsdompl/parser.py',1044),
+  ('expr_noin -> assignment_expr_noin','expr_noin',1,'p_expr_noin','/root/package/jsdompl/jsdompl/parser.py',1052),
+  ('expr_noin -> expr_noin COMMA assignment_expr_noin','expr_noin',3,'p_expr_noin','/root/package/jsdompl/jsdompl/parser.py',1053),
+  ('expr_nobf -> assignment_expr_nobf','expr_nobf',1,'p_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',1061),
+  ('expr_nobf -> expr_nobf COMMA assignment_expr','expr_nobf',3,'p_expr_nobf','/root/package/jsdompl/jsdompl/parser.py',1062),
+  ('variable_statement -> VAR variable_declaration_list SEMI','variable_statement',3,'p_variable_statement','/root/package/jsdompl/jsdompl/parser.py',1071),
+  ('variable_statement -> VAR variable_declaration_list auto_semi','variable_statement',3,'p_variable_statement','/root/package/jsdompl/jsdompl/parser.py',1072),
+  ('variable_declaration_list -> variable_declaration','variable_declaration_list',1,'p_variable_declaration_list','/root/package/jsdompl/jsdompl/parser.py',1078),
+  ('variable_declaration_list -> variable_declaration_list COMMA variable_declaration','variable_declaration_list',3,'p_variable_declaration_list','/root/package/jsdompl/jsdompl/parser.py',1079),
+  ('variable_declaration_list_noin -> variable_declaration_noin','variable_declaration_list_noin',1,'p_variable_declaration_list_noin','/root/package/jsdompl/jsdompl/parser.py',1090),
+  ('variable_declaration_list_noin -> variable_declaration_list_noin COMMA variable_declaration_noin','variable_declaration_list_noin',3,'p_variable_declaration_list_noin','/root/package/jsdompl/jsdompl/parser.py',1091),
+  ('variable_declaration -> identifier','variable_declaration',1,'p_variable_declaration','/root/package/jsdompl/jsdompl/parser.py',1101),
+  ('variable_declaration -> identifier initializer','variable_declaration',2,'p_variable_declaration','/root/package/jsdompl/jsdompl/parser.py',1102),
+  ('variable_declaration_noin -> identifier','variable_declaration_noin',1,'p_variable_declaration_noin','/root/package/jsdompl/jsdompl/parser.py',1110),
+  ('variable_declaration_noin -> identifier initializer_noin','variable_declaration_noin',2,'p_variable_declaration_noin','/root/package/jsdompl/jsdompl/parser.py',1111),
+  ('initializer -> EQ assignment_expr','initializer',2,'p_initializer','/root/package/jsdompl/jsdompl/parser.py',1119),
+  ('initializer_noin -> EQ assignment_expr_noin','initializer_noin',2,'p_initializer_noin','/root/package/jsdompl/jsdompl/parser.py',1123),
+  ('empty_statement -> SEMI','empty_statement',1,'p_empty_statement','/root/package/jsdompl/jsdompl/parser.py',1128),
+  ('expr_statement -> expr_nobf SEMI','expr_statement',2,'p_expr_statement','/root/package/jsdompl/jsdompl/parser.py',1133),
+  ('expr_statement -> expr_nobf auto_semi','expr_statement',2,'p_expr_statement','/root/package/jsdompl/jsdompl/parser.py',1134),
+  ('if_statement -> IF LPAREN expr RPAREN statement','if_statement',5,'p_if_statement_1','/root/package/jsdompl/jsdompl/parser.py',1140),
+  ('if_statement -> IF LPAREN expr RPAREN statement ELSE statement','if_statement',7,'p_if_statement_2','/root/package/jsdompl/jsdompl/parser.py',1144),
+  ('iteration_statement -> DO statement WHILE LPAREN expr RPAREN SEMI','iteration_statement',7,'p_iteration_statement_1','/root/package/jsdompl/jsdompl/parser.py',1150),
+  ('iteration_statement -> DO statement WHILE LPAREN expr RPAREN auto_semi','iteration_statement',7,'p_iteration_statement_1','/root/package/jsdompl/jsdompl/parser.py',1151),
+  ('iteration_statement -> WHILE LPAREN expr RPAREN statement','iteration_statement',5,'p_iteration_statement_2','/root/package/jsdompl/jsdompl/parser.py',1157),
+  ('iteration_statement -> FOR LPAREN expr_noin_opt SEMI expr_opt SEMI expr_opt RPAREN statement','iteration_statement',9,'p_iteration_statement_3','/root/package/jsdompl/jsdompl/parser.py',1162),
+  ('iteration_statement -> FOR LPAREN VAR variable_declaration_list_noin SEMI expr_opt SEMI expr_opt RPAREN statement','iteration_statement',10,'p_iteration_statement_3','/root/package/jsdompl/jsdompl/parser.py',1163),
+  ('iteration_statement -> FOR LPAREN left_hand_side_expr IN expr RPAREN statement','iteration_statement',7,'p_iteration_statement_4','/root/package/jsdompl/jsdompl/parser.py',1176),
+  ('iteration_statement -> FOR LPAREN VAR identifier IN expr RPAREN statement','iteration_statement',8,'p_iteration_statement_5','/root/package/jsdompl/jsdompl/parser.py',1183),
+  ('iteration_statement -> FOR LPAREN VAR identifier initializer_noin IN expr RPAREN statement','iteration_statement',9,'p_iteration_statement_6','/root/package/jsdompl/jsdompl/parser.py',1190),
+  ('expr_opt -> empty','expr_opt',1,'p_expr_opt','/root/package/jsdompl/jsdompl/parser.py',1197),
+  ('expr_opt -> expr','expr_opt',1,'p_expr_opt','/root/package/jsdompl/jsdompl/parser.py',1198),
+  ('expr_noin_opt -> empty','expr_noin_opt',1,'p_expr_noin_opt','/root/package/jsdompl/jsdompl/parser.py',1203),
+  ('expr_noin_opt -> expr_noin','expr_noin_opt',1,'p_expr_noin_opt','/root/package/jsdompl/jsdompl/parser.py',1204),
+  ('continue_statement -> CONTINUE SEMI','continue_statement',2,'p_continue_statement_1','/root/package/jsdompl/jsdompl/parser.py',1210),
+  ('continue_statement -> CONTINUE auto_semi','continue_statement',2,'p_continue_statement_1','/root/package/jsdompl/jsdompl/parser.py',1211),
+  ('continue_statement -> CONTINUE identifier SEMI','continue_statement',3,'p_continue_statement_2','/root/package/jsdompl/jsdompl/parser.py',1216),
+  ('continue_statement -> CONTINUE identifier auto_semi','continue_statement',3,'p_continue_statement_2','/root/package/jsdompl/jsdompl/parser.py',1217),
+  ('break_statement -> BREAK SEMI','break_statement',2,'p_break_statement_1','/root/package/jsdompl/jsdompl/parser.py',1223),
+  ('break_statement -> BREAK auto_semi','break_statement',2,'p_break_statement_1','/root/package/jsdompl/jsdompl/parser.py',1224),
+  ('break_statement -> BREAK identifier SEMI','break_statement',3,'p_break_statement_2','/root/package/jsdompl/jsdompl/parser.py',1229),
+  ('break_statement -> BREAK identifier auto_semi','break_statement',3,'p_break_statement_2','/root/package/jsdompl/jsdompl/parser.py',1230),
+  ('return_statement -> RETURN SEMI','return_statement',2,'p_return_statement_1','/root/package/jsdompl/jsdompl/parser.py',1237),
+  ('return_statement -> RETURN auto_semi','return_statement',2,'p_return_statement_1','/root/package/jsdompl/jsdompl/parser.py',1238),
+  ('return_statement -> RETURN expr SEMI','return_statement',3,'p_return_statement_2','/root/package/jsdompl/jsdompl/parser.py',1243),
+  ('return_statement -> RETURN expr auto_semi','return_statement',3,'p_return_statement_2','/root/package/jsdompl/jsdompl/parser.py',1244),
+  ('with_statement -> WITH LPAREN expr RPAREN statement','with_statement',5,'p_with_statement','/root/package/jsdompl/jsdompl/parser.py',1250),
+  ('switch_statement -> SWITCH LPAREN expr RPAREN case_block','switch_statement',5,'p_switch_statement','/root/package/jsdompl/jsdompl/parser.py',1255),
+  ('case_block -> LBRACE case_clauses_opt RBRACE','case_block',3,'p_case_block','/root/package/jsdompl/jsdompl/parser.py',1269),
+  ('case_block -> LBRACE case_clauses_opt default_clause case_clauses_opt RBRACE','case_block',5,'p_case_block','/root/package/jsdompl/jsdompl/parser.py',1270),
+  ('case_clauses_opt -> empty','case_clauses_opt',1,'p_case_clauses_opt','/root/package/jsdompl/jsdompl/parser.py',1276),
+  ('case_clauses_opt -> case_clauses','case_clauses_opt',1,'p_case_clauses_opt','/root/package/jsdompl/jsdompl/parser.py',1277),
+  ('case_clauses -> case_clause','case_clauses',1,'p_case_clauses','/root/package/jsdompl/jsdompl/parser.py',1282),
+  ('case_clauses -> case_clauses case_clause','case_clauses',2,'p_case_clauses','/root/package/jsdompl/jsdompl/parser.py',1283),
+  ('case_clause -> CASE expr COLON source_elements','case_clause',4,'p_case_clause','/root/package/jsdompl/jsdompl/parser.py',1292),
+  ('default_clause -> DEFAULT COLON source_elements','default_clause',3,'p_default_clause','/root/package/jsdompl/jsdompl/parser.py',1296),
+  ('labelled_statement -> identifier COLON statement','labelled_statement',3,'p_labelled_statement','/root/package/jsdompl/jsdompl/parser.py',1301),
+  ('throw_statement -> THROW expr SEMI','throw_statement',3,'p_throw_statement','/root/package/jsdompl/jsdompl/parser.py',1306),
+  ('throw_statement -> THROW expr auto_semi','throw_statement',3,'p_throw_statement','/root/package/jsdompl/jsdompl/parser.py',1307),
+  ('try_statement -> TRY block catch','try_statement',3,'p_try_statement_1','/root/package/jsdompl/jsdompl/parser.py',1313),
+  ('try_statement -> TRY block finally','try_statement',3,'p_try_statement_2','/root/package/jsdompl/jsdompl/parser.py',1317),
+  ('try_statement -> TRY block catch finally','try_statement',4,'p_try_statement_3','/root/package/jsdompl/jsdompl/parser.py',1321),
+  ('catch -> CATCH LPAREN identifier RPAREN block','catch',5,'p_catch','/root/package/jsdompl/jsdompl/parser.py',1325),
+  ('finally -> FINALLY block','finally',2,'p_finally','/root/package/jsdompl/jsdompl/parser.py',1329),
+  ('debugger_statement -> DEBUGGER SEMI','debugger_statement',2,'p_debugger_statement','/root/package/jsdompl/jsdompl/parser.py',1334),
+  ('debugger_statement -> DEBUGGER auto_semi','debugger_statement',2,'p_debugger_statement','/root/package/jsdompl/jsdompl/parser.py',1335),
+  ('function_declaration -> FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE','function_declaration',7,'p_function_declaration','/root/package/jsdompl/jsdompl/parser.py',1342),
+  ('function_declaration -> FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_declaration',8,'p_function_declaration','/root/package/jsdompl/jsdompl/parser.py',1343),
+  ('function_expr -> FUNCTION LPAREN RPAREN LBRACE function_body RBRACE','function_expr',6,'p_function_expr_1','/root/package/jsdompl/jsdompl/parser.py',1356),
+  ('function_expr -> FUNCTION LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_expr',7,'p_function_expr_1','/root/package/jsdompl/jsdompl/parser.py',1357),
+  ('function_expr -> FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE','function_expr',7,'p_function_expr_2','/root/package/jsdompl/jsdompl/parser.py',1370),
+  ('function_expr -> FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_expr',8,'p_function_expr_2','/root/package/jsdompl/jsdompl/parser.py',1371),
+  ('formal_parameter_list -> identifier','formal_parameter_list',1,'p_formal_parameter_list','/root/package/jsdompl/jsdompl/parser.py',1384),
+  ('formal_parameter_list -> formal_parameter_list COMMA identifier','formal_parameter_list',3,'p_formal_parameter_list','/root/package/jsdompl/jsdompl/parser.py',1385),
+  ('function_body -> source_elements','function_body',1,'p_function_body','/root/package/jsdompl/jsdompl/parser.py',1394),
+  ('js_html_stmt -> JS_OPEN js_check_in_stmt source_elements','js_html_stmt',3,'p_js_html_stmt','/root/package/jsdompl/jsdompl/parser.py',1398),
+  ('js_check_in_stmt -> <empty>','js_check_in_stmt',0,'p_js_check_in_stmt','/root/package/jsdompl/jsdompl/parser.py',1403),
+  ('html_source -> html_source_item','html_source',1,'p_html_source','/root/package/jsdompl/jsdompl/parser.py',1415),
+  ('html_source_item -> html_data','html_source_item',1,'p_html_source_item','/root/package/jsdompl/jsdompl/parser.py',1419),
+  ('html_source_item -> html_escaped_js','html_source_item',1,'p_html_source_item','/root/package/jsdompl/jsdompl/parser.py',1420),
+  ('html_source_item -> html_embedded_js','html_source_item',1,'p_html_source_item','/root/package/jsdompl/jsdompl/parser.py',1421),
+  ('html_source_item -> html_tag','html_source_item',1,'p_html_source_item','/root/package/jsdompl/jsdompl/parser.py',1422),
+  ('html_source_item -> html_comment','html_source_item',1,'p_html_source_item','/root/package/jsdompl/jsdompl/parser.py',1423),
+  ('html_data -> HTML_CHARS','html_data',1,'p_html_data','/root/package/jsdompl/jsdompl/parser.py',1428),
+  ('html_data -> HTML_WS','html_data',1,'p_html_data','/root/package/jsdompl/jsdompl/parser.py',1429),
+  ('html_comment -> HTML_COMMENT','html_comment',1,'p_html_comment','/root/package/jsdompl/jsdompl/parser.py',1437),
+  ('html_escaped_js -> ESCAPED_OPEN expr ESCAPED_TERMINATOR','html_escaped_js',3,'p_html_escaped_js','/root/package/jsdompl/jsdompl/parser.py',1442),
+  ('html_embedded_js -> EXPRESSION_OPEN expr EXPRESSION_TERMINATOR','html_embedded_js',3,'p_html_embedded_js','/root/package/jsdompl/jsdompl/parser.py',1454),
+  ('html_tag -> HTML_STARTTAG html_attrs HTML_TAG_END source_elements HTML_ENDTAG','html_tag',5,'p_html_tag','/root/package/jsdompl/jsdompl/parser.py',1460),
+  ('html_tag -> HTML_VOID_TAG html_attrs HTML_TAG_END','html_tag',3,'p_html_tag','/root/package/jsdompl/jsdompl/parser.py',1461),
+  ('html_attrs -> empty','html_attrs',1,'p_html_attrs','/root/package/jsdompl/jsdompl/parser.py',1476),
+  ('html_attrs -> html_attrs html_attr','html_attrs',2,'p_html_attrs','/root/package/jsdompl/jsdompl/parser.py',1477),
+  ('html_attr -> HTML_ATTR html_attr_value','html_attr',2,'p_html_attr','/root/package/jsdompl/jsdompl/parser.py',1486),
+  ('html_attr_value -> empty','html_attr_value',1,'p_html_attr_value','/root/package/jsdompl/jsdompl/parser.py',1491),
+  ('html_attr_value -> html_attr_value html_attr_part','html_attr_value',2,'p_html_attr_value','/root/package/jsdompl/jsdompl/parser.py',1492),
+  ('html_attr_part -> HTML_ATTR_TEXT','html_attr_part',1,'p_html_attr_part','/root/package/jsdompl/jsdompl/parser.py',1501),
+  ('html_attr_part -> html_escaped_js','html_attr_part',1,'p_html_attr_part','/root/package/jsdompl/jsdompl/parser.py',1502),
+  ('html_attr_part -> html_embedded_js','html_attr_part',1,'p_html_attr_part','/root/package/jsdompl/jsdompl/parser.py',1503),
+]
@@ -38,9 +38,9 @@ def debug_lexer():
 		print(t)
 
 def debug_parser():
-	p = Parser(yacc_debug = False, yacc_optimize = False, yacctab = 'jsdompl-parser')
+	p = Parser()
 	ast = p.parse(source, debug = False)
-	print(JSDomplVisitor(js_parser = p).visit(ast))
+	print(JSDomplVisitor(js_parser = p).render(ast))
 
 if __name__ == '__main__':
 	main()
@@ -0,0 +1,191 @@
+// A DOM with just what compiled templates use, enough to run them in node
+'use strict';
+
+var VOID = ['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'];
+
+function Node(name) {
+	this.nodeName = name;
+	this.childNodes = [];
+	this.attributes = {};
+	this.parentNode = null;
+	this.data = '';
+}
+
+Object.defineProperty(Node.prototype, 'nextSibling', {
+	get: function() {
+		if (this.parentNode === null) {
+			return null;
+		}
+		var siblings = this.parentNode.childNodes;
+		return siblings[siblings.indexOf(this) + 1] || null;
+	}
+});
+
+Object.defineProperty(Node.prototype, 'firstChild', {
+	get: function() {
+		return this.childNodes[0] || null;
+	}
+});
+
+Node.prototype.insertBefore = function(node, ref) {
+	if (node.nodeName === '#document-fragment') {
+		node.childNodes.slice().forEach(function(child) {
+			this.insertBefore(child, ref);
+		}, this);
+		return node;
+	}
+	if (node.parentNode !== null) {
+		node.parentNode.removeChild(node);
+	}
+	var index = ref === null ? this.childNodes.length : this.childNodes.indexOf(ref);
+	if (index < 0) {
+		throw new Error('insertBefore: not a child');
+	}
+	this.childNodes.splice(index, 0, node);
+	node.parentNode = this;
+	return node;
+};
+
+Node.prototype.appendChild = function(node) {
+	return this.insertBefore(node, null);
+};
+
+Node.prototype.removeChild = function(node) {
+	var index = this.childNodes.indexOf(node);
+	if (index < 0) {
+		throw new Error('removeChild: not a child');
+	}
+	this.childNodes.splice(index, 1);
+	node.parentNode = null;
+	return node;
+};
+
+Node.prototype.replaceChild = function(node, old) {
+	this.insertBefore(node, old);
+	return this.removeChild(old);
+};
+
+Node.prototype.setAttribute = function(name, value) {
+	this.attributes[name] = String(value);
+};
+
+Node.prototype.cloneNode = function(deep) {
+	var clone = new Node(this.nodeName);
+	clone.data = this.data;
+	for (var name in this.attributes) {
+		clone.attributes[name] = this.attributes[name];
+	}
+	if (deep) {
+		this.childNodes.forEach(function(child) {
+			clone.appendChild(child.cloneNode(true));
+		});
+	}
+	return clone;
+};
+
+function escapeText(text) {
+	return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+}
+
+function serialize(node) {
+	if (node.nodeName === '#text') {
+		return escapeText(node.data);
+	}
+	if (node.nodeName === '#comment') {
+		return '<!--' + node.data + '-->';
+	}
+	var inner = node.childNodes.map(serialize).join('');
+	if (node.nodeName === '#document-fragment') {
+		return inner;
+	}
+	var attrs = Object.keys(node.attributes).sort().map(function(name) {
+		return ' ' + name + '="' + node.attributes[name].replace(/&/g, '&amp;').replace(/"/g, '&quot;') + '"';
+	}).join('');
+	if (VOID.indexOf(node.nodeName) >= 0) {
+		return '<' + node.nodeName + attrs + '>';
+	}
+	return '<' + node.nodeName + attrs + '>' + inner + '</' + node.nodeName + '>';
+}
+
+Object.defineProperty(Node.prototype, 'outerHTML', {
+	get: function() {
+		return serialize(this);
+	}
+});
+
+function unescapeHTML(text) {
+	return text.replace(/&quot;/g, '"').replace(/&lt;/g, '<').replace(/&gt;/g, '>').replace(/&amp;/g, '&');
+}
+
+// The well formed HTML that the compiler serializes, no parser quirks
+function parseHTML(html, parent) {
+	var token = /<!--([\s\S]*?)-->|<\/([a-zA-Z][^\s>]*)\s*>|<([a-zA-Z][^\s\/>]*)((?:\s+[^\s=>]+="[^"]*")*)\s*>|([^<]+)/g;
+	var attr = /([^\s=>]+)="([^"]*)"/g;
+	var stack = [parent], m, node, a;
+	while ((m = token.exec(html)) !== null) {
+		var top = stack[stack.length - 1];
+		if (m[1] !== undefined) {
+			node = new Node('#comment');
+			node.data = m[1];
+			top.appendChild(node);
+		}
+		else if (m[2] !== undefined) {
+			stack.pop();
+		}
+		else if (m[3] !== undefined) {
+			node = new Node(m[3].toLowerCase());
+			while ((a = attr.exec(m[4])) !== null) {
+				node.setAttribute(a[1], unescapeHTML(a[2]));
+			}
+			top.appendChild(node);
+			if (VOID.indexOf(node.nodeName) < 0) {
+				stack.push(node);
+			}
+		}
+		else {
+			node = new Node('#text');
+			node.data = unescapeHTML(m[5]);
+			top.appendChild(node);
+		}
+	}
+}
+
+var document = {
+	createElement: function(name) {
+		var node = new Node(name.toLowerCase());
+		if (node.nodeName === 'template') {
+			node.content = new Node('#document-fragment');
+			Object.defineProperty(node, 'innerHTML', {
+				set: function(html) {
+					parseHTML(html, node.content);
+				}
+			});
+		}
+		return node;
+	},
+	createTextNode: function(data) {
+		var node = new Node('#text');
+		node.data = String(data);
+		return node;
+	},
+	createDocumentFragment: function() {
+		return new Node('#document-fragment');
+	}
+};
+
+// loads a compiled AMD module, which has no dependencies in the tests
+function load(code) {
+	var module;
+	var define = function(requirements, factory) {
+		module = factory();
+	};
+	new Function('define', 'document', code)(define, document);
+	return module;
+}
+
+module.exports = {
+	Node: Node,
+	document: document,
+	serialize: serialize,
+	load: load
+};
@@ -0,0 +1,62 @@
+""" Runs compiled templates in node, with the DOM of dom.js
+"""
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import json
+import os
+import subprocess
+import unittest
+
+try:
+	from io import StringIO
+except ImportError:
+	from StringIO import StringIO
+
+from jsdompl.template import compile_to
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _find_node():
+	for directory in os.environ.get('PATH', '').split(os.pathsep):
+		path = os.path.join(directory, 'node')
+		if os.path.isfile(path) and os.access(path, os.X_OK):
+			return path
+	return None
+
+NODE = _find_node()
+
+requires_node = unittest.skipIf(NODE is None, "node is not installed")
+
+def compile_module(source, **options):
+	out = StringIO()
+	compile_to(out, source, **options)
+	return out.getvalue()
+
+def run(code, states, update = False):
+	""" Returns the HTML the module `code` renders for each of `states`,
+	dicts of template arguments. With `update` the first state is rendered
+	and the others are applied with update().
+	"""
+	request = json.dumps({'code' : code, 'states' : states, 'update' : update})
+	process = subprocess.Popen(
+		[NODE, os.path.join(TESTS_DIR, 'render.js')],
+		stdin = subprocess.PIPE, stdout = subprocess.PIPE, stderr = subprocess.PIPE,
+	)
+	out, err = process.communicate(request.encode('utf-8'))
+	if process.returncode:
+		raise AssertionError("node failed:\n{}\n{}".format(err.decode('utf-8'), code))
+	return json.loads(out.decode('utf-8'))
+
+def render(source, states, **options):
+	""" Returns the HTML `source` renders for each of `states` on its own
+	"""
+	return run(compile_module(source, **options), states)
+
+def render_updates(source, states, **options):
+	""" Returns the HTML after rendering `source` for the first of `states`
+	and after updating it to each of the others
+	"""
+	return run(compile_module(source, update = True, **options), states, update = True)
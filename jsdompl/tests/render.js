@@ -0,0 +1,66 @@
+// Reads {"code": <AMD module>, "states": [{arg: value}, ...], "update": bool}
+// from stdin and writes the HTML of each state as a JSON list.
+//
+// With "update", the first state is rendered and the others are applied
+// with update(), otherwise each state is rendered on its own (by modules
+// compiled with or without update).
+'use strict';
+
+var dom = require('./dom.js');
+
+var _ = {
+	each: function(list, callback) {
+		for (var i = 0; i < list.length; i++) {
+			callback(i, list[i]);
+		}
+	}
+};
+
+global.escape = function(value) {
+	return String(value);
+};
+
+function argNames(template) {
+	var params = /^function\s*[^(]*\(([^)]*)\)/.exec(template.toString())[1];
+	return params.split(',').map(function(param) {
+		return param.trim().replace(/^\$_/, '');
+	}).filter(function(name) {
+		return name;
+	});
+}
+
+function args(names, state) {
+	return names.map(function(name) {
+		return name === '_' && !('_' in state) ? _ : state[name];
+	});
+}
+
+var input = '';
+process.stdin.setEncoding('utf8');
+process.stdin.on('data', function(chunk) {
+	input += chunk;
+});
+process.stdin.on('end', function() {
+	var request = JSON.parse(input);
+	var template = dom.load(request.code);
+	var names = argNames(template);
+	var html = [];
+
+	if (request.update) {
+		var root = dom.document.createElement('div');
+		var result = template.apply(null, args(names, request.states[0]));
+		root.appendChild(result.fragment);
+		html.push(dom.serialize(root).slice(5, -6));
+		request.states.slice(1).forEach(function(state) {
+			result.update.apply(null, args(names, state));
+			html.push(dom.serialize(root).slice(5, -6));
+		});
+	}
+	else {
+		request.states.forEach(function(state) {
+			var result = template.apply(null, args(names, state));
+			html.push(dom.serialize(result.fragment || result));
+		});
+	}
+	process.stdout.write(JSON.stringify(html));
+});
@@ -0,0 +1,137 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from jsdompl.cache import CompileCache, MemoryCache
+from jsdompl.parser import Parser
+
+class CompileCacheTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def test_threads(self):
+		cache = CompileCache(self.directory, max_size = 1024)
+		sources = ['<p>{{ x }} {}</p>'.format(n) for n in range(8)]
+		errors = []
+
+		def work():
+			p = Parser()
+			try:
+				for _ in range(3):
+					for source in sources:
+						cache.compile(source, js_parser = p)
+			except Exception as e:
+				errors.append(e)
+
+		threads = [threading.Thread(target = work) for _ in range(4)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		self.assertEqual(errors, [])
+		self.assertEqual(cache.stats.hits + cache.stats.misses, 4 * 3 * len(sources))
+		self.assertGreater(cache.stats.evictions, 0)
+
+class SlowCache(MemoryCache):
+	""" A MemoryCache whose compiles wait for `release`, and fail for the
+	sources starting with 'bad'
+	"""
+
+	def __init__(self, size = 512):
+		MemoryCache.__init__(self, size)
+		self.release = threading.Event()
+		self.compiles = []
+
+	def _compile(self, source, options):
+		self.compiles.append(source)
+		self.release.wait()
+		if source.startswith('bad'):
+			raise SyntaxError(source)
+		return 'module of ' + source
+
+class MemoryCacheTest(unittest.TestCase):
+
+	def compile_in_threads(self, cache, source, count):
+		""" Has `count` threads compile `source` at once, returns what each
+		got, the module or the exception
+		"""
+		results = [None] * count
+
+		def work(index):
+			try:
+				results[index] = cache.compile(source)
+			except Exception as e:
+				results[index] = e
+
+		threads = [threading.Thread(target = work, args = (index,)) for index in range(count)]
+		for thread in threads:
+			thread.start()
+		# every other thread waits on the first one before it finishes
+		deadline = time.time() + 10
+		while cache.stats.waits < count - 1 and time.time() < deadline:
+			time.sleep(0.001)
+		cache.release.set()
+		for thread in threads:
+			thread.join()
+		return results
+
+	def test_one_compile(self):
+		cache = SlowCache()
+		results = self.compile_in_threads(cache, '<p>a</p>', 8)
+		self.assertEqual(results, ['module of <p>a</p>'] * 8)
+		self.assertEqual(cache.compiles, ['<p>a</p>'])
+		self.assertEqual((cache.stats.misses, cache.stats.waits, cache.stats.hits), (1, 7, 0))
+		self.assertEqual(cache.compile('<p>a</p>'), 'module of <p>a</p>')
+		self.assertEqual(cache.stats.hits, 1)
+
+	def test_failed_compile(self):
+		cache = SlowCache()
+		results = self.compile_in_threads(cache, 'bad <p>', 8)
+		self.assertEqual(len(results), 8)
+		for result in results:
+			self.assertIsInstance(result, SyntaxError)
+		self.assertEqual(cache.compiles, ['bad <p>'])
+		self.assertEqual((cache.stats.misses, cache.stats.waits), (1, 7))
+		# not cached, the next call compiles again
+		self.assertEqual(len(cache), 0)
+		with self.assertRaises(SyntaxError):
+			cache.compile('bad <p>')
+		self.assertEqual(cache.compiles, ['bad <p>'] * 2)
+
+	def test_size(self):
+		cache = SlowCache(size = 3)
+		cache.release.set()
+		for source in 'abcde':
+			cache.compile(source)
+			self.assertLessEqual(len(cache), 3)
+		self.assertEqual(len(cache), 3)
+		self.assertEqual(cache.stats.evictions, 2)
+		# the least recently used go first
+		cache.compile('c')
+		cache.compile('f')
+		self.assertEqual(cache.stats.evictions, 3)
+		cache.compile('c')
+		cache.compile('e')
+		self.assertEqual(cache.compiles, list('abcdef'))
+		cache.compile('d')
+		self.assertEqual(cache.compiles, list('abcdefd'))
+
+	def test_real_compile(self):
+		cache = MemoryCache(size = 2)
+		code = cache.compile('<p>{{ a }}</p>', update = True)
+		self.assertIn('function $Template($_a)', code)
+		self.assertIs(cache.compile('<p>{{ a }}</p>', update = True), code)
+		self.assertIsNot(cache.compile('<p>{{ a }}</p>'), code)
+		self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 2))
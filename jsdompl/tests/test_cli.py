@@ -0,0 +1,162 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+try:
+	# takes the str the print function writes under Python 2 too
+	from StringIO import StringIO
+except ImportError:
+	from io import StringIO
+
+from jsdompl import cli
+
+class CLITest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.templates = self.path('templates')
+		self.write('templates/a.html', '<p>{{ a }}</p>')
+		self.write('templates/sub/b.html', '<ul>{% _.each(l, function(i, v) { %}<li>{{ v }}</li>{% }); %}</ul>')
+		self.write('templates/sub/notes.txt', 'not a template')
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def path(self, *parts):
+		return os.path.join(self.directory, *parts)
+
+	def write(self, name, text):
+		path = self.path(*name.split('/'))
+		if not os.path.isdir(os.path.dirname(path)):
+			os.makedirs(os.path.dirname(path))
+		with io.open(path, 'w', encoding = 'utf-8') as f:
+			f.write(text)
+		return path
+
+	def main(self, *argv):
+		""" Runs the command, returns its exit status, output and errors
+		"""
+		stdout, stderr = sys.stdout, sys.stderr
+		sys.stdout, sys.stderr = StringIO(), StringIO()
+		try:
+			status = cli.main(list(argv))
+			return status, sys.stdout.getvalue(), sys.stderr.getvalue()
+		finally:
+			sys.stdout, sys.stderr = stdout, stderr
+
+	def modules(self, directory):
+		found = []
+		for root, dirs, files in os.walk(directory):
+			found.extend(os.path.relpath(os.path.join(root, name), directory) for name in files)
+		return sorted(found)
+
+	def assertFailures(self, jobs):
+		self.write('templates/bad.html', '<p>{{ a + }}</p>')
+		missing = self.path('nothing', '*.html')
+		out = self.path('out')
+		status, stdout, stderr = self.main('-j', jobs, '-o', out, self.templates, missing)
+		self.assertEqual(status, 1)
+		self.assertEqual(self.modules(out), ['a.js', os.path.join('sub', 'b.js')])
+		self.assertIn('bad.html: SyntaxError', stderr)
+		self.assertIn('{}: no such file'.format(missing), stderr)
+		self.assertIn('2 compiled (0 from the cache), 2 failed', stderr)
+
+	def test_one_process(self):
+		self.assertFailures('1')
+
+	def test_pool(self):
+		self.assertFailures('2')
+
+	def test_next_to_templates(self):
+		status, stdout, stderr = self.main('-j', '1', '-q', self.templates)
+		self.assertEqual(status, 0)
+		self.assertEqual((stdout, stderr), ('', ''))
+		self.assertEqual(self.modules(self.templates), [
+			'a.html', 'a.js',
+			os.path.join('sub', 'b.html'), os.path.join('sub', 'b.js'), os.path.join('sub', 'notes.txt'),
+		])
+		with io.open(self.path('templates', 'a.js'), encoding = 'utf-8') as f:
+			self.assertIn('function $Template($_a)', f.read())
+
+	def test_cache(self):
+		cache = self.path('cache')
+		out = self.path('out')
+		self.assertEqual(self.main('-j', '1', '-o', out, '--cache-dir', cache, self.templates)[0], 0)
+		status, stdout, stderr = self.main('-j', '1', '-o', out, '--cache-dir', cache, self.templates)
+		self.assertEqual(status, 0)
+		self.assertIn('2 compiled (2 from the cache), 0 failed', stderr)
+
+	def test_duplicate_targets(self):
+		other = self.write('other/a.html', '<b>{{ b }}</b>')
+		out = self.path('out')
+		# the same template twice is compiled once
+		status, stdout, stderr = self.main('-j', '1', '-o', out, self.templates, self.path('templates', 'a.html'))
+		self.assertEqual(status, 0)
+		self.assertIn('2 compiled', stderr)
+
+		status, stdout, stderr = self.main('-j', '1', '-o', out, self.templates, other)
+		self.assertEqual(status, 1)
+		self.assertIn('{}: would overwrite the module of {}'.format(other, self.path('templates', 'a.html')), stderr)
+		with io.open(os.path.join(out, 'a.js'), encoding = 'utf-8') as f:
+			self.assertIn('$_a', f.read())
+
+	def test_bad_jobs(self):
+		self.assertEqual(self.main('-j', '0', self.templates)[0], 2)
+
+	def test_find_templates(self):
+		a = self.path('templates', 'a.html')
+		b = self.path('templates', 'sub', 'b.html')
+		missing = self.path('missing.html')
+		found, not_found = cli.find_templates([
+			self.templates,
+			a,
+			self.path('templates', 'sub', '*.html'),
+			missing,
+			self.path('nothing', '*.html'),
+		])
+		self.assertEqual(found, [
+			(a, 'a.html'),
+			(b, os.path.join('sub', 'b.html')),
+			(a, 'a.html'),
+			(b, 'b.html'),
+		])
+		self.assertEqual(not_found, [missing, self.path('nothing', '*.html')])
+		found, not_found = cli.find_templates([self.templates], ext = '.txt')
+		self.assertEqual(found, [(self.path('templates', 'sub', 'notes.txt'), os.path.join('sub', 'notes.txt'))])
+
+	def test_template_name(self):
+		a = self.path('templates', 'a.html')
+		b = self.path('templates', 'sub', 'b.html')
+		self.assertEqual(cli.template_name(b, [self.templates]), os.path.join('sub', 'b.html'))
+		self.assertEqual(cli.template_name(b, [self.path('templates', '*', '*.html')]), 'b.html')
+		self.assertEqual(cli.template_name(a, [a]), 'a.html')
+		self.assertIsNone(cli.template_name(self.path('templates', 'sub', 'notes.txt'), [self.templates]))
+		self.assertIsNone(cli.template_name(self.path('other', 'a.html'), [self.templates]))
+		self.assertIsNone(cli.template_name(a, [b]))
+
+	def test_watch_roots(self):
+		a = self.path('templates', 'a.html')
+		self.assertEqual(cli.watch_roots([self.templates, a, self.path('templates', '*.html')]), [
+			(self.templates, True),
+			(self.templates, False),
+		])
+		self.assertEqual(cli.watch_roots([self.path('templates', '*', 'b.html')]), [(self.templates, True)])
+		self.assertEqual(cli.watch_roots(['a.html', '*.html']), [(os.curdir, False)])
+
+	def test_output_path(self):
+		source = self.path('templates', 'sub', 'b.html')
+		self.assertEqual(cli.output_path(source, os.path.join('sub', 'b.html')), self.path('templates', 'sub', 'b.js'))
+		self.assertEqual(
+			cli.output_path(source, os.path.join('sub', 'b.html'), self.path('out')),
+			self.path('out', 'sub', 'b.js'))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,80 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import unittest
+
+from jsdompl.htmllexer import Lexer, HTMLTokenizer
+
+def lex(source, use_html5lib = False):
+	""" Returns the (type, value) of the tokens of `source`, with the
+	character data tokens merged, as html5lib splits them
+	"""
+	lexer = Lexer(use_html5lib = use_html5lib)
+	lexer.build()
+	lexer.input(source)
+	tokens = []
+	for tok in lexer:
+		if tok.type in ('HTML_STARTTAG', 'HTML_ENDTAG', 'HTML_VOID_TAG'):
+			value = tok.value['name']
+		elif tok.type in ('HTML_CHARS', 'HTML_WS', 'HTML_COMMENT'):
+			value = tok.value['data']
+			if tokens and tokens[-1][0] == 'HTML_CHARS':
+				tokens[-1] = ('HTML_CHARS', tokens[-1][1] + value)
+				continue
+			tok.type = 'HTML_CHARS'
+		else:
+			value = tok.value
+		tokens.append((tok.type, value))
+	return tokens
+
+class LexerTest(unittest.TestCase):
+	use_html5lib = False
+
+	def lex(self, source):
+		return lex(source, self.use_html5lib)
+
+	def test_doctype(self):
+		self.assertEqual(self.lex('<!DOCTYPE html><p></p>'), [
+			('HTML_STARTTAG', 'p'),
+			('HTML_TAG_END', False),
+			('HTML_ENDTAG', 'p'),
+		])
+
+	def test_script_is_rawtext(self):
+		self.assertEqual(self.lex('<script>if (a<b && c) f("</p>");</script><i></i>'), [
+			('HTML_STARTTAG', 'script'),
+			('HTML_TAG_END', False),
+			('HTML_CHARS', 'if (a<b && c) f("</p>");'),
+			('HTML_ENDTAG', 'script'),
+			('HTML_STARTTAG', 'i'),
+			('HTML_TAG_END', False),
+			('HTML_ENDTAG', 'i'),
+		])
+
+	def test_style_is_rawtext(self):
+		self.assertEqual(self.lex('<style>a<b { content: "&amp;" }</STYLE>'), [
+			('HTML_STARTTAG', 'style'),
+			('HTML_TAG_END', False),
+			('HTML_CHARS', 'a<b { content: "&amp;" }'),
+			('HTML_ENDTAG', 'style'),
+		])
+
+	def test_islands_in_rawtext(self):
+		self.assertEqual(self.lex('<script>a<{{ b }}</script>'), [
+			('HTML_STARTTAG', 'script'),
+			('HTML_TAG_END', False),
+			('HTML_CHARS', 'a<'),
+			('ESCAPED_OPEN', '{{'),
+			('ID', 'b'),
+			('ESCAPED_TERMINATOR', '}}'),
+			('HTML_ENDTAG', 'script'),
+		])
+
+@unittest.skipIf(HTMLTokenizer is None, "html5lib is not installed")
+class HTML5LibLexerTest(LexerTest):
+	use_html5lib = True
+
+if __name__ == '__main__':
+	unittest.main()
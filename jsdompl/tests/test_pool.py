@@ -0,0 +1,79 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import threading
+import time
+import unittest
+
+from jsdompl.pool import ParserPool, PoolTimeout
+
+class SlowFactory(object):
+	""" Builds parsers in `delay` seconds, the first `failures` calls raise
+	RuntimeError instead
+	"""
+	def __init__(self, delay = 0, failures = 0):
+		self.delay = delay
+		self.failures = failures
+		self.started = threading.Event()
+
+	def __call__(self):
+		self.started.set()
+		time.sleep(self.delay)
+		if self.failures:
+			self.failures -= 1
+			raise RuntimeError("factory failed")
+		return object()
+
+class ParserPoolTest(unittest.TestCase):
+
+	def test_reuses_released_parsers(self):
+		pool = ParserPool(size = 2, factory = object)
+		with pool.parser() as first:
+			pass
+		with pool.parser() as second:
+			self.assertIs(first, second)
+		self.assertEqual(pool.stats.created, 1)
+		self.assertEqual(pool.stats.checkouts, 2)
+
+	def test_timeout(self):
+		pool = ParserPool(size = 1, factory = object)
+		pool.acquire()
+		self.assertRaises(PoolTimeout, pool.acquire, 0.05)
+
+	def test_wait_excludes_creation(self):
+		pool = ParserPool(size = 1, factory = SlowFactory(delay = 0.2))
+		pool.release(pool.acquire())
+		self.assertEqual(pool.stats.waits, 0)
+		self.assertEqual(pool.stats.total_wait, 0.0)
+
+	def test_factory_failure_wakes_waiter(self):
+		factory = SlowFactory(delay = 0.2, failures = 1)
+		pool = ParserPool(size = 1, factory = factory)
+
+		failed = []
+		def build():
+			try:
+				pool.acquire()
+			except RuntimeError:
+				failed.append(True)
+		builder = threading.Thread(target = build)
+		builder.start()
+		# the builder holds the only slot while the factory runs
+		factory.started.wait()
+
+		start = time.time()
+		parser = pool.acquire(timeout = 5)
+		elapsed = time.time() - start
+		builder.join()
+
+		self.assertEqual(failed, [True])
+		self.assertIsNotNone(parser)
+		self.assertLess(elapsed, 1)
+		self.assertEqual(pool.stats.created, 1)
+		self.assertEqual(pool.stats.checkouts, 1)
+		self.assertEqual(pool.stats.waits, 1)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import unittest
+
+from jsdompl.parser import Parser
+from jsdompl.visitors.jsdomplvisitor import JSDomplVisitor
+
+from .jsrun import render, requires_node
+
+# every way a tag can be built
+OPTIONS = [
+	{'strategy' : 'dom'},
+	{'strategy' : 'template'},
+	{'strategy' : 'auto'},
+	{'strategy' : 'auto', 'update' : True},
+	{'strategy' : 'auto', 'minify' : True},
+]
+
+@requires_node
+class SiblingOrderTest(unittest.TestCase):
+
+	def assertRenders(self, source, state, expected):
+		for options in OPTIONS:
+			self.assertEqual(render(source, [state], **options), [expected], options)
+
+	def test_static_before_dynamic(self):
+		self.assertRenders('<div><i></i></div><a href="{{ x }}"></a>', {'x' : 1},
+			'<div><i></i></div><a href="1"></a>')
+
+	def test_dynamic_before_static(self):
+		self.assertRenders('<a href="{{ x }}"></a><div><i></i></div>', {'x' : 1},
+			'<a href="1"></a><div><i></i></div>')
+
+	def test_mixed(self):
+		self.assertRenders(
+			'<ul><li><b>a</b></li><li>{{ x }}</li><li><b>c</b></li></ul>'
+			'<p>hi {{ x }} <b title="{{ x }}">b</b> <i>there</i></p>',
+			{'x' : 1},
+			'<ul><li><b>a</b></li><li>1</li><li><b>c</b></li></ul>'
+			'<p>hi 1 <b title="1">b</b> <i>there</i></p>')
+
+	def test_around_blocks(self):
+		source = '<p>{{ x }} <i>i</i> {% if (x) { %}<b>b</b>{% } %} <u>{{ x }}</u></p>'
+		self.assertRenders(source, {'x' : 1}, '<p>1 <i>i</i> <b>b</b> <u>1</u></p>')
+		self.assertRenders(source, {'x' : 0}, '<p>0 <i>i</i>  <u>0</u></p>')
+
+	def test_around_loops(self):
+		source = 'a <i>i</i> {% _.each(l, function(i, v) { %}<b>{{ v }}</b>{% }); %} <u>u</u>'
+		self.assertRenders(source, {'l' : [1, 2]}, 'a <i>i</i> <b>1</b><b>2</b> <u>u</u>')
+		self.assertRenders(source, {'l' : []}, 'a <i>i</i>  <u>u</u>')
+
+	def test_switch(self):
+		source = (
+			'<div>{% switch (k) { case 1: %}<p>one</p>{% break; case 2: %}<i>{{ k }}</i>'
+			'{% case 3: %}<b>{{ k }}</b>{% break; default: %}<p>d</p>{% } %}<u>u</u></div>'
+		)
+		self.assertRenders(source, {'k' : 1}, '<div><p>one</p><u>u</u></div>')
+		self.assertRenders(source, {'k' : 2}, '<div><i>2</i><b>2</b><u>u</u></div>')
+		self.assertRenders(source, {'k' : 3}, '<div><b>3</b><u>u</u></div>')
+		self.assertRenders(source, {'k' : 4}, '<div><p>d</p><u>u</u></div>')
+
+	def test_key_is_not_rendered(self):
+		self.assertRenders(
+			'<ul>{% _.each(l, function(i, v) { %}<li key="{{ v }}" class="c">{{ v }}</li>{% }); %}</ul><p key="p"></p>',
+			{'l' : [1, 2]},
+			'<ul><li class="c">1</li><li class="c">2</li></ul><p></p>')
+
+class RenderTest(unittest.TestCase):
+
+	def test_statics_come_first(self):
+		p = Parser()
+		code = JSDomplVisitor(js_parser = p).render(p.parse('<div><i></i></div><a href="{{ x }}"></a>'))
+		self.assertLess(code.index('var $$static0 ='), code.index('$$static0.cloneNode'))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,155 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import errno
+import io
+import json
+import os
+import shutil
+import socket
+import struct
+import tempfile
+import threading
+import unittest
+
+from jsdompl.cache import MemoryCache
+from jsdompl.server import MAX_MESSAGE_SIZE, Client, CompileServer, read_message, write_message
+
+class CompileServerTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.directory)
+		self.path = os.path.join(self.directory, 'jsdompl.sock')
+		self.server = self.start(self.path)
+
+	def start(self, path):
+		server = CompileServer(path, MemoryCache(8))
+		thread = threading.Thread(target = server.serve_forever, kwargs = {'poll_interval' : 0.01})
+		thread.daemon = True
+		thread.start()
+
+		def stop():
+			server.shutdown()
+			thread.join()
+			server.server_close()
+		self.addCleanup(stop)
+		return server
+
+	def client(self):
+		client = Client(self.path)
+		self.addCleanup(client.close)
+		return client
+
+	def send_raw(self, data):
+		""" Sends the bytes `data` on a new connection and closes its writing
+		side, returns the messages the server answers until it closes it
+		"""
+		sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		self.addCleanup(sock.close)
+		sock.connect(self.path)
+		sock.sendall(data)
+		sock.shutdown(socket.SHUT_WR)
+		stream = sock.makefile('rb')
+		self.addCleanup(stream.close)
+		messages = []
+		while True:
+			message = read_message(stream)
+			if message is None:
+				return messages
+			messages.append(message)
+
+	def assertProtocolError(self, data, error):
+		messages = self.send_raw(data)
+		self.assertEqual(len(messages), 1)
+		self.assertFalse(messages[0]['ok'])
+		self.assertTrue(messages[0]['error'].startswith('ProtocolError: ' + error), messages[0]['error'])
+
+	def test_compile(self):
+		client = self.client()
+		code = client.compile('<p>{{ a }}</p>', update = True)
+		self.assertIn('function $Template($_a)', code)
+		self.assertEqual(client.compile('<p>{{ a }}</p>', update = True), code)
+		response = client.request({'op' : 'stats', 'id' : 7})
+		self.assertEqual(response['id'], 7)
+		self.assertTrue(response['ok'])
+		self.assertEqual((response['cache']['hits'], response['cache']['misses']), (1, 1))
+
+	def test_failed_requests(self):
+		client = self.client()
+		with self.assertRaises(RuntimeError) as cm:
+			client.compile('<p>{{ a + }}</p>')
+		self.assertIn('SyntaxError', str(cm.exception))
+		with self.assertRaises(RuntimeError) as cm:
+			client.compile('<p>{{ a }}</p>', bogus = True, minify = True)
+		self.assertIn('Unknown options: bogus', str(cm.exception))
+
+		response = client.request({'op' : 'launch', 'id' : 'x'})
+		self.assertEqual((response['ok'], response['id']), (False, 'x'))
+		self.assertIn('Unknown op: launch', response['error'])
+		response = client.request(['compile'])
+		self.assertFalse(response['ok'])
+		response = client.request({'op' : 'compile', 'source' : 1})
+		self.assertIn("'source' must be a string", response['error'])
+
+		# the connection is still usable
+		self.assertTrue(client.request({'op' : 'ping'})['ok'])
+		self.assertIn('$Template', client.compile('<p>{{ a }}</p>'))
+
+	def test_truncated_header(self):
+		self.assertProtocolError(b'\0\0', 'Truncated message header')
+
+	def test_truncated_message(self):
+		self.assertProtocolError(struct.pack(str('>I'), 10) + b'{}', 'Truncated message')
+
+	def test_oversize_message(self):
+		self.assertProtocolError(struct.pack(str('>I'), MAX_MESSAGE_SIZE + 1), 'Message of')
+
+	def test_invalid_json(self):
+		self.assertProtocolError(struct.pack(str('>I'), 5) + b'{"op"', 'Invalid JSON')
+
+	def test_bad_frame_closes(self):
+		# a good request before the bad frame is answered, then the
+		# connection is closed, see send_raw()
+		good = json.dumps({'op' : 'ping', 'id' : 1}).encode('utf-8')
+		ping = struct.pack(str('>I'), len(good)) + good
+		messages = self.send_raw(ping + struct.pack(str('>I'), 3) + b'+++')
+		self.assertEqual(len(messages), 2)
+		self.assertEqual(messages[0], {'ok' : True, 'id' : 1})
+		self.assertTrue(messages[1]['error'].startswith('ProtocolError: Invalid JSON'))
+
+	def test_stale_socket(self):
+		path = os.path.join(self.directory, 'stale.sock')
+		sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		sock.bind(path)
+		sock.close()
+		self.assertTrue(os.path.exists(path))
+		# nothing listens on it, it is replaced
+		self.start(path)
+		client = Client(path)
+		self.addCleanup(client.close)
+		self.assertTrue(client.request({'op' : 'ping'})['ok'])
+
+	def test_socket_in_use(self):
+		with self.assertRaises(IOError) as cm:
+			CompileServer(self.path)
+		self.assertEqual(cm.exception.errno, errno.EADDRINUSE)
+
+		path = os.path.join(self.directory, 'file')
+		open(path, 'w').close()
+		with self.assertRaises(IOError) as cm:
+			CompileServer(path)
+		self.assertEqual(cm.exception.errno, errno.EEXIST)
+		self.assertTrue(os.path.isfile(path))
+
+	def test_messages(self):
+		stream = io.BytesIO()
+		write_message(stream, {'op' : 'ping', 'text' : '\u00e9'})
+		stream.seek(0)
+		self.assertEqual(read_message(stream), {'op' : 'ping', 'text' : '\u00e9'})
+		self.assertIsNone(read_message(stream))
+
+if __name__ == '__main__':
+	unittest.main()
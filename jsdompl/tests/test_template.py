@@ -0,0 +1,64 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import io
+import unittest
+
+from jsdompl.parser import Parser
+from jsdompl.template import JSDomTemplate, compile_to
+
+class JSDomTemplateTest(unittest.TestCase):
+
+	def test_get_template(self):
+		code = JSDomTemplate('<!-- Template("name") --><p>{{ name }}</p>').get_template()
+		self.assertTrue(code.startswith('define(['))
+		self.assertIn('function $Template($_name)', code)
+	
+	def test_argument_order(self):
+		# as the names first appear in the source, attributes before content
+		code = JSDomTemplate('<a href="{{ url }}">{{ name }}</a>').get_template()
+		self.assertIn('function $Template($_url, $_name)', code)
+		code = JSDomTemplate('<div title="{{ a }}"><p class="{{ b }}">{{ c }}</p>{{ d }}</div><i>{{ e }}</i>').get_template()
+		self.assertIn('function $Template($_a, $_b, $_c, $_d, $_e)', code)
+	
+	def test_runtime_helpers(self):
+		def module(source, **options):
+			out = io.StringIO()
+			compile_to(out, source, **options)
+			return out.getvalue()
+		
+		code = module('<p>{{ a }}</p>')
+		self.assertNotIn('function H(', code)
+		self.assertNotIn('function K(', code)
+		self.assertNotIn('function R(', code)
+		
+		code = module('<ul>{% _.each(l, function(i, v) { %}<li>{{ v }}</li>{% }); %}</ul>', update = True)
+		self.assertIn('function K() {', code)
+		self.assertNotIn('function R(', code)
+		self.assertIn('function R(', module('{% if (a) { %}<p>{{ a }}</p>{% } %}', update = True))
+		
+		static = '<div><p>a</p><p>b</p><p>c</p><p>d</p></div>{{ a }}'
+		self.assertIn('function H(html) {', module(static, strategy = 'template'))
+		self.assertNotIn('function H(', module(static, strategy = 'dom'))
+		# minified, on one line
+		self.assertIn("\nfunction H(html){var t=document.createElement('template');", module(static, strategy = 'template', minify = True))
+	
+	def test_deep_nesting(self):
+		# well past the recursion limit, in every mode
+		depth = 1200
+		sources = [
+			'<div>' * depth + '{{ a }}' + '</div>' * depth,
+			'<div>' * depth + 'a' + '</div>' * depth,
+			'{% if (a) { %}<div>' * depth + '{{ a }}' + '</div>{% } %}' * depth,
+		]
+		p = Parser()
+		for source in sources:
+			for options in ({}, {'update' : True}, {'minify' : True}, {'strategy' : 'dom'}, {'strategy' : 'template'}):
+				out = io.StringIO()
+				compile_to(out, source, js_parser = p, **options)
+				self.assertTrue(out.getvalue().startswith('define(['))
+
+if __name__ == '__main__':
+	unittest.main()
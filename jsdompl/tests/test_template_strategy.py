@@ -0,0 +1,125 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import json
+import unittest
+
+try:
+	import html5lib
+	from html5lib import treebuilders
+except ImportError:
+	html5lib = None
+
+from jsdompl import ast
+from jsdompl.parser import Parser
+from jsdompl.visitors.jsdomplvisitor import JSDomplVisitor
+
+def js_string(data):
+	return json.loads('"{}"'.format(data))
+
+def ast_tree(node):
+	""" Returns the (name, attributes, children) tree an HTMLTag is built
+	as, with None standing in for the dynamic texts, which a <template> has
+	a comment for
+	"""
+	attrs = sorted(
+		(attr.name, js_string(''.join(part.data for part in attr.parts)))
+		for attr in node.attrs if attr.is_static()
+	)
+	children = []
+	for child in node.inner or []:
+		if isinstance(child, ast.HTMLTag):
+			children.append(ast_tree(child))
+		elif child.is_static():
+			text = ''.join(data.data for data in child.data_list if isinstance(data, ast.HTMLData))
+			if text:
+				children.append(js_string(text))
+		else:
+			children.append(None)
+	return node.name.lower(), attrs, children
+
+def dom_tree(node):
+	""" The same tree for an html5lib (minidom) node
+	"""
+	if node.nodeType == node.TEXT_NODE:
+		return node.data
+	if node.nodeType == node.COMMENT_NODE:
+		return None
+	attrs = sorted((name, value) for name, value in node.attributes.items())
+	return node.tagName, attrs, [dom_tree(child) for child in node.childNodes]
+
+@unittest.skipIf(html5lib is None, "html5lib is not installed")
+class TemplateParityTest(unittest.TestCase):
+	""" The subtrees built from HTML must come out of the HTML parser as they
+	would be built node by node
+	"""
+
+	def setUp(self):
+		self.js_parser = Parser()
+		self.html_parser = html5lib.HTMLParser(tree = treebuilders.getTreeBuilder('dom'))
+
+	def templates(self, source, strategy = 'template'):
+		""" Returns the (html, tree) of the subtrees `source` builds from HTML
+		"""
+		visitor = JSDomplVisitor(js_parser = self.js_parser, strategy = strategy)
+		tree = self.js_parser.parse(source)
+		visitor.read_directives(tree)
+		visitor.visit(tree)
+		return [(js_string(html), ast_tree(node)) for _, node, html in visitor.statics if html is not None]
+
+	def assertParity(self, source, strategy = 'template'):
+		templates = self.templates(source, strategy)
+		for html, expected in templates:
+			fragment = self.html_parser.parseFragment(html, container = 'div')
+			self.assertEqual([dom_tree(child) for child in fragment.childNodes], [expected], html)
+		return templates
+
+	def test_safe_subtrees_use_templates(self):
+		for source in [
+			'<div class="a"><p>x <b>{{ y }}</b></p><ul><li>1</li><li><a href="#">2</a></li></ul></div>',
+			'<form><label>a <input name="{{ n }}"></label><button>go</button></form>',
+			'<my-widget><span>{{ a }}</span></my-widget>',
+		]:
+			self.assertTrue(self.assertParity(source), source)
+
+	def test_p_with_block_content(self):
+		for child in ['div', 'ul', 'h1', 'p', 'section', 'form', 'dl']:
+			source = '<section><p>a <{0}>x</{0}></p></section>'.format(child)
+			self.assertParity(source)
+			self.assertParity(source, 'auto')
+
+	def test_nested_interactive(self):
+		for source in [
+			'<div><a href="#"><span><a href="#">x</a></span></a></div>',
+			'<div><form><div><form><input></form></div></form></div>',
+			'<div><button><span><button>x</button></span></button></div>',
+			'<ul><li><div><li>x</li></div></li></ul>',
+			'<dl><dt><span><dd>x</dd></span></dt></dl>',
+			'<div><h1><span><h2>x</h2></span></h1></div>',
+		]:
+			self.assertParity(source)
+
+	def test_text_content(self):
+		for tag in ['title', 'iframe', 'noscript', 'textarea', 'xmp', 'noembed']:
+			source = '<div><{0}>a <b>b</b></{0}></div>'.format(tag)
+			self.assertEqual(self.assertParity(source), [], source)
+
+	def test_reshaped_elements(self):
+		for source in [
+			'<div><table><tr><td>x</td></tr></table></div>',
+			'<div><select><option>a</option><option>b</option></select></div>',
+			'<div><pre>\nx</pre></div>',
+			'<div><svg><g></g></svg></div>',
+			'<div><image src="a.png"></image></div>',
+		]:
+			self.assertEqual(self.assertParity(source), [], source)
+
+	def test_conflict_only_taints_ancestors(self):
+		# the inner <a> is fine on its own
+		templates = self.assertParity('<div title="{{ t }}"><a href="#"><a href="{{ h }}"><b>x</b> <i>y</i></a></a></div>')
+		self.assertEqual([tree[0] for _, tree in templates], ['a'])
+
+if __name__ == '__main__':
+	unittest.main()
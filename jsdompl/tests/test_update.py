@@ -0,0 +1,149 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import unittest
+
+from .jsrun import compile_module, render, render_updates, requires_node
+
+@requires_node
+class UpdateTest(unittest.TestCase):
+	""" update() must leave the DOM a fresh render of the same arguments
+	would build
+	"""
+
+	def assertUpdates(self, source, states, **options):
+		self.assertEqual(render_updates(source, states, **options), render(source, states, **options))
+
+	def test_locals(self):
+		self.assertUpdates('{% var x = a * 2; %}<p>{{ x }}</p><p>{{ x + b }}</p>', [
+			{'a' : 1, 'b' : 7},
+			{'a' : 5, 'b' : 7},
+			{'a' : 5, 'b' : 1},
+		])
+
+	def test_chained_locals(self):
+		self.assertUpdates(
+			'{% var x = a + 1, y = x * 2; function f(v) { return v + y; } %}'
+			'<p title="{{ f(1) }}">{{ y }}</p>', [
+				{'a' : 1},
+				{'a' : 2},
+			])
+
+	def test_assigned_locals(self):
+		self.assertUpdates('{% var x = 0; x += a; %}<p>{{ x }}</p>', [
+			{'a' : 1},
+			{'a' : 2},
+		])
+
+	def test_conditional(self):
+		self.assertUpdates('<div>{% if (show) { %}<p>{{ text }}</p>{% } %}<i>{{ text }}</i></div>', [
+			{'show' : True, 'text' : 'a'},
+			{'show' : False, 'text' : 'b'},
+			{'show' : True, 'text' : 'c'},
+			{'show' : True, 'text' : 'd'},
+		])
+
+	def test_conditional_declares(self):
+		self.assertUpdates('{% if (a) { var t = "yes"; %}<b>b</b>{% } else { var t = "no"; } %}<p>{{ t }}</p>', [
+			{'a' : 1},
+			{'a' : 0},
+			{'a' : 1},
+		])
+
+	def test_switch(self):
+		self.assertUpdates(
+			'<div>{% switch (k) { case 1: %}<p>one</p>{% break; default: %}<p>{{ k }}</p>{% } %}</div>', [
+				{'k' : 1},
+				{'k' : 2},
+				{'k' : 3},
+				{'k' : 1},
+			])
+
+	def test_loop_in_region(self):
+		self.assertUpdates('{% if (l.length) { %}<ul>{% _.each(l, function(i, v) { %}<li>{{ v }}</li>{% }); %}</ul>{% } %}', [
+			{'l' : [1, 2]},
+			{'l' : []},
+			{'l' : [3]},
+		])
+
+	def test_minified(self):
+		self.assertUpdates('{% var x = a * 2; if (x > 2) { %}<p>{{ x }}</p>{% } %}', [
+			{'a' : 1},
+			{'a' : 2},
+			{'a' : 1},
+		], minify = True)
+
+	def test_row_locals(self):
+		self.assertUpdates(
+			'<ul>{% _.each(items, function(i, item) { var label = item.name + "!"; %}'
+			'<li key="{{ item.id }}">{{ label }}</li>{% }); %}</ul>', [
+				{'items' : [{'id' : 1, 'name' : 'a'}, {'id' : 2, 'name' : 'b'}]},
+				{'items' : [{'id' : 2, 'name' : 'c'}, {'id' : 1, 'name' : 'a'}]},
+			])
+
+	def test_duplicate_keys(self):
+		self.assertUpdates(
+			'<ul>{% _.each(items, function(i, item) { %}'
+			'<li key="{{ item.id }}">{{ item.name }}</li>{% }); %}</ul>', [
+				{'items' : [{'id' : 1, 'name' : 'a'}, {'id' : 1, 'name' : 'c'}]},
+				{'items' : [{'id' : 2, 'name' : 'b'}]},
+				{'items' : []},
+				{'items' : [{'id' : 1, 'name' : 'a'}, {'id' : 1, 'name' : 'c'}, {'id' : 1, 'name' : 'd'}]},
+				{'items' : [{'id' : 1, 'name' : 'c'}, {'id' : 1, 'name' : 'a'}]},
+			])
+
+	def test_row_arguments(self):
+		self.assertUpdates(
+			'<ul>{% _.each(l, function(i, v) { %}<li key="{{ v.id }}">{{ v.name }} {{ title }}</li>{% }); %}</ul>', [
+				{'l' : [{'id' : 1, 'name' : 'a'}, {'id' : 2, 'name' : 'b'}], 'title' : 'x'},
+				{'l' : [{'id' : 2, 'name' : 'b'}], 'title' : 'y'},
+			])
+		self.assertUpdates(
+			'<ul>{% for (var i = 0; i < l.length; i++) { var v = l[i]; %}<li>{{ i }} {{ v }}</li>{% } %}</ul>', [
+				{'l' : ['a', 'b']},
+				{'l' : ['c', 'b', 'd']},
+			])
+
+	def test_row_region(self):
+		self.assertUpdates(
+			'<ul>{% _.each(l, function(i, v) { %}{% if (v > 1) { %}<li>{{ v }}</li>{% } %}{% }); %}</ul>', [
+				{'l' : [1, 2, 3]},
+				{'l' : [3, 1]},
+				{'l' : [2, 3, 1]},
+				{'l' : []},
+			])
+
+	def test_row_list(self):
+		self.assertUpdates(
+			'<ul>{% _.each(l, function(i, v) { %}<li key="{{ v.n }}">{{ v.n }}</li>'
+			'{% _.each(v.c, function(j, c) { %}<b>{{ c }}</b>{% }); %}{% }); %}</ul>', [
+				{'l' : [{'n' : 1, 'c' : [1, 2]}, {'n' : 2, 'c' : [3]}]},
+				{'l' : [{'n' : 2, 'c' : [4, 5]}, {'n' : 1, 'c' : []}]},
+				{'l' : [{'n' : 1, 'c' : [6]}]},
+				{'l' : []},
+			])
+
+	def test_key_of_body_local(self):
+		self.assertUpdates(
+			'<ul>{% for (var i = 0; i < l.length; i++) { var v = l[i]; %}'
+			'<li key="{{ v }}">{{ v }}</li>{% } %}</ul>', [
+				{'l' : [1, 2, 3]},
+				{'l' : [3, 1]},
+				{'l' : [2, 3, 1, 4]},
+			])
+		self.assertUpdates(
+			'<ul>{% _.each(l, function(i, x) { var v = x.id, w = v + 1; %}'
+			'<li key="{{ w }}">{{ x.name }}</li>{% }); %}</ul>', [
+				{'l' : [{'id' : 1, 'name' : 'a'}, {'id' : 2, 'name' : 'b'}]},
+				{'l' : [{'id' : 2, 'name' : 'c'}]},
+			])
+
+class RowKeyTest(unittest.TestCase):
+
+	def test_key_declared_after_dom(self):
+		with self.assertRaises(SyntaxError):
+			compile_module(
+				'<ul>{% _.each(l, function(i, x) { %}<li key="{{ v }}">a</li>{% var v = x; }); %}</ul>',
+				update = True)
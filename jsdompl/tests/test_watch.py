@@ -0,0 +1,114 @@
+from __future__ import unicode_literals, division, absolute_import, print_function
+
+__author__ = "Richard Eames <reames@asymmetricventures.com>"
+__date__ = "Oct 18, 2026"
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from jsdompl.watch import InotifyWatcher, PollingWatcher
+
+# how long a change takes to show up at most, and how long nothing is
+# waited for
+TIMEOUT = 5
+QUIET = 0.2
+
+class WatcherTests(object):
+	""" The tests every watcher passes, mixed into a TestCase with a
+	make_watcher(roots) method
+	"""
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.directory)
+		self.root = self.path('root')
+		self.outside = self.path('outside')
+		os.makedirs(os.path.join(self.root, 'sub'))
+		os.makedirs(self.outside)
+		self.write('root/old.html', 'old')
+		self.watcher = self.make_watcher([(self.root, True)])
+
+	def tearDown(self):
+		self.watcher.close()
+
+	def path(self, *parts):
+		return os.path.join(self.directory, *parts)
+
+	def write(self, name, text):
+		path = self.path(*name.split('/'))
+		with io.open(path, 'w', encoding = 'utf-8') as f:
+			f.write(text)
+		return path
+
+	def is_template(self, path):
+		return path.endswith('.html')
+
+	def assertChanges(self, paths):
+		self.assertEqual(self.watcher.wait(TIMEOUT), set(paths))
+		self.assertEqual(self.watcher.wait(QUIET), set())
+
+	def test_create(self):
+		self.assertChanges([
+			self.write('root/a.html', 'a'),
+			self.write('root/sub/b.html', 'b'),
+		])
+
+	def test_modify(self):
+		self.assertChanges([self.write('root/old.html', 'changed')])
+
+	def test_delete(self):
+		os.remove(self.path('root', 'old.html'))
+		self.assertChanges([self.path('root', 'old.html')])
+
+	def test_ignored(self):
+		self.write('root/a.txt', 'a')
+		self.write('outside/a.html', 'a')
+		self.assertEqual(self.watcher.wait(QUIET), set())
+
+	def test_directory_moved_in(self):
+		os.makedirs(self.path('outside', 'moved', 'deeper'))
+		self.write('outside/moved/a.html', 'a')
+		self.write('outside/moved/deeper/b.html', 'b')
+		os.rename(self.path('outside', 'moved'), self.path('root', 'sub', 'moved'))
+		self.assertChanges([
+			self.path('root', 'sub', 'moved', 'a.html'),
+			self.path('root', 'sub', 'moved', 'deeper', 'b.html'),
+		])
+		# and is watched from then on
+		self.assertChanges([self.write('root/sub/moved/deeper/b.html', 'changed')])
+
+	def test_directory_moved_out(self):
+		os.makedirs(self.path('root', 'sub', 'deeper'))
+		self.write('root/sub/a.html', 'a')
+		self.write('root/sub/deeper/b.html', 'b')
+		self.assertChanges([self.path('root', 'sub', 'a.html'), self.path('root', 'sub', 'deeper', 'b.html')])
+		os.rename(self.path('root', 'sub'), self.path('outside', 'sub'))
+		self.assertChanges([self.path('root', 'sub', 'a.html'), self.path('root', 'sub', 'deeper', 'b.html')])
+		# and isn't watched anymore
+		self.write('outside/sub/deeper/b.html', 'changed')
+		self.assertEqual(self.watcher.wait(QUIET), set())
+
+	def test_not_recursive(self):
+		self.watcher.close()
+		self.watcher = self.make_watcher([(self.root, False)])
+		self.write('root/sub/b.html', 'b')
+		self.assertChanges([self.write('root/a.html', 'a')])
+
+class PollingWatcherTest(WatcherTests, unittest.TestCase):
+
+	def make_watcher(self, roots):
+		return PollingWatcher(roots, self.is_template, debounce = 0.05, interval = 0.01)
+
+class InotifyWatcherTest(WatcherTests, unittest.TestCase):
+
+	def make_watcher(self, roots):
+		try:
+			return InotifyWatcher(roots, self.is_template, debounce = 0.05)
+		except OSError as e:
+			self.skipTest("inotify is not available: {}".format(e))
+
+if __name__ == '__main__':
+	unittest.main()